@@ -0,0 +1,75 @@
+"""
+Import time of the cipher modules against a budget.
+
+Every module is imported in a fresh interpreter with '-X importtime' and
+the cumulative time reported for it is compared with its budget; the exit
+status is 1 if any module is over budget. The bytecode cache of the
+package is removed first and the interpreters run with '-B', so the
+modules of the package are always compiled from source.
+
+Usage:
+    python -m benchmarks.import_time [--repeat R] [--scale S]
+"""
+import argparse
+import os
+import pathlib
+import shutil
+import subprocess
+import sys
+
+ROOT = pathlib.Path(__file__).parents[1]
+
+# Cumulative import time budget of every module in milliseconds, about
+# twice the best time measured without cached bytecode of the package
+# (const 2.6, gost_34_12_2015 36.7, gost_34_13_2015 54.1 ms)
+BUDGET_MS = {
+    "ciphers.block.const": 6.0,
+    "ciphers.block.gost_34_12_2015": 75.0,
+    "ciphers.block.gost_34_13_2015": 110.0,
+}
+
+
+def clear_bytecode() -> None:
+    """Remove the bytecode cache of the package."""
+    for path in (ROOT / "ciphers").rglob("__pycache__"):
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def import_time(module: str) -> float:
+    """Return the cumulative import time of a module in milliseconds."""
+    result = subprocess.run(
+        [sys.executable, "-B", "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=dict(os.environ, PYTHONPATH=str(ROOT)),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like 'import time:  self [us] | cumulative | imported package'
+    for line in result.stderr.splitlines():
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if name.strip() == module:
+            return int(cumulative_us) / 1000
+    raise LookupError(f"no import time reported for {module}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiplier of every budget"
+    )
+    args = parser.parse_args()
+
+    clear_bytecode()
+    over_budget = False
+    for module, budget in BUDGET_MS.items():
+        best = min(import_time(module) for _ in range(args.repeat))
+        status = "ok" if best <= budget * args.scale else "OVER"
+        over_budget |= status == "OVER"
+        print(f"{module:<32} {best:8.1f} ms  budget {budget * args.scale:6.1f} ms  {status}")
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Key setup latency of the block cipher.
+
+Usage:
+    python -m benchmarks.key_setup [--number N] [--repeat R]
+"""
+import argparse
+import timeit
+
+from loguru import logger
+
+from ciphers.block.const import _DEFAULT_IV_KUZNECHIK
+from ciphers.block.gost_34_12_2015 import GOST_34_12_2015_Kuznechik
+from ciphers.block.gost_34_13_2015 import GOST_34_13_2015_GammaOutputFeedback
+
+KEY = bytearray(range(32))
+
+
+def measure(stmt, number: int, repeat: int) -> float:
+    """Return the best time of a single call in microseconds."""
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logger.remove()
+
+    cases = {
+        "GOST_34_12_2015_Kuznechik(key)": lambda: GOST_34_12_2015_Kuznechik(KEY),
+        "GOST_34_13_2015_GammaOutputFeedback(key, iv)": lambda: (
+            GOST_34_13_2015_GammaOutputFeedback(KEY, _DEFAULT_IV_KUZNECHIK)
+        ),
+    }
+    for name, stmt in cases.items():
+        print(f"{name:<48} {measure(stmt, args.number, args.repeat):10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+"""
+Throughput, latency and peak memory of the cipher families.
+
+Every case is timed with 'timeit' (best of several repeats, the number of
+calls per repeat grows until a repeat takes at least '--min-time'), then
+called once more under 'tracemalloc' to record the peak of the memory
+allocated by the call. Results can be saved as a JSON baseline and
+compared with a previous one; the exit status is 1 if any case got slower
+than the baseline by more than '--threshold'.
+
+Usage:
+    python -m benchmarks.suite [--max-size SIZE] [--filter TEXT]
+        [--save FILE] [--compare FILE] [--threshold RATIO]
+
+Payloads larger than '--max-size' (1M by default) are skipped; run with
+'--max-size 100M' for the full range of the OFB mode.
+"""
+import argparse
+import atexit
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+
+from loguru import logger
+
+from ciphers.block.batch import OutputFeedbackPool
+from ciphers.block.const import _BLOCK_SIZE_KUZNECHIK
+from ciphers.block.const import _BLOCK_SIZE_MAGMA
+from ciphers.block.const import _DEFAULT_IV_KUZNECHIK
+from ciphers.block.gost_34_12_2015 import GOST_34_12_2015_Kuznechik
+from ciphers.block.gost_34_12_2015 import GOST_34_12_2015_Magma
+from ciphers.block.gost_34_13_2015 import GOST_34_13_2015_GammaOutputFeedback
+from ciphers.corpus import CipherConfig
+from ciphers.corpus import CorpusPool
+from ciphers.substitution.algorithm import TrisemusSubstitutionCipher
+from ciphers.transposition.algorithm import TranspositionCipher
+
+KEY = bytearray(range(32))
+BLOCK = bytearray(range(16))
+TEXT = "съешь же ещё этих мягких французских булок, да выпей чаю 1234. "
+
+PAYLOAD_SIZES = (16, 1 << 10, 64 << 10, 1 << 20, 16 << 20, 100 << 20)
+TEXT_SIZES = (1 << 10, 64 << 10, 1 << 20)
+# Number and size of the independent messages of the batch cases
+BATCH_MESSAGES = (2000, 64)
+# Number and size of the documents of the corpus cases
+CORPUS_DOCUMENTS = (1000, 1 << 10)
+
+_UNITS = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+# Duration of a single call in seconds above which the call is not repeated
+_SLOW_CALL = 1.0
+
+
+class Case(NamedTuple):
+    name: str
+    # Bytes (or characters) processed by one call, 0 for calls without payload
+    size: int
+    # Prepare the inputs and return the call to be measured
+    setup: Callable[[], Callable[[], object]]
+
+
+def parse_size(value: str) -> int:
+    """Parse a size such as '4096', '64K' or '100M'."""
+    unit = _UNITS.get(value[-1:].upper())
+    if unit is None:
+        return int(value)
+    return int(value[:-1]) * unit
+
+
+def format_size(size: int) -> str:
+    for suffix, unit in sorted(_UNITS.items(), key=lambda item: -item[1]):
+        if size >= unit and size % unit == 0:
+            return f"{size // unit}{suffix}"
+    return str(size)
+
+
+def _block_call(cipher_class: type, method: str) -> Callable[[], object]:
+    cipher_obj = cipher_class(KEY)
+    block = BLOCK[: cipher_obj.block_size]
+    func = getattr(cipher_obj, method)
+    return lambda: func(block)
+
+
+def _ofb_encrypt(size: int, cipher_class: type | None = None) -> Callable[[], object]:
+    data = bytes(size)
+    key = KEY if cipher_class is None else cipher_class(KEY)
+    cipher_obj = GOST_34_13_2015_GammaOutputFeedback(key, _DEFAULT_IV_KUZNECHIK)
+    return lambda: cipher_obj.encrypt(data)
+
+
+def _ofb_messages() -> list:
+    count, size = BATCH_MESSAGES
+    return [(0, i.to_bytes(16, "big"), bytes(size)) for i in range(count)]
+
+
+def _ofb_sequential() -> Callable[[], object]:
+    jobs = _ofb_messages()
+    return lambda: [
+        GOST_34_13_2015_GammaOutputFeedback(KEY, bytearray(init_vect)).encrypt(data)
+        for _, init_vect, data in jobs
+    ]
+
+
+def _ofb_many() -> Callable[[], object]:
+    jobs = [(init_vect, data) for _, init_vect, data in _ofb_messages()]
+    return lambda: GOST_34_13_2015_GammaOutputFeedback.encrypt_many(KEY, jobs)
+
+
+def _ofb_pool() -> Callable[[], object]:
+    jobs = _ofb_messages()
+    pool = OutputFeedbackPool({0: KEY})
+    atexit.register(pool.close)
+    return lambda: list(pool.encrypt(jobs))
+
+
+def _trisemus_encrypt(size: int) -> Callable[[], object]:
+    text = (TEXT * (size // len(TEXT) + 1))[:size]
+    cipher_obj = TrisemusSubstitutionCipher(keyword="республика")
+    return lambda: cipher_obj.encrypt(text)
+
+
+def _transposition_encrypt(size: int) -> Callable[[], object]:
+    text = (TEXT * (size // len(TEXT) + 1))[:size]
+    cipher_obj = TranspositionCipher()
+    return lambda: cipher_obj.encrypt(text)
+
+
+def _corpus_documents() -> List[str]:
+    count, size = CORPUS_DOCUMENTS
+    return [(TEXT * (size // len(TEXT) + 1))[i: i + size] for i in range(count)]
+
+
+def _trisemus_sequential() -> Callable[[], object]:
+    documents = _corpus_documents()
+    cipher_obj = TrisemusSubstitutionCipher(keyword="республика")
+    return lambda: [cipher_obj.encrypt(text) for text in documents]
+
+
+def _trisemus_pool() -> Callable[[], object]:
+    documents = [("trisemus", text) for text in _corpus_documents()]
+    pool = CorpusPool(
+        {"trisemus": CipherConfig(TrisemusSubstitutionCipher, {"keyword": "республика"})}
+    )
+    atexit.register(pool.close)
+    return lambda: list(pool.encrypt(documents))
+
+
+def iter_cases() -> Iterator[Case]:
+    """Yield all benchmark cases."""
+    for cipher_class, block_size in (
+        (GOST_34_12_2015_Kuznechik, _BLOCK_SIZE_KUZNECHIK),
+        (GOST_34_12_2015_Magma, _BLOCK_SIZE_MAGMA),
+    ):
+        name = cipher_class.algorithm
+        yield Case(
+            f"{name}/key_setup",
+            0,
+            lambda cipher_class=cipher_class: lambda: cipher_class(KEY),
+        )
+        for method in ("encrypt", "decrypt"):
+            yield Case(
+                f"{name}/{method}_block",
+                block_size,
+                lambda cipher_class=cipher_class, method=method: _block_call(
+                    cipher_class, method
+                ),
+            )
+    for size in PAYLOAD_SIZES:
+        yield Case(
+            f"ofb/encrypt/{format_size(size)}",
+            size,
+            lambda size=size: _ofb_encrypt(size),
+        )
+        yield Case(
+            f"ofb/magma/{format_size(size)}",
+            size,
+            lambda size=size: _ofb_encrypt(size, GOST_34_12_2015_Magma),
+        )
+    count, size = BATCH_MESSAGES
+    yield Case(f"ofb/sequential/{count}x{size}", count * size, _ofb_sequential)
+    yield Case(f"ofb/many/{count}x{size}", count * size, _ofb_many)
+    yield Case(f"ofb/pool/{count}x{size}", count * size, _ofb_pool)
+    for size in TEXT_SIZES:
+        yield Case(
+            f"trisemus/encrypt/{format_size(size)}",
+            size,
+            lambda size=size: _trisemus_encrypt(size),
+        )
+        yield Case(
+            f"transposition/encrypt/{format_size(size)}",
+            size,
+            lambda size=size: _transposition_encrypt(size),
+        )
+    count, size = CORPUS_DOCUMENTS
+    yield Case(f"trisemus/sequential/{count}x{size}", count * size, _trisemus_sequential)
+    yield Case(f"trisemus/pool/{count}x{size}", count * size, _trisemus_pool)
+
+
+def run_case(case: Case, min_time: float = 0.2, repeat: int = 3) -> Dict[str, float]:
+    """
+    Measure a benchmark case.
+
+    Calls slower than '_SLOW_CALL' are timed once instead of 'repeat' times.
+
+    Args:
+        case: The case to measure.
+        min_time: Minimal duration of one repeat in seconds.
+        repeat: Number of repeats; the best one is reported.
+
+    Returns:
+        The latency of one call in microseconds, the throughput in MB/s (0
+        for calls without payload) and the peak of the memory allocated by
+        one call in KiB.
+    """
+    func = case.setup()
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    if elapsed >= _SLOW_CALL:
+        # Calls this slow (large payloads) are timed only once
+        seconds = elapsed / number
+    else:
+        number = max(number, int(number * min_time / elapsed) + 1)
+        seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "latency_us": seconds * 1e6,
+        "throughput_mb_s": case.size / seconds / 1e6 if case.size else 0.0,
+        "peak_kib": peak / 1024,
+    }
+
+
+def compare(
+    baseline: Dict[str, Dict[str, float]],
+    results: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[str]:
+    """
+    Return the names of the cases that got slower than the baseline.
+
+    Args:
+        baseline: Results of a previous run by case name.
+        results: Results of the current run by case name.
+        threshold: Allowed relative increase of the latency (0.1 is 10%).
+    """
+    return [
+        name
+        for name, result in results.items()
+        if name in baseline
+        and result["latency_us"] > baseline[name]["latency_us"] * (1 + threshold)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-size", type=parse_size, default=1 << 20)
+    parser.add_argument("--filter", default="", help="run only matching cases")
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", help="write the results to a JSON file")
+    parser.add_argument("--compare", help="compare with a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+    logger.remove()
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+
+    results = {}
+    print(f"{'case':<32} {'latency, us':>14} {'MB/s':>9} {'peak, KiB':>11}")
+    for case in iter_cases():
+        if case.size > args.max_size or args.filter not in case.name:
+            continue
+        result = results[case.name] = run_case(case, args.min_time, args.repeat)
+        line = (
+            f"{case.name:<32} {result['latency_us']:14.1f} "
+            f"{result['throughput_mb_s']:9.2f} {result['peak_kib']:11.1f}"
+        )
+        if case.name in baseline:
+            change = result["latency_us"] / baseline[case.name]["latency_us"] - 1
+            line += f"  {change:+7.1%}"
+        print(line, flush=True)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(
+                {
+                    "python": sys.version.split()[0],
+                    "platform": platform.platform(),
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
+
+    regressions = compare(baseline, results, args.threshold)
+    for name in regressions:
+        print(f"REGRESSION {name}: latency over baseline by {args.threshold:.0%}+")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,395 @@
+"""
+Interchangeable implementations (backends) of the batch block operations.
+
+'encrypt_blocks' and 'decrypt_blocks' of the block ciphers run on one of
+several backends that must produce identical output and differ only in
+speed, which depends on the number of blocks:
+
+- 'reference': the byte-oriented transformations of the standard, one
+  block at a time (the oracle of the differential check, never selected
+  automatically);
+- 'table': the rounds with the combined lookup tables, one block at a time;
+- 'numpy': all blocks pass through each round together;
+- 'gostcrypto': the 'gostcrypto' package, when installed (Kuznechik
+  decryption only: the encryption of this package applies the key k_10
+  once, after the last round, as in the standard, while
+  'GOST_34_12_2015_Kuznechik.encrypt' applies it after every round); the
+  package is looked up on the first use of the registry, not on import.
+
+The first batch call of an algorithm and operation calibrates the choice:
+every backend is timed on a sample batch of each size of 'BUCKETS' and the
+fastest one is used from then on for the batches of that size bucket.
+Single blocks ('encrypt', 'encrypt_int') and the chained blocks of the
+feedback modes always use the table-driven rounds.
+
+The differential check runs sampled blocks of the batches through a second
+backend and raises 'GOSTCipherError' if the outputs differ:
+
+    from ciphers.block import backends
+
+    check = backends.enable_differential(sample_rate=0.1)
+    ...
+    backends.disable_differential()
+"""
+import bisect
+import importlib.util
+import os
+import random
+import threading
+import time
+from typing import TYPE_CHECKING
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+
+from ciphers import profiling
+from ciphers import tracing
+from ciphers.block.utils import GOSTCipherError
+from ciphers.block.utils import int_to_bytearray
+from ciphers.block.utils import zero_fill
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Numbers of blocks at which the backends are timed; a batch uses the
+# backend calibrated for the largest size not above its number of blocks
+BUCKETS: Tuple[int, ...] = (1, 4, 16, 64, 256)
+# Backends slower than the fastest one by this factor, whose time per
+# block did not at least halve since the previous bucket (so they process
+# one block at a time), are not timed on the larger buckets
+_DROP_FACTOR = 4.0
+
+# The active differential check, None when it is disabled
+differential: "DifferentialCheck | None" = None
+
+
+class Backend(NamedTuple):
+    name: str
+    # Process an N x block size 'uint8' array: (cipher_obj, data, decrypt)
+    process: Callable[..., "np.ndarray"]
+    # Operations whose output is identical to that of the other backends
+    operations: Tuple[str, ...] = ("encrypt", "decrypt")
+    # Whether the calibration may select the backend
+    selectable: bool = True
+
+
+# Backends by algorithm and name, and the calibrated backend names of every
+# bucket by algorithm and operation
+_registry: Dict[str, Dict[str, Backend]] = {}
+_selection: Dict[Tuple[str, str], List[str]] = {}
+_lock = threading.Lock()
+# Whether the backends of the optional packages were looked up
+_optional_registered = False
+
+
+def register(algorithm: str, backend: Backend) -> None:
+    """
+    Add a backend of an algorithm, replacing the one with the same name.
+
+    The calibration of the algorithm is discarded, so the new backend is
+    taken into account at the next batch call.
+    """
+    with _lock:
+        _registry.setdefault(algorithm, {})[backend.name] = backend
+        for key in [key for key in _selection if key[0] == algorithm]:
+            del _selection[key]
+
+
+def _register_optional() -> None:
+    """
+    Register the backends of the optional packages that are installed.
+
+    Looking a package up scans 'sys.path', so it is done on the first use
+    of the registry rather than when the module is imported.
+    """
+    global _optional_registered
+    if _optional_registered:
+        return
+    with _lock:
+        if _optional_registered:
+            return
+        if importlib.util.find_spec("gostcrypto") is not None:
+            # A backend registered under the same name by the caller is kept
+            _registry.setdefault("kuznechik", {}).setdefault(
+                "gostcrypto",
+                Backend("gostcrypto", _gostcrypto, operations=("decrypt",)),
+            )
+        _optional_registered = True
+
+
+def get_backends(algorithm: str) -> Dict[str, Backend]:
+    """Return the registered backends of an algorithm by name."""
+    _register_optional()
+    return dict(_registry.get(algorithm, {}))
+
+
+def get_backend(algorithm: str, name: str) -> Backend:
+    _register_optional()
+    backend = _registry.get(algorithm, {}).get(name)
+    if backend is None:
+        raise GOSTCipherError(
+            f"GOSTCipherError: unknown backend {name!r} of the {algorithm} algorithm"
+        )
+    return backend
+
+
+def _time_call(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def calibrate(cipher_obj, operation: str, repeat: int = 3) -> List[str]:
+    """
+    Select the fastest backend of every size bucket by timing them.
+
+    Args:
+        cipher_obj: The block cipher object whose round keys are used.
+        operation: 'encrypt' or 'decrypt'.
+        repeat: Number of timed calls of every backend on every bucket; the
+          best one is compared.
+
+    Returns:
+        The names of the selected backends, one per bucket of 'BUCKETS'.
+    """
+    import numpy as np
+
+    decrypt = operation == "decrypt"
+    candidates = [
+        backend
+        for backend in get_backends(cipher_obj.algorithm).values()
+        if backend.selectable and operation in backend.operations
+    ]
+    if not candidates:
+        raise GOSTCipherError(
+            f"GOSTCipherError: no backend of the {cipher_obj.algorithm} algorithm "
+            f"supports {operation}"
+        )
+    block_size = cipher_obj.block_size
+    data = np.frombuffer(os.urandom(BUCKETS[-1] * block_size), dtype=np.uint8)
+    data = data.reshape(-1, block_size)
+
+    selection = []
+    per_block = {backend.name: float("inf") for backend in candidates}
+    # The timed calls are neither traced nor profiled
+    tracer, profiler = tracing.tracer, profiling.profiler
+    tracing.tracer = profiling.profiler = None
+    try:
+        for size in BUCKETS:
+            timings = {
+                backend.name: _time_call(
+                    lambda: backend.process(cipher_obj, data[:size], decrypt), repeat
+                )
+                for backend in candidates
+            }
+            best = min(timings, key=timings.get)
+            selection.append(best)
+            previous, per_block = per_block, {
+                name: timing / size for name, timing in timings.items()
+            }
+            candidates = [
+                backend
+                for backend in candidates
+                if timings[backend.name] <= timings[best] * _DROP_FACTOR
+                or per_block[backend.name] * 2 <= previous[backend.name]
+            ]
+    finally:
+        tracing.tracer, profiling.profiler = tracer, profiler
+
+    with _lock:
+        _selection[(cipher_obj.algorithm, operation)] = selection
+    return selection
+
+
+def select(cipher_obj, operation: str, num_blocks: int) -> str:
+    """Return the name of the backend for a batch, calibrating on first use."""
+    selection = _selection.get((cipher_obj.algorithm, operation))
+    if selection is None:
+        selection = calibrate(cipher_obj, operation)
+    return selection[max(bisect.bisect_right(BUCKETS, num_blocks) - 1, 0)]
+
+
+def run(cipher_obj, operation: str, data: "np.ndarray") -> "np.ndarray":
+    """
+    Encrypt or decrypt a batch of blocks with the backend of the cipher object.
+
+    Args:
+        cipher_obj: The block cipher object. Its 'backend' attribute, if not
+          None, names the backend to use instead of the calibrated one.
+        operation: 'encrypt' or 'decrypt'.
+        data: The blocks as an N x block size 'uint8' array.
+
+    Returns:
+        The processed blocks as an N x block size 'uint8' array.
+    """
+    name = cipher_obj.backend
+    if name is None:
+        name = select(cipher_obj, operation, len(data))
+    backend = get_backend(cipher_obj.algorithm, name)
+    if operation not in backend.operations:
+        raise GOSTCipherError(
+            f"GOSTCipherError: backend {name!r} does not support {operation}"
+        )
+    result = backend.process(cipher_obj, data, operation == "decrypt")
+    if differential is not None:
+        differential.check(cipher_obj, operation, data, result, name)
+    return result
+
+
+class DifferentialCheck:
+    """Comparison of sampled blocks of the batches with a second backend."""
+
+    def __init__(
+        self,
+        reference: str = "reference",
+        sample_rate: float = 1.0,
+        max_blocks: int = 8,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Args:
+            reference: Name of the backend the others are compared with.
+            sample_rate: Share of the batches that are checked.
+            max_blocks: Maximum number of blocks of a batch that are checked.
+            seed: Seed of the sampling, for reproducible runs.
+        """
+        if not 0 <= sample_rate <= 1 or max_blocks < 1:
+            raise ValueError(
+                f"sample_rate must be in [0, 1] and max_blocks ge 1, "
+                f"got {sample_rate} and {max_blocks}"
+            )
+        self.reference = reference
+        self.sample_rate = sample_rate
+        self.max_blocks = max_blocks
+        # Number of compared batches
+        self.checked = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"DifferentialCheck"
+            f"(reference={self.reference!r}, "
+            f"sample_rate={self.sample_rate}, "
+            f"checked={self.checked})"
+        )
+
+    def check(
+        self,
+        cipher_obj,
+        operation: str,
+        data: "np.ndarray",
+        result: "np.ndarray",
+        name: str,
+    ) -> None:
+        """
+        Compare sampled blocks of a processed batch with the reference.
+
+        Args:
+            cipher_obj: The block cipher object.
+            operation: 'encrypt' or 'decrypt'.
+            data: The input blocks.
+            result: The output blocks of the backend 'name'.
+            name: Name of the backend that produced 'result'.
+        """
+        if name == self.reference or not len(data):
+            return
+        reference = get_backend(cipher_obj.algorithm, self.reference)
+        if operation not in reference.operations:
+            return
+        with self._lock:
+            if self._random.random() >= self.sample_rate:
+                return
+            indexes = sorted(
+                self._random.sample(range(len(data)), min(len(data), self.max_blocks))
+            )
+        expected = reference.process(cipher_obj, data[indexes], operation == "decrypt")
+        if expected.tobytes() != result[indexes].tobytes():
+            raise GOSTCipherError(
+                f"GOSTCipherError: backend {name!r} diverged from {self.reference!r} "
+                f"({cipher_obj.algorithm} {operation} of the blocks {indexes})"
+            )
+        with self._lock:
+            self.checked += 1
+
+
+def enable_differential(
+    reference: str = "reference",
+    sample_rate: float = 1.0,
+    max_blocks: int = 8,
+    seed: int | None = None,
+) -> DifferentialCheck:
+    """Start checking the batches against a reference backend and return the check."""
+    global differential
+    differential = DifferentialCheck(reference, sample_rate, max_blocks, seed)
+    return differential
+
+
+def disable_differential() -> None:
+    """Stop the differential check."""
+    global differential
+    differential = None
+
+
+def _per_block(
+    data: "np.ndarray", func: Callable[[bytearray], bytearray]
+) -> "np.ndarray":
+    import numpy as np
+
+    block_size = data.shape[1]
+    source = data.tobytes()
+    result = bytearray(len(source))
+    for begin in range(0, len(source), block_size):
+        end = begin + block_size
+        result[begin:end] = func(bytearray(source[begin:end]))
+    return np.frombuffer(result, dtype=np.uint8).reshape(-1, block_size)
+
+
+def _reference(cipher_obj, data: "np.ndarray", decrypt: bool) -> "np.ndarray":
+    if decrypt:
+        return _per_block(data, cipher_obj._decrypt_reference)
+    return _per_block(data, cipher_obj._encrypt_reference)
+
+
+def _table(cipher_obj, data: "np.ndarray", decrypt: bool) -> "np.ndarray":
+    block_func = cipher_obj.decrypt_int if decrypt else cipher_obj.encrypt_int
+    block_size = cipher_obj.block_size
+
+    def process(block: bytearray) -> bytes:
+        return block_func(int.from_bytes(block, "big")).to_bytes(block_size, "big")
+
+    return _per_block(data, process)
+
+
+def _numpy(cipher_obj, data: "np.ndarray", decrypt: bool) -> "np.ndarray":
+    import numpy as np
+
+    array_func = cipher_obj._decrypt_array if decrypt else cipher_obj._encrypt_array
+    return array_func(data).view(np.uint8).reshape(-1, cipher_obj.block_size)
+
+
+def _gostcrypto(cipher_obj, data: "np.ndarray", decrypt: bool) -> "np.ndarray":
+    from gostcrypto.gostcipher import GOST34122015Kuznechik
+
+    # The engine gets the already expanded round keys, in its own layout
+    engine = GOST34122015Kuznechik.__new__(GOST34122015Kuznechik)
+    engine._cipher_iter_key = [
+        int_to_bytearray(key, cipher_obj.block_size)
+        for key in cipher_obj._round_keys(cipher_obj._cipher_iter_key)
+    ]
+    try:
+        return _per_block(data, engine.decrypt if decrypt else engine.encrypt)
+    finally:
+        for iter_key in engine._cipher_iter_key:
+            zero_fill(iter_key)
+
+
+for _algorithm in ("kuznechik", "magma"):
+    register(_algorithm, Backend("reference", _reference, selectable=False))
+    register(_algorithm, Backend("table", _table))
+    register(_algorithm, Backend("numpy", _numpy))
@@ -0,0 +1,210 @@
+"""
+Batch encryption of many independent messages in a process pool.
+
+The key schedules of all keys are expanded once in the parent process and
+placed in one block of shared memory. Every worker copies them from there
+in its initializer, so neither the keys nor the schedules are pickled with
+the tasks; the lookup tables of the cipher are built once per worker. The
+messages of a chunk under the same key are encrypted in lockstep (see
+'GOST_34_13_2015_GammaOutputFeedback.encrypt_many').
+
+When the pool is closed, the shared block is zeroed before it is unlinked
+and every worker clears its copies of the schedules as it exits.
+
+Usage:
+    with OutputFeedbackPool({"a": key_a, "b": key_b}) as pool:
+        for ciphertext in pool.encrypt(jobs):  # (key_id, iv, payload)
+            ...
+"""
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from multiprocessing import util
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Tuple
+
+from ciphers.block.const import _BLOCK_SIZE_KUZNECHIK
+from ciphers.block.gost_34_12_2015 import GOST_34_12_2015_Kuznechik
+from ciphers.block.gost_34_13_2015 import GOST_34_13_2015_GammaOutputFeedback
+from ciphers.block.utils import GOSTCipherError
+from ciphers.block.utils import zero_fill
+from ciphers.pool import map_bounded
+
+# Size of the round keys and of the round keys of the inverse cipher
+_SCHEDULE_SIZE = 2 * 10 * _BLOCK_SIZE_KUZNECHIK
+
+# Key schedules of the worker process by key number
+_worker_schedules: Dict[int, Tuple[array, array]] = {}
+
+
+class OutputFeedbackPool:
+    """
+    Process pool encrypting independent messages in the OFB mode.
+
+    Every message is a job '(key_id, init_vect, payload)'. Jobs are sent
+    to the workers in chunks, and the results are returned in the order of
+    the jobs.
+    """
+
+    def __init__(
+        self,
+        keys: Mapping[Hashable, bytearray],
+        max_workers: int | None = None,
+        chunk_size: int = 256,
+    ) -> None:
+        """
+        Args:
+            keys: The encryption keys (32 bytes each) by key identifier.
+            max_workers: Number of worker processes (the number of CPUs by
+              default).
+            chunk_size: Number of jobs sent to a worker at once.
+        """
+        if chunk_size < 1:
+            raise GOSTCipherError(
+                f"GOSTCipherError: chunk size must be ge 1, got {chunk_size}"
+            )
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._key_numbers = {key_id: i for i, key_id in enumerate(keys)}
+        self._shared = shared_memory.SharedMemory(
+            create=True, size=max(len(keys), 1) * _SCHEDULE_SIZE
+        )
+        try:
+            for i, key in enumerate(keys.values()):
+                cipher_obj = GOST_34_12_2015_Kuznechik(key)
+                begin = i * _SCHEDULE_SIZE
+                # The words of the round keys are copied without an
+                # intermediate object
+                for iter_key in (
+                    cipher_obj._cipher_iter_key,
+                    cipher_obj._cipher_iter_key_reverse,
+                ):
+                    with memoryview(iter_key) as words, words.cast("B") as data:
+                        self._shared.buf[begin: begin + len(data)] = data
+                        begin += len(data)
+                cipher_obj.clear()
+            self._executor = ProcessPoolExecutor(
+                self.max_workers,
+                initializer=_init_worker,
+                initargs=(self._shared.name, len(keys)),
+            )
+        except BaseException:
+            self._release_shared()
+            raise
+
+    def __enter__(self) -> "OutputFeedbackPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _release_shared(self) -> None:
+        if self._shared is not None:
+            self._shared.buf[:] = bytes(self._shared.size)
+            self._shared.close()
+            self._shared.unlink()
+            self._shared = None
+
+    def close(self) -> None:
+        """
+        Stop the workers and wipe the shared key schedules.
+
+        The workers clear their copies of the schedules on exit, and the
+        shared block is zeroed before it is unlinked.
+        """
+        if getattr(self, "_executor", None) is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if getattr(self, "_shared", None) is not None:
+            self._release_shared()
+
+    def _iter_chunks(self, jobs: Iterable[tuple]) -> Iterator[list]:
+        chunk = []
+        for key_id, init_vect, payload in jobs:
+            key_number = self._key_numbers.get(key_id)
+            if key_number is None:
+                raise GOSTCipherError(f"GOSTCipherError: unknown key id {key_id!r}")
+            chunk.append((key_number, bytes(init_vect), bytes(payload)))
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def encrypt(
+        self, jobs: Iterable[Tuple[Hashable, bytearray, bytearray]]
+    ) -> Iterator[bytearray]:
+        """
+        Encrypt the messages of the jobs.
+
+        The jobs are consumed lazily: at most two chunks per worker are in
+        flight, so arbitrarily long iterables can be streamed.
+
+        Args:
+            jobs: Tuples '(key_id, init_vect, payload)'.
+
+        Returns:
+            An iterator over the encrypted payloads in the order of the jobs.
+        """
+        if self._executor is None:
+            raise GOSTCipherError("GOSTCipherError: the pool is closed")
+        results = map_bounded(
+            self._executor, _ofb_chunk, self._iter_chunks(jobs), 2 * self.max_workers
+        )
+        for result in results:
+            yield from result
+
+    def decrypt(
+        self, jobs: Iterable[Tuple[Hashable, bytearray, bytearray]]
+    ) -> Iterator[bytearray]:
+        """Decrypt the messages of the jobs (see 'encrypt')."""
+        return self.encrypt(jobs)
+
+
+def _init_worker(name: str, num_keys: int) -> None:
+    shared = shared_memory.SharedMemory(name=name)
+    try:
+        for i in range(num_keys):
+            begin = i * _SCHEDULE_SIZE
+            middle = begin + _SCHEDULE_SIZE // 2
+            iter_key, iter_key_reverse = array("Q"), array("Q")
+            with shared.buf[begin:middle] as data:
+                iter_key.frombytes(data)
+            with shared.buf[middle: begin + _SCHEDULE_SIZE] as data:
+                iter_key_reverse.frombytes(data)
+            _worker_schedules[i] = iter_key, iter_key_reverse
+    finally:
+        shared.close()
+    # Run when the worker process exits after the shutdown of the pool
+    util.Finalize(None, _clear_worker, exitpriority=0)
+
+
+def _clear_worker() -> None:
+    for schedule in _worker_schedules.values():
+        for iter_key in schedule:
+            zero_fill(iter_key)
+    _worker_schedules.clear()
+
+
+def _ofb_chunk(chunk: List[Tuple[int, bytes, bytes]]) -> List[bytearray]:
+    # The messages under the same key are encrypted in lockstep
+    indexes_by_key = {}
+    for index, (key_number, _, _) in enumerate(chunk):
+        indexes_by_key.setdefault(key_number, []).append(index)
+    result = [None] * len(chunk)
+    for key_number, indexes in indexes_by_key.items():
+        block_cipher_obj = GOST_34_12_2015_Kuznechik._from_key_schedule(
+            *_worker_schedules[key_number]
+        )
+        encrypted = GOST_34_13_2015_GammaOutputFeedback.encrypt_many(
+            block_cipher_obj, [chunk[index][1:] for index in indexes]
+        )
+        for index, data in zip(indexes, encrypted):
+            result[index] = data
+    return result
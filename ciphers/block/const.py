@@ -1,353 +1,616 @@
-# fmt: off
-
-_BLOCK_SIZE_KUZNECHIK: int = 16
-_KEY_SIZE: int = 32
-_DEFAULT_IV_KUZNECHIK: bytearray = bytearray([
-    0x12, 0x34, 0x56, 0x78, 0x90, 0xab, 0xce, 0xf0,
-    0xa1, 0xb2, 0xc3, 0xd4, 0xe5, 0xf0, 0x01, 0x12,
-    0x23, 0x34, 0x45, 0x56, 0x67, 0x78, 0x89, 0x90,
-    0x12, 0x13, 0x14, 0x15, 0x16, 0x17, 0x18, 0x19,
-])
-_GF: tuple = ((
-                  0x00, 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0a, 0x0b, 0x0c, 0x0d, 0x0e, 0x0f,
-                  0x10, 0x11, 0x12, 0x13, 0x14, 0x15, 0x16, 0x17, 0x18, 0x19, 0x1a, 0x1b, 0x1c, 0x1d, 0x1e, 0x1f,
-                  0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27, 0x28, 0x29, 0x2a, 0x2b, 0x2c, 0x2d, 0x2e, 0x2f,
-                  0x30, 0x31, 0x32, 0x33, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39, 0x3a, 0x3b, 0x3c, 0x3d, 0x3e, 0x3f,
-                  0x40, 0x41, 0x42, 0x43, 0x44, 0x45, 0x46, 0x47, 0x48, 0x49, 0x4a, 0x4b, 0x4c, 0x4d, 0x4e, 0x4f,
-                  0x50, 0x51, 0x52, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59, 0x5a, 0x5b, 0x5c, 0x5d, 0x5e, 0x5f,
-                  0x60, 0x61, 0x62, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68, 0x69, 0x6a, 0x6b, 0x6c, 0x6d, 0x6e, 0x6f,
-                  0x70, 0x71, 0x72, 0x73, 0x74, 0x75, 0x76, 0x77, 0x78, 0x79, 0x7a, 0x7b, 0x7c, 0x7d, 0x7e, 0x7f,
-                  0x80, 0x81, 0x82, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88, 0x89, 0x8a, 0x8b, 0x8c, 0x8d, 0x8e, 0x8f,
-                  0x90, 0x91, 0x92, 0x93, 0x94, 0x95, 0x96, 0x97, 0x98, 0x99, 0x9a, 0x9b, 0x9c, 0x9d, 0x9e, 0x9f,
-                  0xa0, 0xa1, 0xa2, 0xa3, 0xa4, 0xa5, 0xa6, 0xa7, 0xa8, 0xa9, 0xaa, 0xab, 0xac, 0xad, 0xae, 0xaf,
-                  0xb0, 0xb1, 0xb2, 0xb3, 0xb4, 0xb5, 0xb6, 0xb7, 0xb8, 0xb9, 0xba, 0xbb, 0xbc, 0xbd, 0xbe, 0xbf,
-                  0xc0, 0xc1, 0xc2, 0xc3, 0xc4, 0xc5, 0xc6, 0xc7, 0xc8, 0xc9, 0xca, 0xcb, 0xcc, 0xcd, 0xce, 0xcf,
-                  0xd0, 0xd1, 0xd2, 0xd3, 0xd4, 0xd5, 0xd6, 0xd7, 0xd8, 0xd9, 0xda, 0xdb, 0xdc, 0xdd, 0xde, 0xdf,
-                  0xe0, 0xe1, 0xe2, 0xe3, 0xe4, 0xe5, 0xe6, 0xe7, 0xe8, 0xe9, 0xea, 0xeb, 0xec, 0xed, 0xee, 0xef,
-                  0xf0, 0xf1, 0xf2, 0xf3, 0xf4, 0xf5, 0xf6, 0xf7, 0xf8, 0xf9, 0xfa, 0xfb, 0xfc, 0xfd, 0xfe, 0xff,
-              ), (
-                  0x00, 0x94, 0xeb, 0x7f, 0x15, 0x81, 0xfe, 0x6a, 0x2a, 0xbe, 0xc1, 0x55, 0x3f, 0xab, 0xd4, 0x40,
-                  0x54, 0xc0, 0xbf, 0x2b, 0x41, 0xd5, 0xaa, 0x3e, 0x7e, 0xea, 0x95, 0x01, 0x6b, 0xff, 0x80, 0x14,
-                  0xa8, 0x3c, 0x43, 0xd7, 0xbd, 0x29, 0x56, 0xc2, 0x82, 0x16, 0x69, 0xfd, 0x97, 0x03, 0x7c, 0xe8,
-                  0xfc, 0x68, 0x17, 0x83, 0xe9, 0x7d, 0x02, 0x96, 0xd6, 0x42, 0x3d, 0xa9, 0xc3, 0x57, 0x28, 0xbc,
-                  0x93, 0x07, 0x78, 0xec, 0x86, 0x12, 0x6d, 0xf9, 0xb9, 0x2d, 0x52, 0xc6, 0xac, 0x38, 0x47, 0xd3,
-                  0xc7, 0x53, 0x2c, 0xb8, 0xd2, 0x46, 0x39, 0xad, 0xed, 0x79, 0x06, 0x92, 0xf8, 0x6c, 0x13, 0x87,
-                  0x3b, 0xaf, 0xd0, 0x44, 0x2e, 0xba, 0xc5, 0x51, 0x11, 0x85, 0xfa, 0x6e, 0x04, 0x90, 0xef, 0x7b,
-                  0x6f, 0xfb, 0x84, 0x10, 0x7a, 0xee, 0x91, 0x05, 0x45, 0xd1, 0xae, 0x3a, 0x50, 0xc4, 0xbb, 0x2f,
-                  0xe5, 0x71, 0x0e, 0x9a, 0xf0, 0x64, 0x1b, 0x8f, 0xcf, 0x5b, 0x24, 0xb0, 0xda, 0x4e, 0x31, 0xa5,
-                  0xb1, 0x25, 0x5a, 0xce, 0xa4, 0x30, 0x4f, 0xdb, 0x9b, 0x0f, 0x70, 0xe4, 0x8e, 0x1a, 0x65, 0xf1,
-                  0x4d, 0xd9, 0xa6, 0x32, 0x58, 0xcc, 0xb3, 0x27, 0x67, 0xf3, 0x8c, 0x18, 0x72, 0xe6, 0x99, 0x0d,
-                  0x19, 0x8d, 0xf2, 0x66, 0x0c, 0x98, 0xe7, 0x73, 0x33, 0xa7, 0xd8, 0x4c, 0x26, 0xb2, 0xcd, 0x59,
-                  0x76, 0xe2, 0x9d, 0x09, 0x63, 0xf7, 0x88, 0x1c, 0x5c, 0xc8, 0xb7, 0x23, 0x49, 0xdd, 0xa2, 0x36,
-                  0x22, 0xb6, 0xc9, 0x5d, 0x37, 0xa3, 0xdc, 0x48, 0x08, 0x9c, 0xe3, 0x77, 0x1d, 0x89, 0xf6, 0x62,
-                  0xde, 0x4a, 0x35, 0xa1, 0xcb, 0x5f, 0x20, 0xb4, 0xf4, 0x60, 0x1f, 0x8b, 0xe1, 0x75, 0x0a, 0x9e,
-                  0x8a, 0x1e, 0x61, 0xf5, 0x9f, 0x0b, 0x74, 0xe0, 0xa0, 0x34, 0x4b, 0xdf, 0xb5, 0x21, 0x5e, 0xca,
-              ), (
-                  0x00, 0x20, 0x40, 0x60, 0x80, 0xa0, 0xc0, 0xe0, 0xc3, 0xe3, 0x83, 0xa3, 0x43, 0x63, 0x03, 0x23,
-                  0x45, 0x65, 0x05, 0x25, 0xc5, 0xe5, 0x85, 0xa5, 0x86, 0xa6, 0xc6, 0xe6, 0x06, 0x26, 0x46, 0x66,
-                  0x8a, 0xaa, 0xca, 0xea, 0x0a, 0x2a, 0x4a, 0x6a, 0x49, 0x69, 0x09, 0x29, 0xc9, 0xe9, 0x89, 0xa9,
-                  0xcf, 0xef, 0x8f, 0xaf, 0x4f, 0x6f, 0x0f, 0x2f, 0x0c, 0x2c, 0x4c, 0x6c, 0x8c, 0xac, 0xcc, 0xec,
-                  0xd7, 0xf7, 0x97, 0xb7, 0x57, 0x77, 0x17, 0x37, 0x14, 0x34, 0x54, 0x74, 0x94, 0xb4, 0xd4, 0xf4,
-                  0x92, 0xb2, 0xd2, 0xf2, 0x12, 0x32, 0x52, 0x72, 0x51, 0x71, 0x11, 0x31, 0xd1, 0xf1, 0x91, 0xb1,
-                  0x5d, 0x7d, 0x1d, 0x3d, 0xdd, 0xfd, 0x9d, 0xbd, 0x9e, 0xbe, 0xde, 0xfe, 0x1e, 0x3e, 0x5e, 0x7e,
-                  0x18, 0x38, 0x58, 0x78, 0x98, 0xb8, 0xd8, 0xf8, 0xdb, 0xfb, 0x9b, 0xbb, 0x5b, 0x7b, 0x1b, 0x3b,
-                  0x6d, 0x4d, 0x2d, 0x0d, 0xed, 0xcd, 0xad, 0x8d, 0xae, 0x8e, 0xee, 0xce, 0x2e, 0x0e, 0x6e, 0x4e,
-                  0x28, 0x08, 0x68, 0x48, 0xa8, 0x88, 0xe8, 0xc8, 0xeb, 0xcb, 0xab, 0x8b, 0x6b, 0x4b, 0x2b, 0x0b,
-                  0xe7, 0xc7, 0xa7, 0x87, 0x67, 0x47, 0x27, 0x07, 0x24, 0x04, 0x64, 0x44, 0xa4, 0x84, 0xe4, 0xc4,
-                  0xa2, 0x82, 0xe2, 0xc2, 0x22, 0x02, 0x62, 0x42, 0x61, 0x41, 0x21, 0x01, 0xe1, 0xc1, 0xa1, 0x81,
-                  0xba, 0x9a, 0xfa, 0xda, 0x3a, 0x1a, 0x7a, 0x5a, 0x79, 0x59, 0x39, 0x19, 0xf9, 0xd9, 0xb9, 0x99,
-                  0xff, 0xdf, 0xbf, 0x9f, 0x7f, 0x5f, 0x3f, 0x1f, 0x3c, 0x1c, 0x7c, 0x5c, 0xbc, 0x9c, 0xfc, 0xdc,
-                  0x30, 0x10, 0x70, 0x50, 0xb0, 0x90, 0xf0, 0xd0, 0xf3, 0xd3, 0xb3, 0x93, 0x73, 0x53, 0x33, 0x13,
-                  0x75, 0x55, 0x35, 0x15, 0xf5, 0xd5, 0xb5, 0x95, 0xb6, 0x96, 0xf6, 0xd6, 0x36, 0x16, 0x76, 0x56,
-              ), (
-                  0x00, 0x85, 0xc9, 0x4c, 0x51, 0xd4, 0x98, 0x1d, 0xa2, 0x27, 0x6b, 0xee, 0xf3, 0x76, 0x3a, 0xbf,
-                  0x87, 0x02, 0x4e, 0xcb, 0xd6, 0x53, 0x1f, 0x9a, 0x25, 0xa0, 0xec, 0x69, 0x74, 0xf1, 0xbd, 0x38,
-                  0xcd, 0x48, 0x04, 0x81, 0x9c, 0x19, 0x55, 0xd0, 0x6f, 0xea, 0xa6, 0x23, 0x3e, 0xbb, 0xf7, 0x72,
-                  0x4a, 0xcf, 0x83, 0x06, 0x1b, 0x9e, 0xd2, 0x57, 0xe8, 0x6d, 0x21, 0xa4, 0xb9, 0x3c, 0x70, 0xf5,
-                  0x59, 0xdc, 0x90, 0x15, 0x08, 0x8d, 0xc1, 0x44, 0xfb, 0x7e, 0x32, 0xb7, 0xaa, 0x2f, 0x63, 0xe6,
-                  0xde, 0x5b, 0x17, 0x92, 0x8f, 0x0a, 0x46, 0xc3, 0x7c, 0xf9, 0xb5, 0x30, 0x2d, 0xa8, 0xe4, 0x61,
-                  0x94, 0x11, 0x5d, 0xd8, 0xc5, 0x40, 0x0c, 0x89, 0x36, 0xb3, 0xff, 0x7a, 0x67, 0xe2, 0xae, 0x2b,
-                  0x13, 0x96, 0xda, 0x5f, 0x42, 0xc7, 0x8b, 0x0e, 0xb1, 0x34, 0x78, 0xfd, 0xe0, 0x65, 0x29, 0xac,
-                  0xb2, 0x37, 0x7b, 0xfe, 0xe3, 0x66, 0x2a, 0xaf, 0x10, 0x95, 0xd9, 0x5c, 0x41, 0xc4, 0x88, 0x0d,
-                  0x35, 0xb0, 0xfc, 0x79, 0x64, 0xe1, 0xad, 0x28, 0x97, 0x12, 0x5e, 0xdb, 0xc6, 0x43, 0x0f, 0x8a,
-                  0x7f, 0xfa, 0xb6, 0x33, 0x2e, 0xab, 0xe7, 0x62, 0xdd, 0x58, 0x14, 0x91, 0x8c, 0x09, 0x45, 0xc0,
-                  0xf8, 0x7d, 0x31, 0xb4, 0xa9, 0x2c, 0x60, 0xe5, 0x5a, 0xdf, 0x93, 0x16, 0x0b, 0x8e, 0xc2, 0x47,
-                  0xeb, 0x6e, 0x22, 0xa7, 0xba, 0x3f, 0x73, 0xf6, 0x49, 0xcc, 0x80, 0x05, 0x18, 0x9d, 0xd1, 0x54,
-                  0x6c, 0xe9, 0xa5, 0x20, 0x3d, 0xb8, 0xf4, 0x71, 0xce, 0x4b, 0x07, 0x82, 0x9f, 0x1a, 0x56, 0xd3,
-                  0x26, 0xa3, 0xef, 0x6a, 0x77, 0xf2, 0xbe, 0x3b, 0x84, 0x01, 0x4d, 0xc8, 0xd5, 0x50, 0x1c, 0x99,
-                  0xa1, 0x24, 0x68, 0xed, 0xf0, 0x75, 0x39, 0xbc, 0x03, 0x86, 0xca, 0x4f, 0x52, 0xd7, 0x9b, 0x1e,
-              ), (
-                  0x00, 0x10, 0x20, 0x30, 0x40, 0x50, 0x60, 0x70, 0x80, 0x90, 0xa0, 0xb0, 0xc0, 0xd0, 0xe0, 0xf0,
-                  0xc3, 0xd3, 0xe3, 0xf3, 0x83, 0x93, 0xa3, 0xb3, 0x43, 0x53, 0x63, 0x73, 0x03, 0x13, 0x23, 0x33,
-                  0x45, 0x55, 0x65, 0x75, 0x05, 0x15, 0x25, 0x35, 0xc5, 0xd5, 0xe5, 0xf5, 0x85, 0x95, 0xa5, 0xb5,
-                  0x86, 0x96, 0xa6, 0xb6, 0xc6, 0xd6, 0xe6, 0xf6, 0x06, 0x16, 0x26, 0x36, 0x46, 0x56, 0x66, 0x76,
-                  0x8a, 0x9a, 0xaa, 0xba, 0xca, 0xda, 0xea, 0xfa, 0x0a, 0x1a, 0x2a, 0x3a, 0x4a, 0x5a, 0x6a, 0x7a,
-                  0x49, 0x59, 0x69, 0x79, 0x09, 0x19, 0x29, 0x39, 0xc9, 0xd9, 0xe9, 0xf9, 0x89, 0x99, 0xa9, 0xb9,
-                  0xcf, 0xdf, 0xef, 0xff, 0x8f, 0x9f, 0xaf, 0xbf, 0x4f, 0x5f, 0x6f, 0x7f, 0x0f, 0x1f, 0x2f, 0x3f,
-                  0x0c, 0x1c, 0x2c, 0x3c, 0x4c, 0x5c, 0x6c, 0x7c, 0x8c, 0x9c, 0xac, 0xbc, 0xcc, 0xdc, 0xec, 0xfc,
-                  0xd7, 0xc7, 0xf7, 0xe7, 0x97, 0x87, 0xb7, 0xa7, 0x57, 0x47, 0x77, 0x67, 0x17, 0x07, 0x37, 0x27,
-                  0x14, 0x04, 0x34, 0x24, 0x54, 0x44, 0x74, 0x64, 0x94, 0x84, 0xb4, 0xa4, 0xd4, 0xc4, 0xf4, 0xe4,
-                  0x92, 0x82, 0xb2, 0xa2, 0xd2, 0xc2, 0xf2, 0xe2, 0x12, 0x02, 0x32, 0x22, 0x52, 0x42, 0x72, 0x62,
-                  0x51, 0x41, 0x71, 0x61, 0x11, 0x01, 0x31, 0x21, 0xd1, 0xc1, 0xf1, 0xe1, 0x91, 0x81, 0xb1, 0xa1,
-                  0x5d, 0x4d, 0x7d, 0x6d, 0x1d, 0x0d, 0x3d, 0x2d, 0xdd, 0xcd, 0xfd, 0xed, 0x9d, 0x8d, 0xbd, 0xad,
-                  0x9e, 0x8e, 0xbe, 0xae, 0xde, 0xce, 0xfe, 0xee, 0x1e, 0x0e, 0x3e, 0x2e, 0x5e, 0x4e, 0x7e, 0x6e,
-                  0x18, 0x08, 0x38, 0x28, 0x58, 0x48, 0x78, 0x68, 0x98, 0x88, 0xb8, 0xa8, 0xd8, 0xc8, 0xf8, 0xe8,
-                  0xdb, 0xcb, 0xfb, 0xeb, 0x9b, 0x8b, 0xbb, 0xab, 0x5b, 0x4b, 0x7b, 0x6b, 0x1b, 0x0b, 0x3b, 0x2b,
-              ), (
-                  0x00, 0xc2, 0x47, 0x85, 0x8e, 0x4c, 0xc9, 0x0b, 0xdf, 0x1d, 0x98, 0x5a, 0x51, 0x93, 0x16, 0xd4,
-                  0x7d, 0xbf, 0x3a, 0xf8, 0xf3, 0x31, 0xb4, 0x76, 0xa2, 0x60, 0xe5, 0x27, 0x2c, 0xee, 0x6b, 0xa9,
-                  0xfa, 0x38, 0xbd, 0x7f, 0x74, 0xb6, 0x33, 0xf1, 0x25, 0xe7, 0x62, 0xa0, 0xab, 0x69, 0xec, 0x2e,
-                  0x87, 0x45, 0xc0, 0x02, 0x09, 0xcb, 0x4e, 0x8c, 0x58, 0x9a, 0x1f, 0xdd, 0xd6, 0x14, 0x91, 0x53,
-                  0x37, 0xf5, 0x70, 0xb2, 0xb9, 0x7b, 0xfe, 0x3c, 0xe8, 0x2a, 0xaf, 0x6d, 0x66, 0xa4, 0x21, 0xe3,
-                  0x4a, 0x88, 0x0d, 0xcf, 0xc4, 0x06, 0x83, 0x41, 0x95, 0x57, 0xd2, 0x10, 0x1b, 0xd9, 0x5c, 0x9e,
-                  0xcd, 0x0f, 0x8a, 0x48, 0x43, 0x81, 0x04, 0xc6, 0x12, 0xd0, 0x55, 0x97, 0x9c, 0x5e, 0xdb, 0x19,
-                  0xb0, 0x72, 0xf7, 0x35, 0x3e, 0xfc, 0x79, 0xbb, 0x6f, 0xad, 0x28, 0xea, 0xe1, 0x23, 0xa6, 0x64,
-                  0x6e, 0xac, 0x29, 0xeb, 0xe0, 0x22, 0xa7, 0x65, 0xb1, 0x73, 0xf6, 0x34, 0x3f, 0xfd, 0x78, 0xba,
-                  0x13, 0xd1, 0x54, 0x96, 0x9d, 0x5f, 0xda, 0x18, 0xcc, 0x0e, 0x8b, 0x49, 0x42, 0x80, 0x05, 0xc7,
-                  0x94, 0x56, 0xd3, 0x11, 0x1a, 0xd8, 0x5d, 0x9f, 0x4b, 0x89, 0x0c, 0xce, 0xc5, 0x07, 0x82, 0x40,
-                  0xe9, 0x2b, 0xae, 0x6c, 0x67, 0xa5, 0x20, 0xe2, 0x36, 0xf4, 0x71, 0xb3, 0xb8, 0x7a, 0xff, 0x3d,
-                  0x59, 0x9b, 0x1e, 0xdc, 0xd7, 0x15, 0x90, 0x52, 0x86, 0x44, 0xc1, 0x03, 0x08, 0xca, 0x4f, 0x8d,
-                  0x24, 0xe6, 0x63, 0xa1, 0xaa, 0x68, 0xed, 0x2f, 0xfb, 0x39, 0xbc, 0x7e, 0x75, 0xb7, 0x32, 0xf0,
-                  0xa3, 0x61, 0xe4, 0x26, 0x2d, 0xef, 0x6a, 0xa8, 0x7c, 0xbe, 0x3b, 0xf9, 0xf2, 0x30, 0xb5, 0x77,
-                  0xde, 0x1c, 0x99, 0x5b, 0x50, 0x92, 0x17, 0xd5, 0x01, 0xc3, 0x46, 0x84, 0x8f, 0x4d, 0xc8, 0x0a,
-              ), (
-                  0x00, 0xc0, 0x43, 0x83, 0x86, 0x46, 0xc5, 0x05, 0xcf, 0x0f, 0x8c, 0x4c, 0x49, 0x89, 0x0a, 0xca,
-                  0x5d, 0x9d, 0x1e, 0xde, 0xdb, 0x1b, 0x98, 0x58, 0x92, 0x52, 0xd1, 0x11, 0x14, 0xd4, 0x57, 0x97,
-                  0xba, 0x7a, 0xf9, 0x39, 0x3c, 0xfc, 0x7f, 0xbf, 0x75, 0xb5, 0x36, 0xf6, 0xf3, 0x33, 0xb0, 0x70,
-                  0xe7, 0x27, 0xa4, 0x64, 0x61, 0xa1, 0x22, 0xe2, 0x28, 0xe8, 0x6b, 0xab, 0xae, 0x6e, 0xed, 0x2d,
-                  0xb7, 0x77, 0xf4, 0x34, 0x31, 0xf1, 0x72, 0xb2, 0x78, 0xb8, 0x3b, 0xfb, 0xfe, 0x3e, 0xbd, 0x7d,
-                  0xea, 0x2a, 0xa9, 0x69, 0x6c, 0xac, 0x2f, 0xef, 0x25, 0xe5, 0x66, 0xa6, 0xa3, 0x63, 0xe0, 0x20,
-                  0x0d, 0xcd, 0x4e, 0x8e, 0x8b, 0x4b, 0xc8, 0x08, 0xc2, 0x02, 0x81, 0x41, 0x44, 0x84, 0x07, 0xc7,
-                  0x50, 0x90, 0x13, 0xd3, 0xd6, 0x16, 0x95, 0x55, 0x9f, 0x5f, 0xdc, 0x1c, 0x19, 0xd9, 0x5a, 0x9a,
-                  0xad, 0x6d, 0xee, 0x2e, 0x2b, 0xeb, 0x68, 0xa8, 0x62, 0xa2, 0x21, 0xe1, 0xe4, 0x24, 0xa7, 0x67,
-                  0xf0, 0x30, 0xb3, 0x73, 0x76, 0xb6, 0x35, 0xf5, 0x3f, 0xff, 0x7c, 0xbc, 0xb9, 0x79, 0xfa, 0x3a,
-                  0x17, 0xd7, 0x54, 0x94, 0x91, 0x51, 0xd2, 0x12, 0xd8, 0x18, 0x9b, 0x5b, 0x5e, 0x9e, 0x1d, 0xdd,
-                  0x4a, 0x8a, 0x09, 0xc9, 0xcc, 0x0c, 0x8f, 0x4f, 0x85, 0x45, 0xc6, 0x06, 0x03, 0xc3, 0x40, 0x80,
-                  0x1a, 0xda, 0x59, 0x99, 0x9c, 0x5c, 0xdf, 0x1f, 0xd5, 0x15, 0x96, 0x56, 0x53, 0x93, 0x10, 0xd0,
-                  0x47, 0x87, 0x04, 0xc4, 0xc1, 0x01, 0x82, 0x42, 0x88, 0x48, 0xcb, 0x0b, 0x0e, 0xce, 0x4d, 0x8d,
-                  0xa0, 0x60, 0xe3, 0x23, 0x26, 0xe6, 0x65, 0xa5, 0x6f, 0xaf, 0x2c, 0xec, 0xe9, 0x29, 0xaa, 0x6a,
-                  0xfd, 0x3d, 0xbe, 0x7e, 0x7b, 0xbb, 0x38, 0xf8, 0x32, 0xf2, 0x71, 0xb1, 0xb4, 0x74, 0xf7, 0x37,
-              ), (
-                  0x00, 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0a, 0x0b, 0x0c, 0x0d, 0x0e, 0x0f,
-                  0x10, 0x11, 0x12, 0x13, 0x14, 0x15, 0x16, 0x17, 0x18, 0x19, 0x1a, 0x1b, 0x1c, 0x1d, 0x1e, 0x1f,
-                  0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27, 0x28, 0x29, 0x2a, 0x2b, 0x2c, 0x2d, 0x2e, 0x2f,
-                  0x30, 0x31, 0x32, 0x33, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39, 0x3a, 0x3b, 0x3c, 0x3d, 0x3e, 0x3f,
-                  0x40, 0x41, 0x42, 0x43, 0x44, 0x45, 0x46, 0x47, 0x48, 0x49, 0x4a, 0x4b, 0x4c, 0x4d, 0x4e, 0x4f,
-                  0x50, 0x51, 0x52, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59, 0x5a, 0x5b, 0x5c, 0x5d, 0x5e, 0x5f,
-                  0x60, 0x61, 0x62, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68, 0x69, 0x6a, 0x6b, 0x6c, 0x6d, 0x6e, 0x6f,
-                  0x70, 0x71, 0x72, 0x73, 0x74, 0x75, 0x76, 0x77, 0x78, 0x79, 0x7a, 0x7b, 0x7c, 0x7d, 0x7e, 0x7f,
-                  0x80, 0x81, 0x82, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88, 0x89, 0x8a, 0x8b, 0x8c, 0x8d, 0x8e, 0x8f,
-                  0x90, 0x91, 0x92, 0x93, 0x94, 0x95, 0x96, 0x97, 0x98, 0x99, 0x9a, 0x9b, 0x9c, 0x9d, 0x9e, 0x9f,
-                  0xa0, 0xa1, 0xa2, 0xa3, 0xa4, 0xa5, 0xa6, 0xa7, 0xa8, 0xa9, 0xaa, 0xab, 0xac, 0xad, 0xae, 0xaf,
-                  0xb0, 0xb1, 0xb2, 0xb3, 0xb4, 0xb5, 0xb6, 0xb7, 0xb8, 0xb9, 0xba, 0xbb, 0xbc, 0xbd, 0xbe, 0xbf,
-                  0xc0, 0xc1, 0xc2, 0xc3, 0xc4, 0xc5, 0xc6, 0xc7, 0xc8, 0xc9, 0xca, 0xcb, 0xcc, 0xcd, 0xce, 0xcf,
-                  0xd0, 0xd1, 0xd2, 0xd3, 0xd4, 0xd5, 0xd6, 0xd7, 0xd8, 0xd9, 0xda, 0xdb, 0xdc, 0xdd, 0xde, 0xdf,
-                  0xe0, 0xe1, 0xe2, 0xe3, 0xe4, 0xe5, 0xe6, 0xe7, 0xe8, 0xe9, 0xea, 0xeb, 0xec, 0xed, 0xee, 0xef,
-                  0xf0, 0xf1, 0xf2, 0xf3, 0xf4, 0xf5, 0xf6, 0xf7, 0xf8, 0xf9, 0xfa, 0xfb, 0xfc, 0xfd, 0xfe, 0xff,
-              ), (
-                  0x00, 0xfb, 0x35, 0xce, 0x6a, 0x91, 0x5f, 0xa4, 0xd4, 0x2f, 0xe1, 0x1a, 0xbe, 0x45, 0x8b, 0x70,
-                  0x6b, 0x90, 0x5e, 0xa5, 0x01, 0xfa, 0x34, 0xcf, 0xbf, 0x44, 0x8a, 0x71, 0xd5, 0x2e, 0xe0, 0x1b,
-                  0xd6, 0x2d, 0xe3, 0x18, 0xbc, 0x47, 0x89, 0x72, 0x02, 0xf9, 0x37, 0xcc, 0x68, 0x93, 0x5d, 0xa6,
-                  0xbd, 0x46, 0x88, 0x73, 0xd7, 0x2c, 0xe2, 0x19, 0x69, 0x92, 0x5c, 0xa7, 0x03, 0xf8, 0x36, 0xcd,
-                  0x6f, 0x94, 0x5a, 0xa1, 0x05, 0xfe, 0x30, 0xcb, 0xbb, 0x40, 0x8e, 0x75, 0xd1, 0x2a, 0xe4, 0x1f,
-                  0x04, 0xff, 0x31, 0xca, 0x6e, 0x95, 0x5b, 0xa0, 0xd0, 0x2b, 0xe5, 0x1e, 0xba, 0x41, 0x8f, 0x74,
-                  0xb9, 0x42, 0x8c, 0x77, 0xd3, 0x28, 0xe6, 0x1d, 0x6d, 0x96, 0x58, 0xa3, 0x07, 0xfc, 0x32, 0xc9,
-                  0xd2, 0x29, 0xe7, 0x1c, 0xb8, 0x43, 0x8d, 0x76, 0x06, 0xfd, 0x33, 0xc8, 0x6c, 0x97, 0x59, 0xa2,
-                  0xde, 0x25, 0xeb, 0x10, 0xb4, 0x4f, 0x81, 0x7a, 0x0a, 0xf1, 0x3f, 0xc4, 0x60, 0x9b, 0x55, 0xae,
-                  0xb5, 0x4e, 0x80, 0x7b, 0xdf, 0x24, 0xea, 0x11, 0x61, 0x9a, 0x54, 0xaf, 0x0b, 0xf0, 0x3e, 0xc5,
-                  0x08, 0xf3, 0x3d, 0xc6, 0x62, 0x99, 0x57, 0xac, 0xdc, 0x27, 0xe9, 0x12, 0xb6, 0x4d, 0x83, 0x78,
-                  0x63, 0x98, 0x56, 0xad, 0x09, 0xf2, 0x3c, 0xc7, 0xb7, 0x4c, 0x82, 0x79, 0xdd, 0x26, 0xe8, 0x13,
-                  0xb1, 0x4a, 0x84, 0x7f, 0xdb, 0x20, 0xee, 0x15, 0x65, 0x9e, 0x50, 0xab, 0x0f, 0xf4, 0x3a, 0xc1,
-                  0xda, 0x21, 0xef, 0x14, 0xb0, 0x4b, 0x85, 0x7e, 0x0e, 0xf5, 0x3b, 0xc0, 0x64, 0x9f, 0x51, 0xaa,
-                  0x67, 0x9c, 0x52, 0xa9, 0x0d, 0xf6, 0x38, 0xc3, 0xb3, 0x48, 0x86, 0x7d, 0xd9, 0x22, 0xec, 0x17,
-                  0x0c, 0xf7, 0x39, 0xc2, 0x66, 0x9d, 0x53, 0xa8, 0xd8, 0x23, 0xed, 0x16, 0xb2, 0x49, 0x87, 0x7c,
-              ), (
-                  0x00, 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0a, 0x0b, 0x0c, 0x0d, 0x0e, 0x0f,
-                  0x10, 0x11, 0x12, 0x13, 0x14, 0x15, 0x16, 0x17, 0x18, 0x19, 0x1a, 0x1b, 0x1c, 0x1d, 0x1e, 0x1f,
-                  0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27, 0x28, 0x29, 0x2a, 0x2b, 0x2c, 0x2d, 0x2e, 0x2f,
-                  0x30, 0x31, 0x32, 0x33, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39, 0x3a, 0x3b, 0x3c, 0x3d, 0x3e, 0x3f,
-                  0x40, 0x41, 0x42, 0x43, 0x44, 0x45, 0x46, 0x47, 0x48, 0x49, 0x4a, 0x4b, 0x4c, 0x4d, 0x4e, 0x4f,
-                  0x50, 0x51, 0x52, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59, 0x5a, 0x5b, 0x5c, 0x5d, 0x5e, 0x5f,
-                  0x60, 0x61, 0x62, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68, 0x69, 0x6a, 0x6b, 0x6c, 0x6d, 0x6e, 0x6f,
-                  0x70, 0x71, 0x72, 0x73, 0x74, 0x75, 0x76, 0x77, 0x78, 0x79, 0x7a, 0x7b, 0x7c, 0x7d, 0x7e, 0x7f,
-                  0x80, 0x81, 0x82, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88, 0x89, 0x8a, 0x8b, 0x8c, 0x8d, 0x8e, 0x8f,
-                  0x90, 0x91, 0x92, 0x93, 0x94, 0x95, 0x96, 0x97, 0x98, 0x99, 0x9a, 0x9b, 0x9c, 0x9d, 0x9e, 0x9f,
-                  0xa0, 0xa1, 0xa2, 0xa3, 0xa4, 0xa5, 0xa6, 0xa7, 0xa8, 0xa9, 0xaa, 0xab, 0xac, 0xad, 0xae, 0xaf,
-                  0xb0, 0xb1, 0xb2, 0xb3, 0xb4, 0xb5, 0xb6, 0xb7, 0xb8, 0xb9, 0xba, 0xbb, 0xbc, 0xbd, 0xbe, 0xbf,
-                  0xc0, 0xc1, 0xc2, 0xc3, 0xc4, 0xc5, 0xc6, 0xc7, 0xc8, 0xc9, 0xca, 0xcb, 0xcc, 0xcd, 0xce, 0xcf,
-                  0xd0, 0xd1, 0xd2, 0xd3, 0xd4, 0xd5, 0xd6, 0xd7, 0xd8, 0xd9, 0xda, 0xdb, 0xdc, 0xdd, 0xde, 0xdf,
-                  0xe0, 0xe1, 0xe2, 0xe3, 0xe4, 0xe5, 0xe6, 0xe7, 0xe8, 0xe9, 0xea, 0xeb, 0xec, 0xed, 0xee, 0xef,
-                  0xf0, 0xf1, 0xf2, 0xf3, 0xf4, 0xf5, 0xf6, 0xf7, 0xf8, 0xf9, 0xfa, 0xfb, 0xfc, 0xfd, 0xfe, 0xff,
-              ), (
-                  0x00, 0xc0, 0x43, 0x83, 0x86, 0x46, 0xc5, 0x05, 0xcf, 0x0f, 0x8c, 0x4c, 0x49, 0x89, 0x0a, 0xca,
-                  0x5d, 0x9d, 0x1e, 0xde, 0xdb, 0x1b, 0x98, 0x58, 0x92, 0x52, 0xd1, 0x11, 0x14, 0xd4, 0x57, 0x97,
-                  0xba, 0x7a, 0xf9, 0x39, 0x3c, 0xfc, 0x7f, 0xbf, 0x75, 0xb5, 0x36, 0xf6, 0xf3, 0x33, 0xb0, 0x70,
-                  0xe7, 0x27, 0xa4, 0x64, 0x61, 0xa1, 0x22, 0xe2, 0x28, 0xe8, 0x6b, 0xab, 0xae, 0x6e, 0xed, 0x2d,
-                  0xb7, 0x77, 0xf4, 0x34, 0x31, 0xf1, 0x72, 0xb2, 0x78, 0xb8, 0x3b, 0xfb, 0xfe, 0x3e, 0xbd, 0x7d,
-                  0xea, 0x2a, 0xa9, 0x69, 0x6c, 0xac, 0x2f, 0xef, 0x25, 0xe5, 0x66, 0xa6, 0xa3, 0x63, 0xe0, 0x20,
-                  0x0d, 0xcd, 0x4e, 0x8e, 0x8b, 0x4b, 0xc8, 0x08, 0xc2, 0x02, 0x81, 0x41, 0x44, 0x84, 0x07, 0xc7,
-                  0x50, 0x90, 0x13, 0xd3, 0xd6, 0x16, 0x95, 0x55, 0x9f, 0x5f, 0xdc, 0x1c, 0x19, 0xd9, 0x5a, 0x9a,
-                  0xad, 0x6d, 0xee, 0x2e, 0x2b, 0xeb, 0x68, 0xa8, 0x62, 0xa2, 0x21, 0xe1, 0xe4, 0x24, 0xa7, 0x67,
-                  0xf0, 0x30, 0xb3, 0x73, 0x76, 0xb6, 0x35, 0xf5, 0x3f, 0xff, 0x7c, 0xbc, 0xb9, 0x79, 0xfa, 0x3a,
-                  0x17, 0xd7, 0x54, 0x94, 0x91, 0x51, 0xd2, 0x12, 0xd8, 0x18, 0x9b, 0x5b, 0x5e, 0x9e, 0x1d, 0xdd,
-                  0x4a, 0x8a, 0x09, 0xc9, 0xcc, 0x0c, 0x8f, 0x4f, 0x85, 0x45, 0xc6, 0x06, 0x03, 0xc3, 0x40, 0x80,
-                  0x1a, 0xda, 0x59, 0x99, 0x9c, 0x5c, 0xdf, 0x1f, 0xd5, 0x15, 0x96, 0x56, 0x53, 0x93, 0x10, 0xd0,
-                  0x47, 0x87, 0x04, 0xc4, 0xc1, 0x01, 0x82, 0x42, 0x88, 0x48, 0xcb, 0x0b, 0x0e, 0xce, 0x4d, 0x8d,
-                  0xa0, 0x60, 0xe3, 0x23, 0x26, 0xe6, 0x65, 0xa5, 0x6f, 0xaf, 0x2c, 0xec, 0xe9, 0x29, 0xaa, 0x6a,
-                  0xfd, 0x3d, 0xbe, 0x7e, 0x7b, 0xbb, 0x38, 0xf8, 0x32, 0xf2, 0x71, 0xb1, 0xb4, 0x74, 0xf7, 0x37,
-              ), (
-                  0x00, 0xc2, 0x47, 0x85, 0x8e, 0x4c, 0xc9, 0x0b, 0xdf, 0x1d, 0x98, 0x5a, 0x51, 0x93, 0x16, 0xd4,
-                  0x7d, 0xbf, 0x3a, 0xf8, 0xf3, 0x31, 0xb4, 0x76, 0xa2, 0x60, 0xe5, 0x27, 0x2c, 0xee, 0x6b, 0xa9,
-                  0xfa, 0x38, 0xbd, 0x7f, 0x74, 0xb6, 0x33, 0xf1, 0x25, 0xe7, 0x62, 0xa0, 0xab, 0x69, 0xec, 0x2e,
-                  0x87, 0x45, 0xc0, 0x02, 0x09, 0xcb, 0x4e, 0x8c, 0x58, 0x9a, 0x1f, 0xdd, 0xd6, 0x14, 0x91, 0x53,
-                  0x37, 0xf5, 0x70, 0xb2, 0xb9, 0x7b, 0xfe, 0x3c, 0xe8, 0x2a, 0xaf, 0x6d, 0x66, 0xa4, 0x21, 0xe3,
-                  0x4a, 0x88, 0x0d, 0xcf, 0xc4, 0x06, 0x83, 0x41, 0x95, 0x57, 0xd2, 0x10, 0x1b, 0xd9, 0x5c, 0x9e,
-                  0xcd, 0x0f, 0x8a, 0x48, 0x43, 0x81, 0x04, 0xc6, 0x12, 0xd0, 0x55, 0x97, 0x9c, 0x5e, 0xdb, 0x19,
-                  0xb0, 0x72, 0xf7, 0x35, 0x3e, 0xfc, 0x79, 0xbb, 0x6f, 0xad, 0x28, 0xea, 0xe1, 0x23, 0xa6, 0x64,
-                  0x6e, 0xac, 0x29, 0xeb, 0xe0, 0x22, 0xa7, 0x65, 0xb1, 0x73, 0xf6, 0x34, 0x3f, 0xfd, 0x78, 0xba,
-                  0x13, 0xd1, 0x54, 0x96, 0x9d, 0x5f, 0xda, 0x18, 0xcc, 0x0e, 0x8b, 0x49, 0x42, 0x80, 0x05, 0xc7,
-                  0x94, 0x56, 0xd3, 0x11, 0x1a, 0xd8, 0x5d, 0x9f, 0x4b, 0x89, 0x0c, 0xce, 0xc5, 0x07, 0x82, 0x40,
-                  0xe9, 0x2b, 0xae, 0x6c, 0x67, 0xa5, 0x20, 0xe2, 0x36, 0xf4, 0x71, 0xb3, 0xb8, 0x7a, 0xff, 0x3d,
-                  0x59, 0x9b, 0x1e, 0xdc, 0xd7, 0x15, 0x90, 0x52, 0x86, 0x44, 0xc1, 0x03, 0x08, 0xca, 0x4f, 0x8d,
-                  0x24, 0xe6, 0x63, 0xa1, 0xaa, 0x68, 0xed, 0x2f, 0xfb, 0x39, 0xbc, 0x7e, 0x75, 0xb7, 0x32, 0xf0,
-                  0xa3, 0x61, 0xe4, 0x26, 0x2d, 0xef, 0x6a, 0xa8, 0x7c, 0xbe, 0x3b, 0xf9, 0xf2, 0x30, 0xb5, 0x77,
-                  0xde, 0x1c, 0x99, 0x5b, 0x50, 0x92, 0x17, 0xd5, 0x01, 0xc3, 0x46, 0x84, 0x8f, 0x4d, 0xc8, 0x0a,
-              ), (
-                  0x00, 0x10, 0x20, 0x30, 0x40, 0x50, 0x60, 0x70, 0x80, 0x90, 0xa0, 0xb0, 0xc0, 0xd0, 0xe0, 0xf0,
-                  0xc3, 0xd3, 0xe3, 0xf3, 0x83, 0x93, 0xa3, 0xb3, 0x43, 0x53, 0x63, 0x73, 0x03, 0x13, 0x23, 0x33,
-                  0x45, 0x55, 0x65, 0x75, 0x05, 0x15, 0x25, 0x35, 0xc5, 0xd5, 0xe5, 0xf5, 0x85, 0x95, 0xa5, 0xb5,
-                  0x86, 0x96, 0xa6, 0xb6, 0xc6, 0xd6, 0xe6, 0xf6, 0x06, 0x16, 0x26, 0x36, 0x46, 0x56, 0x66, 0x76,
-                  0x8a, 0x9a, 0xaa, 0xba, 0xca, 0xda, 0xea, 0xfa, 0x0a, 0x1a, 0x2a, 0x3a, 0x4a, 0x5a, 0x6a, 0x7a,
-                  0x49, 0x59, 0x69, 0x79, 0x09, 0x19, 0x29, 0x39, 0xc9, 0xd9, 0xe9, 0xf9, 0x89, 0x99, 0xa9, 0xb9,
-                  0xcf, 0xdf, 0xef, 0xff, 0x8f, 0x9f, 0xaf, 0xbf, 0x4f, 0x5f, 0x6f, 0x7f, 0x0f, 0x1f, 0x2f, 0x3f,
-                  0x0c, 0x1c, 0x2c, 0x3c, 0x4c, 0x5c, 0x6c, 0x7c, 0x8c, 0x9c, 0xac, 0xbc, 0xcc, 0xdc, 0xec, 0xfc,
-                  0xd7, 0xc7, 0xf7, 0xe7, 0x97, 0x87, 0xb7, 0xa7, 0x57, 0x47, 0x77, 0x67, 0x17, 0x07, 0x37, 0x27,
-                  0x14, 0x04, 0x34, 0x24, 0x54, 0x44, 0x74, 0x64, 0x94, 0x84, 0xb4, 0xa4, 0xd4, 0xc4, 0xf4, 0xe4,
-                  0x92, 0x82, 0xb2, 0xa2, 0xd2, 0xc2, 0xf2, 0xe2, 0x12, 0x02, 0x32, 0x22, 0x52, 0x42, 0x72, 0x62,
-                  0x51, 0x41, 0x71, 0x61, 0x11, 0x01, 0x31, 0x21, 0xd1, 0xc1, 0xf1, 0xe1, 0x91, 0x81, 0xb1, 0xa1,
-                  0x5d, 0x4d, 0x7d, 0x6d, 0x1d, 0x0d, 0x3d, 0x2d, 0xdd, 0xcd, 0xfd, 0xed, 0x9d, 0x8d, 0xbd, 0xad,
-                  0x9e, 0x8e, 0xbe, 0xae, 0xde, 0xce, 0xfe, 0xee, 0x1e, 0x0e, 0x3e, 0x2e, 0x5e, 0x4e, 0x7e, 0x6e,
-                  0x18, 0x08, 0x38, 0x28, 0x58, 0x48, 0x78, 0x68, 0x98, 0x88, 0xb8, 0xa8, 0xd8, 0xc8, 0xf8, 0xe8,
-                  0xdb, 0xcb, 0xfb, 0xeb, 0x9b, 0x8b, 0xbb, 0xab, 0x5b, 0x4b, 0x7b, 0x6b, 0x1b, 0x0b, 0x3b, 0x2b,
-              ), (
-                  0x00, 0x85, 0xc9, 0x4c, 0x51, 0xd4, 0x98, 0x1d, 0xa2, 0x27, 0x6b, 0xee, 0xf3, 0x76, 0x3a, 0xbf,
-                  0x87, 0x02, 0x4e, 0xcb, 0xd6, 0x53, 0x1f, 0x9a, 0x25, 0xa0, 0xec, 0x69, 0x74, 0xf1, 0xbd, 0x38,
-                  0xcd, 0x48, 0x04, 0x81, 0x9c, 0x19, 0x55, 0xd0, 0x6f, 0xea, 0xa6, 0x23, 0x3e, 0xbb, 0xf7, 0x72,
-                  0x4a, 0xcf, 0x83, 0x06, 0x1b, 0x9e, 0xd2, 0x57, 0xe8, 0x6d, 0x21, 0xa4, 0xb9, 0x3c, 0x70, 0xf5,
-                  0x59, 0xdc, 0x90, 0x15, 0x08, 0x8d, 0xc1, 0x44, 0xfb, 0x7e, 0x32, 0xb7, 0xaa, 0x2f, 0x63, 0xe6,
-                  0xde, 0x5b, 0x17, 0x92, 0x8f, 0x0a, 0x46, 0xc3, 0x7c, 0xf9, 0xb5, 0x30, 0x2d, 0xa8, 0xe4, 0x61,
-                  0x94, 0x11, 0x5d, 0xd8, 0xc5, 0x40, 0x0c, 0x89, 0x36, 0xb3, 0xff, 0x7a, 0x67, 0xe2, 0xae, 0x2b,
-                  0x13, 0x96, 0xda, 0x5f, 0x42, 0xc7, 0x8b, 0x0e, 0xb1, 0x34, 0x78, 0xfd, 0xe0, 0x65, 0x29, 0xac,
-                  0xb2, 0x37, 0x7b, 0xfe, 0xe3, 0x66, 0x2a, 0xaf, 0x10, 0x95, 0xd9, 0x5c, 0x41, 0xc4, 0x88, 0x0d,
-                  0x35, 0xb0, 0xfc, 0x79, 0x64, 0xe1, 0xad, 0x28, 0x97, 0x12, 0x5e, 0xdb, 0xc6, 0x43, 0x0f, 0x8a,
-                  0x7f, 0xfa, 0xb6, 0x33, 0x2e, 0xab, 0xe7, 0x62, 0xdd, 0x58, 0x14, 0x91, 0x8c, 0x09, 0x45, 0xc0,
-                  0xf8, 0x7d, 0x31, 0xb4, 0xa9, 0x2c, 0x60, 0xe5, 0x5a, 0xdf, 0x93, 0x16, 0x0b, 0x8e, 0xc2, 0x47,
-                  0xeb, 0x6e, 0x22, 0xa7, 0xba, 0x3f, 0x73, 0xf6, 0x49, 0xcc, 0x80, 0x05, 0x18, 0x9d, 0xd1, 0x54,
-                  0x6c, 0xe9, 0xa5, 0x20, 0x3d, 0xb8, 0xf4, 0x71, 0xce, 0x4b, 0x07, 0x82, 0x9f, 0x1a, 0x56, 0xd3,
-                  0x26, 0xa3, 0xef, 0x6a, 0x77, 0xf2, 0xbe, 0x3b, 0x84, 0x01, 0x4d, 0xc8, 0xd5, 0x50, 0x1c, 0x99,
-                  0xa1, 0x24, 0x68, 0xed, 0xf0, 0x75, 0x39, 0xbc, 0x03, 0x86, 0xca, 0x4f, 0x52, 0xd7, 0x9b, 0x1e,
-              ), (
-                  0x00, 0x20, 0x40, 0x60, 0x80, 0xa0, 0xc0, 0xe0, 0xc3, 0xe3, 0x83, 0xa3, 0x43, 0x63, 0x03, 0x23,
-                  0x45, 0x65, 0x05, 0x25, 0xc5, 0xe5, 0x85, 0xa5, 0x86, 0xa6, 0xc6, 0xe6, 0x06, 0x26, 0x46, 0x66,
-                  0x8a, 0xaa, 0xca, 0xea, 0x0a, 0x2a, 0x4a, 0x6a, 0x49, 0x69, 0x09, 0x29, 0xc9, 0xe9, 0x89, 0xa9,
-                  0xcf, 0xef, 0x8f, 0xaf, 0x4f, 0x6f, 0x0f, 0x2f, 0x0c, 0x2c, 0x4c, 0x6c, 0x8c, 0xac, 0xcc, 0xec,
-                  0xd7, 0xf7, 0x97, 0xb7, 0x57, 0x77, 0x17, 0x37, 0x14, 0x34, 0x54, 0x74, 0x94, 0xb4, 0xd4, 0xf4,
-                  0x92, 0xb2, 0xd2, 0xf2, 0x12, 0x32, 0x52, 0x72, 0x51, 0x71, 0x11, 0x31, 0xd1, 0xf1, 0x91, 0xb1,
-                  0x5d, 0x7d, 0x1d, 0x3d, 0xdd, 0xfd, 0x9d, 0xbd, 0x9e, 0xbe, 0xde, 0xfe, 0x1e, 0x3e, 0x5e, 0x7e,
-                  0x18, 0x38, 0x58, 0x78, 0x98, 0xb8, 0xd8, 0xf8, 0xdb, 0xfb, 0x9b, 0xbb, 0x5b, 0x7b, 0x1b, 0x3b,
-                  0x6d, 0x4d, 0x2d, 0x0d, 0xed, 0xcd, 0xad, 0x8d, 0xae, 0x8e, 0xee, 0xce, 0x2e, 0x0e, 0x6e, 0x4e,
-                  0x28, 0x08, 0x68, 0x48, 0xa8, 0x88, 0xe8, 0xc8, 0xeb, 0xcb, 0xab, 0x8b, 0x6b, 0x4b, 0x2b, 0x0b,
-                  0xe7, 0xc7, 0xa7, 0x87, 0x67, 0x47, 0x27, 0x07, 0x24, 0x04, 0x64, 0x44, 0xa4, 0x84, 0xe4, 0xc4,
-                  0xa2, 0x82, 0xe2, 0xc2, 0x22, 0x02, 0x62, 0x42, 0x61, 0x41, 0x21, 0x01, 0xe1, 0xc1, 0xa1, 0x81,
-                  0xba, 0x9a, 0xfa, 0xda, 0x3a, 0x1a, 0x7a, 0x5a, 0x79, 0x59, 0x39, 0x19, 0xf9, 0xd9, 0xb9, 0x99,
-                  0xff, 0xdf, 0xbf, 0x9f, 0x7f, 0x5f, 0x3f, 0x1f, 0x3c, 0x1c, 0x7c, 0x5c, 0xbc, 0x9c, 0xfc, 0xdc,
-                  0x30, 0x10, 0x70, 0x50, 0xb0, 0x90, 0xf0, 0xd0, 0xf3, 0xd3, 0xb3, 0x93, 0x73, 0x53, 0x33, 0x13,
-                  0x75, 0x55, 0x35, 0x15, 0xf5, 0xd5, 0xb5, 0x95, 0xb6, 0x96, 0xf6, 0xd6, 0x36, 0x16, 0x76, 0x56,
-              ), (
-                  0x00, 0x94, 0xeb, 0x7f, 0x15, 0x81, 0xfe, 0x6a, 0x2a, 0xbe, 0xc1, 0x55, 0x3f, 0xab, 0xd4, 0x40,
-                  0x54, 0xc0, 0xbf, 0x2b, 0x41, 0xd5, 0xaa, 0x3e, 0x7e, 0xea, 0x95, 0x01, 0x6b, 0xff, 0x80, 0x14,
-                  0xa8, 0x3c, 0x43, 0xd7, 0xbd, 0x29, 0x56, 0xc2, 0x82, 0x16, 0x69, 0xfd, 0x97, 0x03, 0x7c, 0xe8,
-                  0xfc, 0x68, 0x17, 0x83, 0xe9, 0x7d, 0x02, 0x96, 0xd6, 0x42, 0x3d, 0xa9, 0xc3, 0x57, 0x28, 0xbc,
-                  0x93, 0x07, 0x78, 0xec, 0x86, 0x12, 0x6d, 0xf9, 0xb9, 0x2d, 0x52, 0xc6, 0xac, 0x38, 0x47, 0xd3,
-                  0xc7, 0x53, 0x2c, 0xb8, 0xd2, 0x46, 0x39, 0xad, 0xed, 0x79, 0x06, 0x92, 0xf8, 0x6c, 0x13, 0x87,
-                  0x3b, 0xaf, 0xd0, 0x44, 0x2e, 0xba, 0xc5, 0x51, 0x11, 0x85, 0xfa, 0x6e, 0x04, 0x90, 0xef, 0x7b,
-                  0x6f, 0xfb, 0x84, 0x10, 0x7a, 0xee, 0x91, 0x05, 0x45, 0xd1, 0xae, 0x3a, 0x50, 0xc4, 0xbb, 0x2f,
-                  0xe5, 0x71, 0x0e, 0x9a, 0xf0, 0x64, 0x1b, 0x8f, 0xcf, 0x5b, 0x24, 0xb0, 0xda, 0x4e, 0x31, 0xa5,
-                  0xb1, 0x25, 0x5a, 0xce, 0xa4, 0x30, 0x4f, 0xdb, 0x9b, 0x0f, 0x70, 0xe4, 0x8e, 0x1a, 0x65, 0xf1,
-                  0x4d, 0xd9, 0xa6, 0x32, 0x58, 0xcc, 0xb3, 0x27, 0x67, 0xf3, 0x8c, 0x18, 0x72, 0xe6, 0x99, 0x0d,
-                  0x19, 0x8d, 0xf2, 0x66, 0x0c, 0x98, 0xe7, 0x73, 0x33, 0xa7, 0xd8, 0x4c, 0x26, 0xb2, 0xcd, 0x59,
-                  0x76, 0xe2, 0x9d, 0x09, 0x63, 0xf7, 0x88, 0x1c, 0x5c, 0xc8, 0xb7, 0x23, 0x49, 0xdd, 0xa2, 0x36,
-                  0x22, 0xb6, 0xc9, 0x5d, 0x37, 0xa3, 0xdc, 0x48, 0x08, 0x9c, 0xe3, 0x77, 0x1d, 0x89, 0xf6, 0x62,
-                  0xde, 0x4a, 0x35, 0xa1, 0xcb, 0x5f, 0x20, 0xb4, 0xf4, 0x60, 0x1f, 0x8b, 0xe1, 0x75, 0x0a, 0x9e,
-                  0x8a, 0x1e, 0x61, 0xf5, 0x9f, 0x0b, 0x74, 0xe0, 0xa0, 0x34, 0x4b, 0xdf, 0xb5, 0x21, 0x5e, 0xca,
-              ))
-_S_BOX_KUZNECHIK: tuple = (
-    0xfc, 0xee, 0xdd, 0x11, 0xcf, 0x6e, 0x31, 0x16,
-    0xfb, 0xc4, 0xfa, 0xda, 0x23, 0xc5, 0x04, 0x4d,
-    0xe9, 0x77, 0xf0, 0xdb, 0x93, 0x2e, 0x99, 0xba,
-    0x17, 0x36, 0xf1, 0xbb, 0x14, 0xcd, 0x5f, 0xc1,
-    0xf9, 0x18, 0x65, 0x5a, 0xe2, 0x5c, 0xef, 0x21,
-    0x81, 0x1c, 0x3c, 0x42, 0x8b, 0x01, 0x8e, 0x4f,
-    0x05, 0x84, 0x02, 0xae, 0xe3, 0x6a, 0x8f, 0xa0,
-    0x06, 0x0b, 0xed, 0x98, 0x7f, 0xd4, 0xd3, 0x1f,
-    0xeb, 0x34, 0x2c, 0x51, 0xea, 0xc8, 0x48, 0xab,
-    0xf2, 0x2a, 0x68, 0xa2, 0xfd, 0x3a, 0xce, 0xcc,
-    0xb5, 0x70, 0x0e, 0x56, 0x08, 0x0c, 0x76, 0x12,
-    0xbf, 0x72, 0x13, 0x47, 0x9c, 0xb7, 0x5d, 0x87,
-    0x15, 0xa1, 0x96, 0x29, 0x10, 0x7b, 0x9a, 0xc7,
-    0xf3, 0x91, 0x78, 0x6f, 0x9d, 0x9e, 0xb2, 0xb1,
-    0x32, 0x75, 0x19, 0x3d, 0xff, 0x35, 0x8a, 0x7e,
-    0x6d, 0x54, 0xc6, 0x80, 0xc3, 0xbd, 0x0d, 0x57,
-    0xdf, 0xf5, 0x24, 0xa9, 0x3e, 0xa8, 0x43, 0xc9,
-    0xd7, 0x79, 0xd6, 0xf6, 0x7c, 0x22, 0xb9, 0x03,
-    0xe0, 0x0f, 0xec, 0xde, 0x7a, 0x94, 0xb0, 0xbc,
-    0xdc, 0xe8, 0x28, 0x50, 0x4e, 0x33, 0x0a, 0x4a,
-    0xa7, 0x97, 0x60, 0x73, 0x1e, 0x00, 0x62, 0x44,
-    0x1a, 0xb8, 0x38, 0x82, 0x64, 0x9f, 0x26, 0x41,
-    0xad, 0x45, 0x46, 0x92, 0x27, 0x5e, 0x55, 0x2f,
-    0x8c, 0xa3, 0xa5, 0x7d, 0x69, 0xd5, 0x95, 0x3b,
-    0x07, 0x58, 0xb3, 0x40, 0x86, 0xac, 0x1d, 0xf7,
-    0x30, 0x37, 0x6b, 0xe4, 0x88, 0xd9, 0xe7, 0x89,
-    0xe1, 0x1b, 0x83, 0x49, 0x4c, 0x3f, 0xf8, 0xfe,
-    0x8d, 0x53, 0xaa, 0x90, 0xca, 0xd8, 0x85, 0x61,
-    0x20, 0x71, 0x67, 0xa4, 0x2d, 0x2b, 0x09, 0x5b,
-    0xcb, 0x9b, 0x25, 0xd0, 0xbe, 0xe5, 0x6c, 0x52,
-    0x59, 0xa6, 0x74, 0xd2, 0xe6, 0xf4, 0xb4, 0xc0,
-    0xd1, 0x66, 0xaf, 0xc2, 0x39, 0x4b, 0x63, 0xb6,
-)
-_S_BOX_REVERSE_KUZNECHIK: tuple = (
-    0xa5, 0x2d, 0x32, 0x8f, 0x0e, 0x30, 0x38, 0xc0,
-    0x54, 0xe6, 0x9e, 0x39, 0x55, 0x7e, 0x52, 0x91,
-    0x64, 0x03, 0x57, 0x5a, 0x1c, 0x60, 0x07, 0x18,
-    0x21, 0x72, 0xa8, 0xd1, 0x29, 0xc6, 0xa4, 0x3f,
-    0xe0, 0x27, 0x8d, 0x0c, 0x82, 0xea, 0xae, 0xb4,
-    0x9a, 0x63, 0x49, 0xe5, 0x42, 0xe4, 0x15, 0xb7,
-    0xc8, 0x06, 0x70, 0x9d, 0x41, 0x75, 0x19, 0xc9,
-    0xaa, 0xfc, 0x4d, 0xbf, 0x2a, 0x73, 0x84, 0xd5,
-    0xc3, 0xaf, 0x2b, 0x86, 0xa7, 0xb1, 0xb2, 0x5b,
-    0x46, 0xd3, 0x9f, 0xfd, 0xd4, 0x0f, 0x9c, 0x2f,
-    0x9b, 0x43, 0xef, 0xd9, 0x79, 0xb6, 0x53, 0x7f,
-    0xc1, 0xf0, 0x23, 0xe7, 0x25, 0x5e, 0xb5, 0x1e,
-    0xa2, 0xdf, 0xa6, 0xfe, 0xac, 0x22, 0xf9, 0xe2,
-    0x4a, 0xbc, 0x35, 0xca, 0xee, 0x78, 0x05, 0x6b,
-    0x51, 0xe1, 0x59, 0xa3, 0xf2, 0x71, 0x56, 0x11,
-    0x6a, 0x89, 0x94, 0x65, 0x8c, 0xbb, 0x77, 0x3c,
-    0x7b, 0x28, 0xab, 0xd2, 0x31, 0xde, 0xc4, 0x5f,
-    0xcc, 0xcf, 0x76, 0x2c, 0xb8, 0xd8, 0x2e, 0x36,
-    0xdb, 0x69, 0xb3, 0x14, 0x95, 0xbe, 0x62, 0xa1,
-    0x3b, 0x16, 0x66, 0xe9, 0x5c, 0x6c, 0x6d, 0xad,
-    0x37, 0x61, 0x4b, 0xb9, 0xe3, 0xba, 0xf1, 0xa0,
-    0x85, 0x83, 0xda, 0x47, 0xc5, 0xb0, 0x33, 0xfa,
-    0x96, 0x6f, 0x6e, 0xc2, 0xf6, 0x50, 0xff, 0x5d,
-    0xa9, 0x8e, 0x17, 0x1b, 0x97, 0x7d, 0xec, 0x58,
-    0xf7, 0x1f, 0xfb, 0x7c, 0x09, 0x0d, 0x7a, 0x67,
-    0x45, 0x87, 0xdc, 0xe8, 0x4f, 0x1d, 0x4e, 0x04,
-    0xeb, 0xf8, 0xf3, 0x3e, 0x3d, 0xbd, 0x8a, 0x88,
-    0xdd, 0xcd, 0x0b, 0x13, 0x98, 0x02, 0x93, 0x80,
-    0x90, 0xd0, 0x24, 0x34, 0xcb, 0xed, 0xf4, 0xce,
-    0x99, 0x10, 0x44, 0x40, 0x92, 0x3a, 0x01, 0x26,
-    0x12, 0x1a, 0x48, 0x68, 0xf5, 0x81, 0x8b, 0xc7,
-    0xd6, 0x20, 0x0a, 0x08, 0x00, 0x4c, 0xd7, 0x74,
-)
-
-# fmt: on
+# fmt: off
+
+_BLOCK_SIZE_KUZNECHIK: int = 16
+_BLOCK_SIZE_MAGMA: int = 8
+_KEY_SIZE: int = 32
+_DEFAULT_IV_KUZNECHIK: bytearray = bytearray([
+    0x12, 0x34, 0x56, 0x78, 0x90, 0xab, 0xce, 0xf0,
+    0xa1, 0xb2, 0xc3, 0xd4, 0xe5, 0xf0, 0x01, 0x12,
+    0x23, 0x34, 0x45, 0x56, 0x67, 0x78, 0x89, 0x90,
+    0x12, 0x13, 0x14, 0x15, 0x16, 0x17, 0x18, 0x19,
+])
+# Multiplication tables in GF(2^8) by the coefficients of the linear
+# transformation l: _GF[i][x] = C_i * x
+_GF: tuple = (
+    bytes.fromhex(
+        "00 01 02 03 04 05 06 07 08 09 0a 0b 0c 0d 0e 0f"
+        "10 11 12 13 14 15 16 17 18 19 1a 1b 1c 1d 1e 1f"
+        "20 21 22 23 24 25 26 27 28 29 2a 2b 2c 2d 2e 2f"
+        "30 31 32 33 34 35 36 37 38 39 3a 3b 3c 3d 3e 3f"
+        "40 41 42 43 44 45 46 47 48 49 4a 4b 4c 4d 4e 4f"
+        "50 51 52 53 54 55 56 57 58 59 5a 5b 5c 5d 5e 5f"
+        "60 61 62 63 64 65 66 67 68 69 6a 6b 6c 6d 6e 6f"
+        "70 71 72 73 74 75 76 77 78 79 7a 7b 7c 7d 7e 7f"
+        "80 81 82 83 84 85 86 87 88 89 8a 8b 8c 8d 8e 8f"
+        "90 91 92 93 94 95 96 97 98 99 9a 9b 9c 9d 9e 9f"
+        "a0 a1 a2 a3 a4 a5 a6 a7 a8 a9 aa ab ac ad ae af"
+        "b0 b1 b2 b3 b4 b5 b6 b7 b8 b9 ba bb bc bd be bf"
+        "c0 c1 c2 c3 c4 c5 c6 c7 c8 c9 ca cb cc cd ce cf"
+        "d0 d1 d2 d3 d4 d5 d6 d7 d8 d9 da db dc dd de df"
+        "e0 e1 e2 e3 e4 e5 e6 e7 e8 e9 ea eb ec ed ee ef"
+        "f0 f1 f2 f3 f4 f5 f6 f7 f8 f9 fa fb fc fd fe ff"
+    ),
+    bytes.fromhex(
+        "00 94 eb 7f 15 81 fe 6a 2a be c1 55 3f ab d4 40"
+        "54 c0 bf 2b 41 d5 aa 3e 7e ea 95 01 6b ff 80 14"
+        "a8 3c 43 d7 bd 29 56 c2 82 16 69 fd 97 03 7c e8"
+        "fc 68 17 83 e9 7d 02 96 d6 42 3d a9 c3 57 28 bc"
+        "93 07 78 ec 86 12 6d f9 b9 2d 52 c6 ac 38 47 d3"
+        "c7 53 2c b8 d2 46 39 ad ed 79 06 92 f8 6c 13 87"
+        "3b af d0 44 2e ba c5 51 11 85 fa 6e 04 90 ef 7b"
+        "6f fb 84 10 7a ee 91 05 45 d1 ae 3a 50 c4 bb 2f"
+        "e5 71 0e 9a f0 64 1b 8f cf 5b 24 b0 da 4e 31 a5"
+        "b1 25 5a ce a4 30 4f db 9b 0f 70 e4 8e 1a 65 f1"
+        "4d d9 a6 32 58 cc b3 27 67 f3 8c 18 72 e6 99 0d"
+        "19 8d f2 66 0c 98 e7 73 33 a7 d8 4c 26 b2 cd 59"
+        "76 e2 9d 09 63 f7 88 1c 5c c8 b7 23 49 dd a2 36"
+        "22 b6 c9 5d 37 a3 dc 48 08 9c e3 77 1d 89 f6 62"
+        "de 4a 35 a1 cb 5f 20 b4 f4 60 1f 8b e1 75 0a 9e"
+        "8a 1e 61 f5 9f 0b 74 e0 a0 34 4b df b5 21 5e ca"
+    ),
+    bytes.fromhex(
+        "00 20 40 60 80 a0 c0 e0 c3 e3 83 a3 43 63 03 23"
+        "45 65 05 25 c5 e5 85 a5 86 a6 c6 e6 06 26 46 66"
+        "8a aa ca ea 0a 2a 4a 6a 49 69 09 29 c9 e9 89 a9"
+        "cf ef 8f af 4f 6f 0f 2f 0c 2c 4c 6c 8c ac cc ec"
+        "d7 f7 97 b7 57 77 17 37 14 34 54 74 94 b4 d4 f4"
+        "92 b2 d2 f2 12 32 52 72 51 71 11 31 d1 f1 91 b1"
+        "5d 7d 1d 3d dd fd 9d bd 9e be de fe 1e 3e 5e 7e"
+        "18 38 58 78 98 b8 d8 f8 db fb 9b bb 5b 7b 1b 3b"
+        "6d 4d 2d 0d ed cd ad 8d ae 8e ee ce 2e 0e 6e 4e"
+        "28 08 68 48 a8 88 e8 c8 eb cb ab 8b 6b 4b 2b 0b"
+        "e7 c7 a7 87 67 47 27 07 24 04 64 44 a4 84 e4 c4"
+        "a2 82 e2 c2 22 02 62 42 61 41 21 01 e1 c1 a1 81"
+        "ba 9a fa da 3a 1a 7a 5a 79 59 39 19 f9 d9 b9 99"
+        "ff df bf 9f 7f 5f 3f 1f 3c 1c 7c 5c bc 9c fc dc"
+        "30 10 70 50 b0 90 f0 d0 f3 d3 b3 93 73 53 33 13"
+        "75 55 35 15 f5 d5 b5 95 b6 96 f6 d6 36 16 76 56"
+    ),
+    bytes.fromhex(
+        "00 85 c9 4c 51 d4 98 1d a2 27 6b ee f3 76 3a bf"
+        "87 02 4e cb d6 53 1f 9a 25 a0 ec 69 74 f1 bd 38"
+        "cd 48 04 81 9c 19 55 d0 6f ea a6 23 3e bb f7 72"
+        "4a cf 83 06 1b 9e d2 57 e8 6d 21 a4 b9 3c 70 f5"
+        "59 dc 90 15 08 8d c1 44 fb 7e 32 b7 aa 2f 63 e6"
+        "de 5b 17 92 8f 0a 46 c3 7c f9 b5 30 2d a8 e4 61"
+        "94 11 5d d8 c5 40 0c 89 36 b3 ff 7a 67 e2 ae 2b"
+        "13 96 da 5f 42 c7 8b 0e b1 34 78 fd e0 65 29 ac"
+        "b2 37 7b fe e3 66 2a af 10 95 d9 5c 41 c4 88 0d"
+        "35 b0 fc 79 64 e1 ad 28 97 12 5e db c6 43 0f 8a"
+        "7f fa b6 33 2e ab e7 62 dd 58 14 91 8c 09 45 c0"
+        "f8 7d 31 b4 a9 2c 60 e5 5a df 93 16 0b 8e c2 47"
+        "eb 6e 22 a7 ba 3f 73 f6 49 cc 80 05 18 9d d1 54"
+        "6c e9 a5 20 3d b8 f4 71 ce 4b 07 82 9f 1a 56 d3"
+        "26 a3 ef 6a 77 f2 be 3b 84 01 4d c8 d5 50 1c 99"
+        "a1 24 68 ed f0 75 39 bc 03 86 ca 4f 52 d7 9b 1e"
+    ),
+    bytes.fromhex(
+        "00 10 20 30 40 50 60 70 80 90 a0 b0 c0 d0 e0 f0"
+        "c3 d3 e3 f3 83 93 a3 b3 43 53 63 73 03 13 23 33"
+        "45 55 65 75 05 15 25 35 c5 d5 e5 f5 85 95 a5 b5"
+        "86 96 a6 b6 c6 d6 e6 f6 06 16 26 36 46 56 66 76"
+        "8a 9a aa ba ca da ea fa 0a 1a 2a 3a 4a 5a 6a 7a"
+        "49 59 69 79 09 19 29 39 c9 d9 e9 f9 89 99 a9 b9"
+        "cf df ef ff 8f 9f af bf 4f 5f 6f 7f 0f 1f 2f 3f"
+        "0c 1c 2c 3c 4c 5c 6c 7c 8c 9c ac bc cc dc ec fc"
+        "d7 c7 f7 e7 97 87 b7 a7 57 47 77 67 17 07 37 27"
+        "14 04 34 24 54 44 74 64 94 84 b4 a4 d4 c4 f4 e4"
+        "92 82 b2 a2 d2 c2 f2 e2 12 02 32 22 52 42 72 62"
+        "51 41 71 61 11 01 31 21 d1 c1 f1 e1 91 81 b1 a1"
+        "5d 4d 7d 6d 1d 0d 3d 2d dd cd fd ed 9d 8d bd ad"
+        "9e 8e be ae de ce fe ee 1e 0e 3e 2e 5e 4e 7e 6e"
+        "18 08 38 28 58 48 78 68 98 88 b8 a8 d8 c8 f8 e8"
+        "db cb fb eb 9b 8b bb ab 5b 4b 7b 6b 1b 0b 3b 2b"
+    ),
+    bytes.fromhex(
+        "00 c2 47 85 8e 4c c9 0b df 1d 98 5a 51 93 16 d4"
+        "7d bf 3a f8 f3 31 b4 76 a2 60 e5 27 2c ee 6b a9"
+        "fa 38 bd 7f 74 b6 33 f1 25 e7 62 a0 ab 69 ec 2e"
+        "87 45 c0 02 09 cb 4e 8c 58 9a 1f dd d6 14 91 53"
+        "37 f5 70 b2 b9 7b fe 3c e8 2a af 6d 66 a4 21 e3"
+        "4a 88 0d cf c4 06 83 41 95 57 d2 10 1b d9 5c 9e"
+        "cd 0f 8a 48 43 81 04 c6 12 d0 55 97 9c 5e db 19"
+        "b0 72 f7 35 3e fc 79 bb 6f ad 28 ea e1 23 a6 64"
+        "6e ac 29 eb e0 22 a7 65 b1 73 f6 34 3f fd 78 ba"
+        "13 d1 54 96 9d 5f da 18 cc 0e 8b 49 42 80 05 c7"
+        "94 56 d3 11 1a d8 5d 9f 4b 89 0c ce c5 07 82 40"
+        "e9 2b ae 6c 67 a5 20 e2 36 f4 71 b3 b8 7a ff 3d"
+        "59 9b 1e dc d7 15 90 52 86 44 c1 03 08 ca 4f 8d"
+        "24 e6 63 a1 aa 68 ed 2f fb 39 bc 7e 75 b7 32 f0"
+        "a3 61 e4 26 2d ef 6a a8 7c be 3b f9 f2 30 b5 77"
+        "de 1c 99 5b 50 92 17 d5 01 c3 46 84 8f 4d c8 0a"
+    ),
+    bytes.fromhex(
+        "00 c0 43 83 86 46 c5 05 cf 0f 8c 4c 49 89 0a ca"
+        "5d 9d 1e de db 1b 98 58 92 52 d1 11 14 d4 57 97"
+        "ba 7a f9 39 3c fc 7f bf 75 b5 36 f6 f3 33 b0 70"
+        "e7 27 a4 64 61 a1 22 e2 28 e8 6b ab ae 6e ed 2d"
+        "b7 77 f4 34 31 f1 72 b2 78 b8 3b fb fe 3e bd 7d"
+        "ea 2a a9 69 6c ac 2f ef 25 e5 66 a6 a3 63 e0 20"
+        "0d cd 4e 8e 8b 4b c8 08 c2 02 81 41 44 84 07 c7"
+        "50 90 13 d3 d6 16 95 55 9f 5f dc 1c 19 d9 5a 9a"
+        "ad 6d ee 2e 2b eb 68 a8 62 a2 21 e1 e4 24 a7 67"
+        "f0 30 b3 73 76 b6 35 f5 3f ff 7c bc b9 79 fa 3a"
+        "17 d7 54 94 91 51 d2 12 d8 18 9b 5b 5e 9e 1d dd"
+        "4a 8a 09 c9 cc 0c 8f 4f 85 45 c6 06 03 c3 40 80"
+        "1a da 59 99 9c 5c df 1f d5 15 96 56 53 93 10 d0"
+        "47 87 04 c4 c1 01 82 42 88 48 cb 0b 0e ce 4d 8d"
+        "a0 60 e3 23 26 e6 65 a5 6f af 2c ec e9 29 aa 6a"
+        "fd 3d be 7e 7b bb 38 f8 32 f2 71 b1 b4 74 f7 37"
+    ),
+    bytes.fromhex(
+        "00 01 02 03 04 05 06 07 08 09 0a 0b 0c 0d 0e 0f"
+        "10 11 12 13 14 15 16 17 18 19 1a 1b 1c 1d 1e 1f"
+        "20 21 22 23 24 25 26 27 28 29 2a 2b 2c 2d 2e 2f"
+        "30 31 32 33 34 35 36 37 38 39 3a 3b 3c 3d 3e 3f"
+        "40 41 42 43 44 45 46 47 48 49 4a 4b 4c 4d 4e 4f"
+        "50 51 52 53 54 55 56 57 58 59 5a 5b 5c 5d 5e 5f"
+        "60 61 62 63 64 65 66 67 68 69 6a 6b 6c 6d 6e 6f"
+        "70 71 72 73 74 75 76 77 78 79 7a 7b 7c 7d 7e 7f"
+        "80 81 82 83 84 85 86 87 88 89 8a 8b 8c 8d 8e 8f"
+        "90 91 92 93 94 95 96 97 98 99 9a 9b 9c 9d 9e 9f"
+        "a0 a1 a2 a3 a4 a5 a6 a7 a8 a9 aa ab ac ad ae af"
+        "b0 b1 b2 b3 b4 b5 b6 b7 b8 b9 ba bb bc bd be bf"
+        "c0 c1 c2 c3 c4 c5 c6 c7 c8 c9 ca cb cc cd ce cf"
+        "d0 d1 d2 d3 d4 d5 d6 d7 d8 d9 da db dc dd de df"
+        "e0 e1 e2 e3 e4 e5 e6 e7 e8 e9 ea eb ec ed ee ef"
+        "f0 f1 f2 f3 f4 f5 f6 f7 f8 f9 fa fb fc fd fe ff"
+    ),
+    bytes.fromhex(
+        "00 fb 35 ce 6a 91 5f a4 d4 2f e1 1a be 45 8b 70"
+        "6b 90 5e a5 01 fa 34 cf bf 44 8a 71 d5 2e e0 1b"
+        "d6 2d e3 18 bc 47 89 72 02 f9 37 cc 68 93 5d a6"
+        "bd 46 88 73 d7 2c e2 19 69 92 5c a7 03 f8 36 cd"
+        "6f 94 5a a1 05 fe 30 cb bb 40 8e 75 d1 2a e4 1f"
+        "04 ff 31 ca 6e 95 5b a0 d0 2b e5 1e ba 41 8f 74"
+        "b9 42 8c 77 d3 28 e6 1d 6d 96 58 a3 07 fc 32 c9"
+        "d2 29 e7 1c b8 43 8d 76 06 fd 33 c8 6c 97 59 a2"
+        "de 25 eb 10 b4 4f 81 7a 0a f1 3f c4 60 9b 55 ae"
+        "b5 4e 80 7b df 24 ea 11 61 9a 54 af 0b f0 3e c5"
+        "08 f3 3d c6 62 99 57 ac dc 27 e9 12 b6 4d 83 78"
+        "63 98 56 ad 09 f2 3c c7 b7 4c 82 79 dd 26 e8 13"
+        "b1 4a 84 7f db 20 ee 15 65 9e 50 ab 0f f4 3a c1"
+        "da 21 ef 14 b0 4b 85 7e 0e f5 3b c0 64 9f 51 aa"
+        "67 9c 52 a9 0d f6 38 c3 b3 48 86 7d d9 22 ec 17"
+        "0c f7 39 c2 66 9d 53 a8 d8 23 ed 16 b2 49 87 7c"
+    ),
+    bytes.fromhex(
+        "00 01 02 03 04 05 06 07 08 09 0a 0b 0c 0d 0e 0f"
+        "10 11 12 13 14 15 16 17 18 19 1a 1b 1c 1d 1e 1f"
+        "20 21 22 23 24 25 26 27 28 29 2a 2b 2c 2d 2e 2f"
+        "30 31 32 33 34 35 36 37 38 39 3a 3b 3c 3d 3e 3f"
+        "40 41 42 43 44 45 46 47 48 49 4a 4b 4c 4d 4e 4f"
+        "50 51 52 53 54 55 56 57 58 59 5a 5b 5c 5d 5e 5f"
+        "60 61 62 63 64 65 66 67 68 69 6a 6b 6c 6d 6e 6f"
+        "70 71 72 73 74 75 76 77 78 79 7a 7b 7c 7d 7e 7f"
+        "80 81 82 83 84 85 86 87 88 89 8a 8b 8c 8d 8e 8f"
+        "90 91 92 93 94 95 96 97 98 99 9a 9b 9c 9d 9e 9f"
+        "a0 a1 a2 a3 a4 a5 a6 a7 a8 a9 aa ab ac ad ae af"
+        "b0 b1 b2 b3 b4 b5 b6 b7 b8 b9 ba bb bc bd be bf"
+        "c0 c1 c2 c3 c4 c5 c6 c7 c8 c9 ca cb cc cd ce cf"
+        "d0 d1 d2 d3 d4 d5 d6 d7 d8 d9 da db dc dd de df"
+        "e0 e1 e2 e3 e4 e5 e6 e7 e8 e9 ea eb ec ed ee ef"
+        "f0 f1 f2 f3 f4 f5 f6 f7 f8 f9 fa fb fc fd fe ff"
+    ),
+    bytes.fromhex(
+        "00 c0 43 83 86 46 c5 05 cf 0f 8c 4c 49 89 0a ca"
+        "5d 9d 1e de db 1b 98 58 92 52 d1 11 14 d4 57 97"
+        "ba 7a f9 39 3c fc 7f bf 75 b5 36 f6 f3 33 b0 70"
+        "e7 27 a4 64 61 a1 22 e2 28 e8 6b ab ae 6e ed 2d"
+        "b7 77 f4 34 31 f1 72 b2 78 b8 3b fb fe 3e bd 7d"
+        "ea 2a a9 69 6c ac 2f ef 25 e5 66 a6 a3 63 e0 20"
+        "0d cd 4e 8e 8b 4b c8 08 c2 02 81 41 44 84 07 c7"
+        "50 90 13 d3 d6 16 95 55 9f 5f dc 1c 19 d9 5a 9a"
+        "ad 6d ee 2e 2b eb 68 a8 62 a2 21 e1 e4 24 a7 67"
+        "f0 30 b3 73 76 b6 35 f5 3f ff 7c bc b9 79 fa 3a"
+        "17 d7 54 94 91 51 d2 12 d8 18 9b 5b 5e 9e 1d dd"
+        "4a 8a 09 c9 cc 0c 8f 4f 85 45 c6 06 03 c3 40 80"
+        "1a da 59 99 9c 5c df 1f d5 15 96 56 53 93 10 d0"
+        "47 87 04 c4 c1 01 82 42 88 48 cb 0b 0e ce 4d 8d"
+        "a0 60 e3 23 26 e6 65 a5 6f af 2c ec e9 29 aa 6a"
+        "fd 3d be 7e 7b bb 38 f8 32 f2 71 b1 b4 74 f7 37"
+    ),
+    bytes.fromhex(
+        "00 c2 47 85 8e 4c c9 0b df 1d 98 5a 51 93 16 d4"
+        "7d bf 3a f8 f3 31 b4 76 a2 60 e5 27 2c ee 6b a9"
+        "fa 38 bd 7f 74 b6 33 f1 25 e7 62 a0 ab 69 ec 2e"
+        "87 45 c0 02 09 cb 4e 8c 58 9a 1f dd d6 14 91 53"
+        "37 f5 70 b2 b9 7b fe 3c e8 2a af 6d 66 a4 21 e3"
+        "4a 88 0d cf c4 06 83 41 95 57 d2 10 1b d9 5c 9e"
+        "cd 0f 8a 48 43 81 04 c6 12 d0 55 97 9c 5e db 19"
+        "b0 72 f7 35 3e fc 79 bb 6f ad 28 ea e1 23 a6 64"
+        "6e ac 29 eb e0 22 a7 65 b1 73 f6 34 3f fd 78 ba"
+        "13 d1 54 96 9d 5f da 18 cc 0e 8b 49 42 80 05 c7"
+        "94 56 d3 11 1a d8 5d 9f 4b 89 0c ce c5 07 82 40"
+        "e9 2b ae 6c 67 a5 20 e2 36 f4 71 b3 b8 7a ff 3d"
+        "59 9b 1e dc d7 15 90 52 86 44 c1 03 08 ca 4f 8d"
+        "24 e6 63 a1 aa 68 ed 2f fb 39 bc 7e 75 b7 32 f0"
+        "a3 61 e4 26 2d ef 6a a8 7c be 3b f9 f2 30 b5 77"
+        "de 1c 99 5b 50 92 17 d5 01 c3 46 84 8f 4d c8 0a"
+    ),
+    bytes.fromhex(
+        "00 10 20 30 40 50 60 70 80 90 a0 b0 c0 d0 e0 f0"
+        "c3 d3 e3 f3 83 93 a3 b3 43 53 63 73 03 13 23 33"
+        "45 55 65 75 05 15 25 35 c5 d5 e5 f5 85 95 a5 b5"
+        "86 96 a6 b6 c6 d6 e6 f6 06 16 26 36 46 56 66 76"
+        "8a 9a aa ba ca da ea fa 0a 1a 2a 3a 4a 5a 6a 7a"
+        "49 59 69 79 09 19 29 39 c9 d9 e9 f9 89 99 a9 b9"
+        "cf df ef ff 8f 9f af bf 4f 5f 6f 7f 0f 1f 2f 3f"
+        "0c 1c 2c 3c 4c 5c 6c 7c 8c 9c ac bc cc dc ec fc"
+        "d7 c7 f7 e7 97 87 b7 a7 57 47 77 67 17 07 37 27"
+        "14 04 34 24 54 44 74 64 94 84 b4 a4 d4 c4 f4 e4"
+        "92 82 b2 a2 d2 c2 f2 e2 12 02 32 22 52 42 72 62"
+        "51 41 71 61 11 01 31 21 d1 c1 f1 e1 91 81 b1 a1"
+        "5d 4d 7d 6d 1d 0d 3d 2d dd cd fd ed 9d 8d bd ad"
+        "9e 8e be ae de ce fe ee 1e 0e 3e 2e 5e 4e 7e 6e"
+        "18 08 38 28 58 48 78 68 98 88 b8 a8 d8 c8 f8 e8"
+        "db cb fb eb 9b 8b bb ab 5b 4b 7b 6b 1b 0b 3b 2b"
+    ),
+    bytes.fromhex(
+        "00 85 c9 4c 51 d4 98 1d a2 27 6b ee f3 76 3a bf"
+        "87 02 4e cb d6 53 1f 9a 25 a0 ec 69 74 f1 bd 38"
+        "cd 48 04 81 9c 19 55 d0 6f ea a6 23 3e bb f7 72"
+        "4a cf 83 06 1b 9e d2 57 e8 6d 21 a4 b9 3c 70 f5"
+        "59 dc 90 15 08 8d c1 44 fb 7e 32 b7 aa 2f 63 e6"
+        "de 5b 17 92 8f 0a 46 c3 7c f9 b5 30 2d a8 e4 61"
+        "94 11 5d d8 c5 40 0c 89 36 b3 ff 7a 67 e2 ae 2b"
+        "13 96 da 5f 42 c7 8b 0e b1 34 78 fd e0 65 29 ac"
+        "b2 37 7b fe e3 66 2a af 10 95 d9 5c 41 c4 88 0d"
+        "35 b0 fc 79 64 e1 ad 28 97 12 5e db c6 43 0f 8a"
+        "7f fa b6 33 2e ab e7 62 dd 58 14 91 8c 09 45 c0"
+        "f8 7d 31 b4 a9 2c 60 e5 5a df 93 16 0b 8e c2 47"
+        "eb 6e 22 a7 ba 3f 73 f6 49 cc 80 05 18 9d d1 54"
+        "6c e9 a5 20 3d b8 f4 71 ce 4b 07 82 9f 1a 56 d3"
+        "26 a3 ef 6a 77 f2 be 3b 84 01 4d c8 d5 50 1c 99"
+        "a1 24 68 ed f0 75 39 bc 03 86 ca 4f 52 d7 9b 1e"
+    ),
+    bytes.fromhex(
+        "00 20 40 60 80 a0 c0 e0 c3 e3 83 a3 43 63 03 23"
+        "45 65 05 25 c5 e5 85 a5 86 a6 c6 e6 06 26 46 66"
+        "8a aa ca ea 0a 2a 4a 6a 49 69 09 29 c9 e9 89 a9"
+        "cf ef 8f af 4f 6f 0f 2f 0c 2c 4c 6c 8c ac cc ec"
+        "d7 f7 97 b7 57 77 17 37 14 34 54 74 94 b4 d4 f4"
+        "92 b2 d2 f2 12 32 52 72 51 71 11 31 d1 f1 91 b1"
+        "5d 7d 1d 3d dd fd 9d bd 9e be de fe 1e 3e 5e 7e"
+        "18 38 58 78 98 b8 d8 f8 db fb 9b bb 5b 7b 1b 3b"
+        "6d 4d 2d 0d ed cd ad 8d ae 8e ee ce 2e 0e 6e 4e"
+        "28 08 68 48 a8 88 e8 c8 eb cb ab 8b 6b 4b 2b 0b"
+        "e7 c7 a7 87 67 47 27 07 24 04 64 44 a4 84 e4 c4"
+        "a2 82 e2 c2 22 02 62 42 61 41 21 01 e1 c1 a1 81"
+        "ba 9a fa da 3a 1a 7a 5a 79 59 39 19 f9 d9 b9 99"
+        "ff df bf 9f 7f 5f 3f 1f 3c 1c 7c 5c bc 9c fc dc"
+        "30 10 70 50 b0 90 f0 d0 f3 d3 b3 93 73 53 33 13"
+        "75 55 35 15 f5 d5 b5 95 b6 96 f6 d6 36 16 76 56"
+    ),
+    bytes.fromhex(
+        "00 94 eb 7f 15 81 fe 6a 2a be c1 55 3f ab d4 40"
+        "54 c0 bf 2b 41 d5 aa 3e 7e ea 95 01 6b ff 80 14"
+        "a8 3c 43 d7 bd 29 56 c2 82 16 69 fd 97 03 7c e8"
+        "fc 68 17 83 e9 7d 02 96 d6 42 3d a9 c3 57 28 bc"
+        "93 07 78 ec 86 12 6d f9 b9 2d 52 c6 ac 38 47 d3"
+        "c7 53 2c b8 d2 46 39 ad ed 79 06 92 f8 6c 13 87"
+        "3b af d0 44 2e ba c5 51 11 85 fa 6e 04 90 ef 7b"
+        "6f fb 84 10 7a ee 91 05 45 d1 ae 3a 50 c4 bb 2f"
+        "e5 71 0e 9a f0 64 1b 8f cf 5b 24 b0 da 4e 31 a5"
+        "b1 25 5a ce a4 30 4f db 9b 0f 70 e4 8e 1a 65 f1"
+        "4d d9 a6 32 58 cc b3 27 67 f3 8c 18 72 e6 99 0d"
+        "19 8d f2 66 0c 98 e7 73 33 a7 d8 4c 26 b2 cd 59"
+        "76 e2 9d 09 63 f7 88 1c 5c c8 b7 23 49 dd a2 36"
+        "22 b6 c9 5d 37 a3 dc 48 08 9c e3 77 1d 89 f6 62"
+        "de 4a 35 a1 cb 5f 20 b4 f4 60 1f 8b e1 75 0a 9e"
+        "8a 1e 61 f5 9f 0b 74 e0 a0 34 4b df b5 21 5e ca"
+    ),
+)
+_S_BOX_KUZNECHIK: bytes = bytes.fromhex(
+    "fc ee dd 11 cf 6e 31 16 fb c4 fa da 23 c5 04 4d"
+    "e9 77 f0 db 93 2e 99 ba 17 36 f1 bb 14 cd 5f c1"
+    "f9 18 65 5a e2 5c ef 21 81 1c 3c 42 8b 01 8e 4f"
+    "05 84 02 ae e3 6a 8f a0 06 0b ed 98 7f d4 d3 1f"
+    "eb 34 2c 51 ea c8 48 ab f2 2a 68 a2 fd 3a ce cc"
+    "b5 70 0e 56 08 0c 76 12 bf 72 13 47 9c b7 5d 87"
+    "15 a1 96 29 10 7b 9a c7 f3 91 78 6f 9d 9e b2 b1"
+    "32 75 19 3d ff 35 8a 7e 6d 54 c6 80 c3 bd 0d 57"
+    "df f5 24 a9 3e a8 43 c9 d7 79 d6 f6 7c 22 b9 03"
+    "e0 0f ec de 7a 94 b0 bc dc e8 28 50 4e 33 0a 4a"
+    "a7 97 60 73 1e 00 62 44 1a b8 38 82 64 9f 26 41"
+    "ad 45 46 92 27 5e 55 2f 8c a3 a5 7d 69 d5 95 3b"
+    "07 58 b3 40 86 ac 1d f7 30 37 6b e4 88 d9 e7 89"
+    "e1 1b 83 49 4c 3f f8 fe 8d 53 aa 90 ca d8 85 61"
+    "20 71 67 a4 2d 2b 09 5b cb 9b 25 d0 be e5 6c 52"
+    "59 a6 74 d2 e6 f4 b4 c0 d1 66 af c2 39 4b 63 b6"
+)
+_S_BOX_REVERSE_KUZNECHIK: bytes = bytes.fromhex(
+    "a5 2d 32 8f 0e 30 38 c0 54 e6 9e 39 55 7e 52 91"
+    "64 03 57 5a 1c 60 07 18 21 72 a8 d1 29 c6 a4 3f"
+    "e0 27 8d 0c 82 ea ae b4 9a 63 49 e5 42 e4 15 b7"
+    "c8 06 70 9d 41 75 19 c9 aa fc 4d bf 2a 73 84 d5"
+    "c3 af 2b 86 a7 b1 b2 5b 46 d3 9f fd d4 0f 9c 2f"
+    "9b 43 ef d9 79 b6 53 7f c1 f0 23 e7 25 5e b5 1e"
+    "a2 df a6 fe ac 22 f9 e2 4a bc 35 ca ee 78 05 6b"
+    "51 e1 59 a3 f2 71 56 11 6a 89 94 65 8c bb 77 3c"
+    "7b 28 ab d2 31 de c4 5f cc cf 76 2c b8 d8 2e 36"
+    "db 69 b3 14 95 be 62 a1 3b 16 66 e9 5c 6c 6d ad"
+    "37 61 4b b9 e3 ba f1 a0 85 83 da 47 c5 b0 33 fa"
+    "96 6f 6e c2 f6 50 ff 5d a9 8e 17 1b 97 7d ec 58"
+    "f7 1f fb 7c 09 0d 7a 67 45 87 dc e8 4f 1d 4e 04"
+    "eb f8 f3 3e 3d bd 8a 88 dd cd 0b 13 98 02 93 80"
+    "90 d0 24 34 cb ed f4 ce 99 10 44 40 92 3a 01 26"
+    "12 1a 48 68 f5 81 8b c7 d6 20 0a 08 00 4c d7 74"
+)
+# Images L(x) of the 128 unit vectors of the block (byte 0..15, bit 0..7,
+# 16 bytes each), from which the lookup tables of L are assembled
+_L_BASIS_KUZNECHIK: bytes = bytes.fromhex(
+    "cf 6e a2 76 72 6c 48 7a b8 5d 27 bd 10 dd 84 94"
+    "5d dc 87 ec e4 d8 90 f4 b3 ba 4e b9 20 79 cb eb"
+    "ba 7b cd 1b 0b 73 e3 2b a5 b7 9c b1 40 f2 55 15"
+    "b7 f6 59 36 16 e6 05 56 89 ad fb a1 80 27 aa 2a"
+    "ad 2f b2 6c 2c 0f 0a ac d1 99 35 81 c3 4e 97 54"
+    "99 5e a7 d8 58 1e 14 9b 61 f1 6a c1 45 9c ed a8"
+    "f1 bc 8d 73 b0 3c 28 f5 c2 21 d4 41 8a fb 19 93"
+    "21 bb d9 e6 a3 78 50 29 47 42 6b 82 d7 35 32 e5"
+    "98 20 c8 33 f2 76 d5 e6 49 d4 9f 95 e9 99 2d 20"
+    "f3 40 53 66 27 ec 69 0f 92 6b fd e9 11 f1 5a 40"
+    "25 80 a6 cc 4e 1b d2 1e e7 d6 39 11 22 21 b4 80"
+    "4a c3 8f 5b 9c 36 67 3c 0d 6f 72 22 44 42 ab c3"
+    "94 45 dd b6 fb 6c ce 78 1a de e4 44 88 84 95 45"
+    "eb 8a 79 af 35 d8 5f f0 34 7f 0b 88 d3 cb e9 8a"
+    "15 d7 f2 9d 6a 73 be 23 68 fe 16 d3 65 55 11 d7"
+    "2a 6d 27 f9 d4 e6 bf 46 d0 3f 2c 65 ca aa 22 6d"
+    "74 c6 87 10 6b ec 62 4e 87 b8 be 5e d0 75 74 85"
+    "e8 4f cd 20 d6 1b c4 9c cd b3 bf bc 63 ea e8 c9"
+    "13 9e 59 40 6f 36 4b fb 59 a5 bd bb c6 17 13 51"
+    "26 ff b2 80 de 6c 96 35 b2 89 b9 b5 4f 2e 26 a2"
+    "4c 3d a7 c3 7f d8 ef 6a a7 d1 b1 a9 9e 5c 4c 87"
+    "98 7a 8d 45 fe 73 1d d4 8d 61 a1 91 ff b8 98 cd"
+    "f3 f4 d9 8a 3f e6 3a 6b d9 c2 81 e1 3d b3 f3 59"
+    "25 2b 71 d7 7e 0f 74 d6 71 47 c1 01 7a a5 25 b2"
+    "bf da 70 0c ca 0c 17 1a 14 2f 68 30 d9 ca 96 10"
+    "bd 77 e0 18 57 18 2e 34 28 5e d0 60 71 57 ef 20"
+    "b9 ee 03 30 ae 30 5c 68 50 bc 63 c0 e2 ae 1d 40"
+    "b1 1f 06 60 9f 60 b8 d0 a0 bb c6 43 07 9f 3a 80"
+    "a1 3e 0c c0 fd c0 b3 63 83 b5 4f 86 0e fd 74 c3"
+    "81 7c 18 43 39 43 a5 c6 c5 a9 9e cf 1c 39 e8 45"
+    "c1 f8 30 86 72 86 89 4f 49 91 ff 5d 38 72 13 8a"
+    "41 33 60 cf e4 cf d1 9e 92 e1 3d ba 70 e4 26 d7"
+    "93 90 68 1c 20 c5 06 bb cb 8d 1a e9 f3 97 5d c2"
+    "e5 e3 d0 38 40 49 0c b5 55 d9 34 11 25 ed ba 47"
+    "09 05 63 70 80 92 18 a9 aa 71 68 22 4a 19 b7 8e"
+    "12 0a c6 e0 c3 e7 30 91 97 e2 d0 44 94 32 ad df"
+    "24 14 4f 03 45 0d 60 e1 ed 07 63 88 eb 64 99 7d"
+    "48 28 9e 06 8a 1a c0 01 19 0e c6 d3 15 c8 f1 fa"
+    "90 50 ff 0c d7 34 43 02 32 1c 4f 65 2a 53 21 37"
+    "e3 a0 3d 18 6d 68 86 04 64 38 9e ca 54 a6 42 6e"
+    "8e 48 43 11 eb bc 2d 2e 8d 12 7c 60 94 44 77 c0"
+    "df 90 86 22 15 bb 5a 5c d9 24 f8 c0 eb 88 ee 43"
+    "7d e3 cf 44 2a b5 b4 b8 71 48 33 43 15 d3 1f 86"
+    "fa 05 5d 88 54 a9 ab b3 e2 90 66 86 2a 65 3e cf"
+    "37 0a ba d3 a8 91 95 a5 07 e3 cc cf 54 ca 7c 5d"
+    "6e 14 b7 65 93 e1 e9 89 0e 05 5b 5d a8 57 f8 ba"
+    "dc 28 ad ca e5 01 11 d1 1c 0a b6 ba 93 ae 33 b7"
+    "7b 50 99 57 09 02 22 61 38 14 af b7 e5 9f 66 ad"
+    "f2 89 1c d6 02 af c4 f1 ab ee ad bf 3d 5a 6f 01"
+    "27 d1 38 6f 04 9d 4b 21 95 1f 99 bd 7a b4 de 02"
+    "4e 61 70 de 08 f9 96 42 e9 3e f1 b9 f4 ab 7f 04"
+    "9c c2 e0 7f 10 31 ef 84 11 7c 21 b1 2b 95 fe 08"
+    "fb 47 03 fe 20 62 1d cb 22 f8 42 a1 56 e9 3f 10"
+    "35 8e 06 3f 40 c4 3a 55 44 33 84 81 ac 11 7e 20"
+    "6a df 0c 7e 80 4b 74 aa 88 66 cb c1 9b 22 fc 40"
+    "d4 7d 18 fc c3 96 e8 97 d3 cc 55 41 f5 44 3b 80"
+    "f3 9c 2b 6a a4 6e e7 be 49 f6 c9 10 af e0 de fb"
+    "25 fb 56 d4 8b dc 0d bf 92 2f 51 20 9d 03 7f 35"
+    "4a 35 ac 6b d5 7b 1a bd e7 5e a2 40 f9 06 fe 6a"
+    "94 6a 9b d6 69 f6 34 b9 0d bc 87 80 31 0c 3f d4"
+    "eb d4 f5 6f d2 2f 68 b1 1a bb cd c3 62 18 7e 6b"
+    "15 6b 29 de 67 5e d0 a1 34 b5 59 45 c4 30 fc d6"
+    "2a d6 52 7f ce bc 63 81 68 a9 b2 8a 4b 60 3b 6f"
+    "54 6f a4 fe 5f bb c6 c1 d0 91 a7 d7 96 c0 76 de"
+    "0a c1 a1 a6 8d a3 d5 d4 09 08 84 ef 7b 30 54 01"
+    "14 41 81 8f d9 85 69 6b 12 10 cb 1d f6 60 a8 02"
+    "28 82 c1 dd 71 c9 d2 d6 24 20 55 3a 2f c0 93 04"
+    "50 c7 41 79 e2 51 67 6f 48 40 aa 74 5e 43 e5 08"
+    "a0 4d 82 f2 07 a2 ce de 90 80 97 e8 bc 86 09 10"
+    "83 9a c7 27 0e 87 5f 7f e3 c3 ed 13 bb cf 12 20"
+    "c5 f7 4d 4e 1c cd be fe 05 45 19 26 b5 5d 24 40"
+    "49 2d 9a 9c 38 59 bf 3f 0a 8a 32 4c a9 ba 48 80"
+    "bf 64 63 d7 d4 e1 eb af 6c 54 2f 39 ff a6 b4 c0"
+    "bd c8 c6 6d 6b 01 15 9d d8 a8 5e 72 3d 8f ab 43"
+    "b9 53 4f da d6 02 2a f9 73 93 bc e4 7a dd 95 86"
+    "b1 a6 9e 77 6f 04 54 31 e6 e5 bb 0b f4 79 e9 cf"
+    "a1 8f ff ee de 08 a8 62 0f 09 b5 16 2b f2 11 5d"
+    "81 dd 3d 1f 7f 10 93 c4 1e 12 a9 2c 56 27 22 ba"
+    "c1 79 7a 3e fe 20 e5 4b 3c 24 91 58 ac 4e 44 b7"
+    "41 f2 f4 7c 3f 40 09 96 78 48 e1 b0 9b 9c 88 ad"
+    "f6 b8 30 f6 c4 90 99 37 2a 0f eb ec 64 31 8d c2"
+    "2f b3 60 2f 4b e3 f1 6e 54 1e 15 1b c8 62 d9 47"
+    "5e a5 c0 5e 96 05 21 dc a8 3c 2a 36 53 c4 71 8e"
+    "bc 89 43 bc ef 0a 42 7b 93 78 54 6c a6 4b e2 df"
+    "bb d1 86 bb 1d 14 84 f6 e5 f0 a8 d8 8f 96 07 7d"
+    "b5 61 cf b5 3a 28 cb 2f 09 23 93 73 dd ef 0e fa"
+    "a9 c2 5d a9 74 50 55 5e 12 46 e5 e6 79 1d 1c 37"
+    "91 47 ba 91 e8 a0 aa bc 24 8c 09 0f f2 3a 38 6e"
+    "a9 2d 6b 49 01 58 78 b1 01 f3 fe 91 91 d3 d1 10"
+    "91 5a d6 92 02 b0 f0 a1 02 25 3f e1 e1 65 61 20"
+    "e1 b4 6f e7 04 a3 23 81 04 4a 7e 01 01 ca c2 40"
+    "01 ab de 0d 08 85 46 c1 08 94 fc 02 02 57 47 80"
+    "02 95 7f 1a 10 c9 8c 41 10 eb 3b 04 04 ae 8e c3"
+    "04 e9 fe 34 20 51 db 82 20 15 76 08 08 9f df 45"
+    "08 11 3f 68 40 a2 75 c7 40 2a ec 10 10 fd 7d 8a"
+    "10 22 7e d0 80 87 ea 4d 80 54 1b 20 20 39 fa d7"
+    "ea 86 9f 07 65 0e 52 d4 60 98 c6 7f 52 df 44 85"
+    "17 cf fd 0e ca 1c a4 6b c0 f3 4f fe a4 7d 88 c9"
+    "2e 5d 39 1c 57 38 8b d6 43 25 9e 3f 8b fa d3 51"
+    "5c ba 72 38 ae 70 d5 6f 86 4a ff 7e d5 37 65 a2"
+    "b8 b7 e4 70 9f e0 69 de cf 94 3d fc 69 6e ca 87"
+    "b3 ad 0b e0 fd 03 d2 7f 5d eb 7a 3b d2 dc 57 cd"
+    "a5 99 16 03 39 06 67 fe ba 15 f4 76 67 7b ae 59"
+    "89 f1 2c 06 72 0c ce 3f b7 2a 2b ec ce f6 9f b2"
+    "8e 44 30 14 dd 02 f5 2a 8e c8 48 48 f8 48 3c 20"
+    "df 88 60 28 79 04 29 54 df 53 90 90 33 90 78 40"
+    "7d d3 c0 50 f2 08 52 a8 7d a6 e3 e3 66 e3 f0 80"
+    "fa 65 43 a0 27 10 a4 93 fa 8f 05 05 cc 05 23 c3"
+    "37 ca 86 83 4e 20 8b e5 37 dd 0a 0a 5b 0a 46 45"
+    "6e 57 cf c5 9c 40 d5 09 6e 79 14 14 b6 14 8c 8a"
+    "dc ae 5d 49 fb 80 69 12 dc f2 28 28 af 28 db d7"
+    "7b 9f ba 92 35 c3 d2 24 7b 27 50 50 9d 50 75 6d"
+    "4d d0 e3 e8 4c c3 16 6e 4b 7f a2 89 0d 64 a5 94"
+    "9a 63 05 13 98 45 2c dc 96 fe 87 d1 1a c8 89 eb"
+    "f7 c6 0a 26 f3 8a 58 7b ef 3f cd 61 34 53 d1 15"
+    "2d 4f 14 4c 25 d7 b0 f6 1d 7e 59 c2 68 a6 61 2a"
+    "5a 9e 28 98 4a 6d a3 2f 3a fc b2 47 d0 8f c2 54"
+    "b4 ff 50 f3 94 da 85 5e 74 3b a7 8e 63 dd 47 a8"
+    "ab 3d a0 25 eb 77 c9 bc e8 76 8d df c6 79 8e 93"
+    "95 7a 83 4a 15 ee 51 bb 13 ec d9 7d 4f f2 df e5"
+    "6e a2 76 72 6c 48 7a b8 5d 27 bd 10 dd 84 94 01"
+    "dc 87 ec e4 d8 90 f4 b3 ba 4e b9 20 79 cb eb 02"
+    "7b cd 1b 0b 73 e3 2b a5 b7 9c b1 40 f2 55 15 04"
+    "f6 59 36 16 e6 05 56 89 ad fb a1 80 27 aa 2a 08"
+    "2f b2 6c 2c 0f 0a ac d1 99 35 81 c3 4e 97 54 10"
+    "5e a7 d8 58 1e 14 9b 61 f1 6a c1 45 9c ed a8 20"
+    "bc 8d 73 b0 3c 28 f5 c2 21 d4 41 8a fb 19 93 40"
+    "bb d9 e6 a3 78 50 29 47 42 6b 82 d7 35 32 e5 80"
+)
+# Images L^-1(x) of the same unit vectors
+_L_REVERSE_BASIS_KUZNECHIK: bytes = bytes.fromhex(
+    "01 94 84 dd 10 bd 27 5d b8 7a 48 6c 72 76 a2 6e"
+    "02 eb cb 79 20 b9 4e ba b3 f4 90 d8 e4 ec 87 dc"
+    "04 15 55 f2 40 b1 9c b7 a5 2b e3 73 0b 1b cd 7b"
+    "08 2a aa 27 80 a1 fb ad 89 56 05 e6 16 36 59 f6"
+    "10 54 97 4e c3 81 35 99 d1 ac 0a 0f 2c 6c b2 2f"
+    "20 a8 ed 9c 45 c1 6a f1 61 9b 14 1e 58 d8 a7 5e"
+    "40 93 19 fb 8a 41 d4 21 c2 f5 28 3c b0 73 8d bc"
+    "80 e5 32 35 d7 82 6b 42 47 29 50 78 a3 e6 d9 bb"
+    "94 a5 64 0d 89 a2 7f 4b 6e 16 c3 4c e8 e3 d0 4d"
+    "eb 89 c8 1a d1 87 fe 96 dc 2c 45 98 13 05 63 9a"
+    "15 d1 53 34 61 cd 3f ef 7b 58 8a f3 26 0a c6 f7"
+    "2a 61 a6 68 c2 59 7e 1d f6 b0 d7 25 4c 14 4f 2d"
+    "54 c2 8f d0 47 b2 fc 3a 2f a3 6d 4a 98 28 9e 5a"
+    "a8 47 dd 63 8e a7 3b 74 5e 85 da 94 f3 50 ff b4"
+    "93 8e 79 c6 df 8d 76 e8 bc c9 77 eb 25 a0 3d ab"
+    "e5 df f2 4f 7d d9 ec 13 bb 51 ee 15 4a 83 7a 95"
+    "20 3c 48 f8 48 48 c8 8e 2a f5 02 dd 14 30 44 8e"
+    "40 78 90 33 90 90 53 df 54 29 04 79 28 60 88 df"
+    "80 f0 e3 66 e3 e3 a6 7d a8 52 08 f2 50 c0 d3 7d"
+    "c3 23 05 cc 05 05 8f fa 93 a4 10 27 a0 43 65 fa"
+    "45 46 0a 5b 0a 0a dd 37 e5 8b 20 4e 83 86 ca 37"
+    "8a 8c 14 b6 14 14 79 6e 09 d5 40 9c c5 cf 57 6e"
+    "d7 db 28 af 28 28 f2 dc 12 69 80 fb 49 5d ae dc"
+    "6d 75 50 9d 50 50 27 7b 24 d2 c3 35 92 ba 9f 7b"
+    "85 44 df 52 7f c6 98 60 d4 52 0e 65 07 9f 86 ea"
+    "c9 88 7d a4 fe 4f f3 c0 6b a4 1c ca 0e fd cf 17"
+    "51 d3 fa 8b 3f 9e 25 43 d6 8b 38 57 1c 39 5d 2e"
+    "a2 65 37 d5 7e ff 4a 86 6f d5 70 ae 38 72 ba 5c"
+    "87 ca 6e 69 fc 3d 94 cf de 69 e0 9f 70 e4 b7 b8"
+    "cd 57 dc d2 3b 7a eb 5d 7f d2 03 fd e0 0b ad b3"
+    "59 ae 7b 67 76 f4 15 ba fe 67 06 39 03 16 99 a5"
+    "b2 9f f6 ce ec 2b 2a b7 3f ce 0c 72 06 2c f1 89"
+    "10 d1 d3 91 91 fe f3 01 b1 78 58 01 49 6b 2d a9"
+    "20 61 65 e1 e1 3f 25 02 a1 f0 b0 02 92 d6 5a 91"
+    "40 c2 ca 01 01 7e 4a 04 81 23 a3 04 e7 6f b4 e1"
+    "80 47 57 02 02 fc 94 08 c1 46 85 08 0d de ab 01"
+    "c3 8e ae 04 04 3b eb 10 41 8c c9 10 1a 7f 95 02"
+    "45 df 9f 08 08 76 15 20 82 db 51 20 34 fe e9 04"
+    "8a 7d fd 10 10 ec 2a 40 c7 75 a2 40 68 3f 11 08"
+    "d7 fa 39 20 20 1b 54 80 4d ea 87 80 d0 7e 22 10"
+    "c2 8d 31 64 ec eb 0f 2a 37 99 90 c4 f6 30 b8 f6"
+    "47 d9 62 c8 1b 15 1e 54 6e f1 e3 4b 2f 60 b3 2f"
+    "8e 71 c4 53 36 2a 3c a8 dc 21 05 96 5e c0 a5 5e"
+    "df e2 4b a6 6c 54 78 93 7b 42 0a ef bc 43 89 bc"
+    "7d 07 96 8f d8 a8 f0 e5 f6 84 14 1d bb 86 d1 bb"
+    "fa 0e ef dd 73 93 23 09 2f cb 28 3a b5 cf 61 b5"
+    "37 1c 1d 79 e6 e5 46 12 5e 55 50 74 a9 5d c2 a9"
+    "6e 38 3a f2 0f 09 8c 24 bc aa a0 e8 91 ba 47 91"
+    "c0 b4 a6 ff 39 2f 54 6c af eb e1 d4 d7 63 64 bf"
+    "43 ab 8f 3d 72 5e a8 d8 9d 15 01 6b 6d c6 c8 bd"
+    "86 95 dd 7a e4 bc 93 73 f9 2a 02 d6 da 4f 53 b9"
+    "cf e9 79 f4 0b bb e5 e6 31 54 04 6f 77 9e a6 b1"
+    "5d 11 f2 2b 16 b5 09 0f 62 a8 08 de ee ff 8f a1"
+    "ba 22 27 56 2c a9 12 1e c4 93 10 7f 1f 3d dd 81"
+    "b7 44 4e ac 58 91 24 3c 4b e5 20 fe 3e 7a 79 c1"
+    "ad 88 9c 9b b0 e1 48 78 96 09 40 3f 7c f4 f2 41"
+    "01 54 30 7b ef 84 08 09 d4 d5 a3 8d a6 a1 c1 0a"
+    "02 a8 60 f6 1d cb 10 12 6b 69 85 d9 8f 81 41 14"
+    "04 93 c0 2f 3a 55 20 24 d6 d2 c9 71 dd c1 82 28"
+    "08 e5 43 5e 74 aa 40 48 6f 67 51 e2 79 41 c7 50"
+    "10 09 86 bc e8 97 80 90 de ce a2 07 f2 82 4d a0"
+    "20 12 cf bb 13 ed c3 e3 7f 5f 87 0e 27 c7 9a 83"
+    "40 24 5d b5 26 19 45 05 fe be cd 1c 4e 4d f7 c5"
+    "80 48 ba a9 4c 32 8a 0a 3f bf 59 38 9c 9a 2d 49"
+    "fb de e0 af 10 c9 f6 49 be e7 6e a4 6a 2b 9c f3"
+    "35 7f 03 9d 20 51 2f 92 bf 0d dc 8b d4 56 fb 25"
+    "6a fe 06 f9 40 a2 5e e7 bd 1a 7b d5 6b ac 35 4a"
+    "d4 3f 0c 31 80 87 bc 0d b9 34 f6 69 d6 9b 6a 94"
+    "6b 7e 18 62 c3 cd bb 1a b1 68 2f d2 6f f5 d4 eb"
+    "d6 fc 30 c4 45 59 b5 34 a1 d0 5e 67 de 29 6b 15"
+    "6f 3b 60 4b 8a b2 a9 68 81 63 bc ce 7f 52 d6 2a"
+    "de 76 c0 96 d7 a7 91 d0 c1 c6 bb 5f fe a4 6f 54"
+    "01 6f 5a 3d bf ad ee ab f1 c4 af 02 d6 1c 89 f2"
+    "02 de b4 7a bd 99 1f 95 21 4b 9d 04 6f 38 d1 27"
+    "04 7f ab f4 b9 f1 3e e9 42 96 f9 08 de 70 61 4e"
+    "08 fe 95 2b b1 21 7c 11 84 ef 31 10 7f e0 c2 9c"
+    "10 3f e9 56 a1 42 f8 22 cb 1d 62 20 fe 03 47 fb"
+    "20 7e 11 ac 81 84 33 44 55 3a c4 40 3f 06 8e 35"
+    "40 fc 22 9b c1 cb 66 88 aa 74 4b 80 7e 0c df 6a"
+    "80 3b 44 f5 41 55 cc d3 97 e8 96 c3 fc 18 7d d4"
+    "c0 77 44 94 60 7c 12 8d 2e 2d bc eb 11 43 48 8e"
+    "43 ee 88 eb c0 f8 24 d9 5c 5a bb 15 22 86 90 df"
+    "86 1f d3 15 43 33 48 71 b8 b4 b5 2a 44 cf e3 7d"
+    "cf 3e 65 2a 86 66 90 e2 b3 ab a9 54 88 5d 05 fa"
+    "5d 7c ca 54 cf cc e3 07 a5 95 91 a8 d3 ba 0a 37"
+    "ba f8 57 a8 5d 5b 05 0e 89 e9 e1 93 65 b7 14 6e"
+    "b7 33 ae 93 ba b6 0a 1c d1 11 01 e5 ca ad 28 dc"
+    "ad 66 9f e5 b7 af 14 38 61 22 02 09 57 99 50 7b"
+    "c2 5d 97 f3 e9 1a 8d cb bb 06 c5 20 1c 68 90 93"
+    "47 ba ed 25 11 34 d9 55 b5 0c 49 40 38 d0 e3 e5"
+    "8e b7 19 4a 22 68 71 aa a9 18 92 80 70 63 05 09"
+    "df ad 32 94 44 d0 e2 97 91 30 e7 c3 e0 c6 0a 12"
+    "7d 99 64 eb 88 63 07 ed e1 60 0d 45 03 4f 14 24"
+    "fa f1 c8 15 d3 c6 0e 19 01 c0 1a 8a 06 9e 28 48"
+    "37 21 53 2a 65 4f 1c 32 02 43 34 d7 0c ff 50 90"
+    "6e 42 a6 54 ca 9e 38 64 04 86 68 6d 18 3d a0 e3"
+    "10 96 ca d9 30 68 2f 14 1a 17 0c ca 0c 70 da bf"
+    "20 ef 57 71 60 d0 5e 28 34 2e 18 57 18 e0 77 bd"
+    "40 1d ae e2 c0 63 bc 50 68 5c 30 ae 30 03 ee b9"
+    "80 3a 9f 07 43 c6 bb a0 d0 b8 60 9f 60 06 1f b1"
+    "c3 74 fd 0e 86 4f b5 83 63 b3 c0 fd c0 0c 3e a1"
+    "45 e8 39 1c cf 9e a9 c5 c6 a5 43 39 43 18 7c 81"
+    "8a 13 72 38 5d ff 91 49 4f 89 86 72 86 30 f8 c1"
+    "d7 26 e4 70 ba 3d e1 92 9e d1 cf e4 cf 60 33 41"
+    "85 74 75 d0 5e be b8 87 4e 62 ec 6b 10 87 c6 74"
+    "c9 e8 ea 63 bc bf b3 cd 9c c4 1b d6 20 cd 4f e8"
+    "51 13 17 c6 bb bd a5 59 fb 4b 36 6f 40 59 9e 13"
+    "a2 26 2e 4f b5 b9 89 b2 35 96 6c de 80 b2 ff 26"
+    "87 4c 5c 9e a9 b1 d1 a7 6a ef d8 7f c3 a7 3d 4c"
+    "cd 98 b8 ff 91 a1 61 8d d4 1d 73 fe 45 8d 7a 98"
+    "59 f3 b3 3d e1 81 c2 d9 6b 3a e6 3f 8a d9 f4 f3"
+    "b2 25 a5 7a 01 c1 47 71 d6 74 0f 7e d7 71 2b 25"
+    "20 2d 99 e9 95 9f d4 49 e6 d5 76 f2 33 c8 20 98"
+    "40 5a f1 11 e9 fd 6b 92 0f 69 ec 27 66 53 40 f3"
+    "80 b4 21 22 11 39 d6 e7 1e d2 1b 4e cc a6 80 25"
+    "c3 ab 42 44 22 72 6f 0d 3c 67 36 9c 5b 8f c3 4a"
+    "45 95 84 88 44 e4 de 1a 78 ce 6c fb b6 dd 45 94"
+    "8a e9 cb d3 88 0b 7f 34 f0 5f d8 35 af 79 8a eb"
+    "d7 11 55 65 d3 16 fe 68 23 be 73 6a 9d f2 d7 15"
+    "6d 22 aa ca 65 2c 3f d0 46 bf e6 d4 f9 27 6d 2a"
+    "94 84 dd 10 bd 27 5d b8 7a 48 6c 72 76 a2 6e cf"
+    "eb cb 79 20 b9 4e ba b3 f4 90 d8 e4 ec 87 dc 5d"
+    "15 55 f2 40 b1 9c b7 a5 2b e3 73 0b 1b cd 7b ba"
+    "2a aa 27 80 a1 fb ad 89 56 05 e6 16 36 59 f6 b7"
+    "54 97 4e c3 81 35 99 d1 ac 0a 0f 2c 6c b2 2f ad"
+    "a8 ed 9c 45 c1 6a f1 61 9b 14 1e 58 d8 a7 5e 99"
+    "93 19 fb 8a 41 d4 21 c2 f5 28 3c b0 73 8d bc f1"
+    "e5 32 35 d7 82 6b 42 47 29 50 78 a3 e6 d9 bb 21"
+)
+# Substitutions pi_0, ..., pi_7 of the nibbles of the Magma round function,
+# pi_0 for the least significant nibble
+_S_BOX_MAGMA: tuple = (
+    bytes.fromhex("0c0406020a050b090e080d0700030f01"),
+    bytes.fromhex("06080203090a050c010e04070b0d000f"),
+    bytes.fromhex("0b030508020f0a0d0e0107040c090600"),
+    bytes.fromhex("0c0802010d040f0607000a05030e090b"),
+    bytes.fromhex("070f050a0801060d0009030e0b04020c"),
+    bytes.fromhex("050d0f0609020c0a0b07080104030e00"),
+    bytes.fromhex("080e02050609010c0f040b000d0a0307"),
+    bytes.fromhex("01070e0d00050803040f0a06090c0b02"),
+)
+
+# fmt: on
@@ -0,0 +1,132 @@
+import mmap
+import os
+import time
+from typing import Literal
+from typing import NamedTuple
+
+from loguru import logger
+
+from ciphers.block.gost_34_13_2015 import GOST_34_13_2015_GammaOutputFeedback
+from ciphers.block.utils import GOSTCipherError
+
+# Size of the window of the input processed per call (a multiple of the
+# block size)
+DEFAULT_WINDOW_SIZE: int = 8 * 1024 * 1024
+
+
+class FileCipherResult(NamedTuple):
+    """Size of the processed file and the time spent on it."""
+
+    size: int
+    seconds: float
+
+    @property
+    def throughput(self) -> float:
+        """Return the throughput in MB/s."""
+        if not self.seconds:
+            return 0.0
+        return self.size / self.seconds / 1e6
+
+
+def _process_file(
+    src: str | os.PathLike,
+    dst: str | os.PathLike,
+    key: bytearray,
+    init_vect: bytearray,
+    window_size: int,
+    action: Literal["encrypt", "decrypt"],
+) -> FileCipherResult:
+    start = time.perf_counter()
+    cipher_obj = GOST_34_13_2015_GammaOutputFeedback(key, init_vect)
+    try:
+        if window_size <= 0 or window_size % cipher_obj.block_size != 0:
+            raise GOSTCipherError(
+                f"GOSTCipherError: invalid window size.\n"
+                f"Condition: window_size % block_size != 0.\n"
+                f"Result: {window_size} % {cipher_obj.block_size} = {window_size % cipher_obj.block_size}"
+            )
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            raise GOSTCipherError("GOSTCipherError: src and dst are the same file")
+        size = os.path.getsize(src)
+        with open(src, "rb") as src_file, open(dst, "w+b") as dst_file:
+            dst_file.truncate(size)
+            if size:
+                with mmap.mmap(
+                    src_file.fileno(), 0, access=mmap.ACCESS_READ
+                ) as src_map, mmap.mmap(dst_file.fileno(), size) as dst_map:
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        src_map.madvise(mmap.MADV_SEQUENTIAL)
+                    source = memoryview(src_map)
+                    target = memoryview(dst_map)
+                    try:
+                        # Every window is written straight into the output map
+                        for begin in range(0, size, window_size):
+                            end = min(begin + window_size, size)
+                            cipher_obj.encrypt_into(
+                                source[begin:end], target[begin:end]
+                            )
+                        cipher_obj.finalize()
+                    finally:
+                        source.release()
+                        target.release()
+    finally:
+        # The key schedule is wiped on failure too
+        cipher_obj.clear()
+    result = FileCipherResult(size, time.perf_counter() - start)
+    logger.info(
+        f"{action} {src} -> {dst}: {result.size} bytes, "
+        f"{result.seconds:.3f} s, {result.throughput:.2f} MB/s"
+    )
+    return result
+
+
+def encrypt_file(
+    src: str | os.PathLike,
+    dst: str | os.PathLike,
+    key: bytearray,
+    init_vect: bytearray,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+) -> FileCipherResult:
+    """
+    Encrypt a file in the output feedback mode.
+
+    The input is memory-mapped and processed window by window into a
+    memory-mapped output of the same size, so neither file has to fit in
+    memory and no intermediate copy of the whole file is made.
+
+    Args:
+        src: Path of the plaintext file.
+        dst: Path of the ciphertext file (created or overwritten).
+        key: The encryption key (32 bytes).
+        init_vect: The initialization vector (a multiple of the block size).
+        window_size: Number of bytes processed per step (a multiple of the
+          block size).
+
+    Returns:
+        The size of the file and the time spent, with the throughput.
+    """
+    return _process_file(src, dst, key, init_vect, window_size, "encrypt")
+
+
+def decrypt_file(
+    src: str | os.PathLike,
+    dst: str | os.PathLike,
+    key: bytearray,
+    init_vect: bytearray,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+) -> FileCipherResult:
+    """
+    Decrypt a file encrypted with 'encrypt_file'.
+
+    Args:
+        src: Path of the ciphertext file.
+        dst: Path of the plaintext file (created or overwritten).
+        key: The encryption key (32 bytes).
+        init_vect: The initialization vector (a multiple of the block size).
+        window_size: Number of bytes processed per step (a multiple of the
+          block size).
+
+    Returns:
+        The size of the file and the time spent, with the throughput.
+    """
+    return _process_file(src, dst, key, init_vect, window_size, "decrypt")
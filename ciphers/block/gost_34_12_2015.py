@@ -1,73 +1,266 @@
-import json
+from array import array
+from typing import TYPE_CHECKING
 from typing import List
+from typing import Tuple
 
-from loguru import logger
-
+from ciphers import profiling
+from ciphers import tracing
+from ciphers.block import backends
 from ciphers.block.const import (
     _BLOCK_SIZE_KUZNECHIK,
+    _BLOCK_SIZE_MAGMA,
     _KEY_SIZE,
     _GF,
+    _L_BASIS_KUZNECHIK,
+    _L_REVERSE_BASIS_KUZNECHIK,
     _S_BOX_KUZNECHIK,
+    _S_BOX_MAGMA,
     _S_BOX_REVERSE_KUZNECHIK,
 )
+from ciphers.block.key_cache import KeyScheduleCache
+from ciphers.block.utils import GOSTCipherError
 from ciphers.block.utils import add_xor
+from ciphers.block.utils import bytearray_to_int
+from ciphers.block.utils import int_to_bytearray
 from ciphers.block.utils import zero_fill
 
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class GOST_34_12_2015:
+    """
+    ГОСТ Р 34.12-2015 КРИПТОГРАФИЧЕСКАЯ ЗАЩИТА ИНФОРМАЦИИ. Блочные шифры
+
+    The key schedule handling, the block conversions and the batch engine
+    common to both algorithms; the subclasses define the rounds.
+
+    The round keys are kept in two 'array("Q")' buffers of 64-bit words,
+    '_key_words' words per key with the most significant first, that
+    'clear' zeroes in place; the objects have no '__dict__'. The rounds
+    read the keys from the buffers on every call, so the ints built from
+    them live only as long as the call.
+    """
+
+    __slots__ = ("_cipher_iter_key", "_cipher_iter_key_reverse", "backend")
+
+    # Name of the algorithm, the prefix of its profiled stages
+    algorithm: str = ""
+    # Number of 64-bit words of a round key
+    _key_words: int = 1
+
+    def __init__(self, key: bytearray, key_cache: KeyScheduleCache | None = None):
+        """
+        Args:
+            key: The encryption key (32 bytes).
+            key_cache: Optional cache of expanded key schedules shared between
+              instances built with the same key.
+        """
+        self._prepare_tables()
+        profiler = profiling.profiler
+        if profiler is not None:
+            profiler.enter(f"{self.algorithm}.key_schedule")
+        if key_cache is None:
+            iter_key, iter_key_reverse = self._expand_key(key)
+        else:
+            iter_key, iter_key_reverse = key_cache.get(key, self._expand_key)
+        if profiler is not None:
+            profiler.leave()
+
+        self._cipher_iter_key: array = iter_key
+        # Round keys of the decryption
+        self._cipher_iter_key_reverse: array = iter_key_reverse
+        # Name of the backend of 'encrypt_blocks' and 'decrypt_blocks', or
+        # None for the fastest one for the number of blocks (see 'backends')
+        self.backend: str | None = None
+
+    @classmethod
+    def _from_key_schedule(
+        cls, iter_key: "array | List[int]", iter_key_reverse: "array | List[int]"
+    ) -> "GOST_34_12_2015":
+        """Build a cipher object from a copy of already expanded round keys."""
+        cls._prepare_tables()
+        cipher_obj = cls.__new__(cls)
+        cipher_obj._cipher_iter_key = array("Q", iter_key)
+        cipher_obj._cipher_iter_key_reverse = array("Q", iter_key_reverse)
+        cipher_obj.backend = None
+        return cipher_obj
+
+    def _round_keys(self, iter_key: array) -> List[int]:
+        """Return the round keys of a schedule as ints."""
+        return _unpack_keys(iter_key, self._key_words)
+
+    @staticmethod
+    def _prepare_tables() -> None:
+        """Build the lookup tables of the algorithm on first use."""
+
+    def __del__(self) -> None:
+        """
+        Delete the ciphering object.
+
+        When deleting an instance of a class, it clears the values of
+        iterative keys.
+        """
+        self.clear()
+
+    @property
+    def key_size(self) -> int:
+        """
+        Return the value of the cipher key size.
+
+        For the 'magma' and 'kuznechik' algorithms, the key size is 32 bytes
+        (256 bits).
+        """
+        return _KEY_SIZE
+
+    def _process_blocks(
+        self, blocks: "np.ndarray | bytearray", operation: str
+    ) -> "np.ndarray | bytearray":
+        import numpy as np
+
+        if isinstance(blocks, np.ndarray):
+            if blocks.dtype != np.uint8 or blocks.shape[1:] != (self.block_size,):
+                raise GOSTCipherError(
+                    f"GOSTCipherError: invalid blocks array. "
+                    f"Expected N x {self.block_size} uint8, got {blocks.shape} {blocks.dtype}"
+                )
+            return backends.run(self, operation, np.ascontiguousarray(blocks))
+
+        if len(blocks) % self.block_size != 0:
+            raise GOSTCipherError(
+                f"GOSTCipherError: invalid blocks data.\n"
+                f"Condition: len(blocks) % self.block_size != 0.\n"
+                f"Result: {len(blocks)} % {self.block_size} = {len(blocks) % self.block_size}"
+            )
+        data = np.frombuffer(blocks, dtype=np.uint8).reshape(-1, self.block_size)
+        return bytearray(backends.run(self, operation, data))
+
+    def decrypt_blocks(
+        self, blocks: "np.ndarray | bytearray"
+    ) -> "np.ndarray | bytearray":
+        """
+        Decrypting a batch of independent blocks of ciphertext.
+
+        Args:
+            blocks: An N x block size 'uint8' array or a bytes-like object
+              whose length is a multiple of the block size.
+
+        Returns:
+            The blocks of plaintext in the same form as the input ('bytearray'
+            for bytes-like input).
+        """
+        return self._process_blocks(blocks, "decrypt")
+
+    def encrypt_blocks(
+        self, blocks: "np.ndarray | bytearray"
+    ) -> "np.ndarray | bytearray":
+        """
+        Encrypting a batch of independent blocks of plaintext.
+
+        The batch runs on the backend selected for its number of blocks:
+        large batches pass through each round together, so the interpreter
+        overhead is paid per round instead of per block, while small ones
+        are processed one block at a time (see 'ciphers.block.backends').
+        Only the blocks processed one at a time are traced (see
+        'ciphers.tracing').
+
+        Args:
+            blocks: An N x block size 'uint8' array or a bytes-like object
+              whose length is a multiple of the block size.
+
+        Returns:
+            The blocks of ciphertext in the same form as the input
+            ('bytearray' for bytes-like input).
+        """
+        return self._process_blocks(blocks, "encrypt")
+
+    def decrypt(self, block: bytearray) -> bytearray:
+        """
+        Decrypting a block of ciphertext.
+
+        Args:
+            block: The block of ciphertext to be decrypted (the block size is
+              16 bytes for 'kuznechik' and 8 bytes for 'magma').
+
+        Returns:
+            The block of plaintext.
+        """
+        block = self.decrypt_int(bytearray_to_int(block))
+        return int_to_bytearray(block, self.block_size)
+
+    def encrypt(self, block: bytearray) -> bytearray:
+        """
+        Encrypting a block of plaintext.
+
+        Args:
+            block: The block of plaintext to be encrypted (the block size is
+              16 bytes for 'kuznechik' and 8 bytes for 'magma').
+
+        Returns:
+            The block of ciphertext.
+        """
+        block = self.encrypt_int(bytearray_to_int(block))
+        return int_to_bytearray(block, self.block_size)
+
+    def clear(self) -> None:
+        """Сlearing the values of iterative encryption keys."""
+        zero_fill(self._cipher_iter_key)
+        zero_fill(self._cipher_iter_key_reverse)
+
 
-class GOST_34_12_2015_Kuznechik:
+class GOST_34_12_2015_Kuznechik(GOST_34_12_2015):
     """
     ГОСТ Р 34.12-2015 КРИПТОГРАФИЧЕСКАЯ ЗАЩИТА ИНФОРМАЦИИ. Блочные шифры
 
     Алгоритм блочного шифрования с длиной блока n = 128 бит «Кузнечик»
+
+    The round keys of the decryption are L^-1(k_i), the keys of the
+    equivalent inverse cipher.
     """
 
-    def __init__(self, key: bytearray):
-        # Initialize cipher_c and cipher_iter_key
-        self._cipher_c: List[bytearray] = []
-        self._cipher_iter_key = []
-        self._cipher_get_c()
+    __slots__ = ()
+
+    algorithm = "kuznechik"
+    _key_words = 2
+
+    @staticmethod
+    def _prepare_tables() -> None:
+        _load_tables()
+
+    @classmethod
+    def _expand_key(cls, key: bytearray) -> Tuple[array, array]:
+        iter_key = []
 
         # Split key into two halves
-        key_1 = key[: _KEY_SIZE // 2]
-        key_2 = key[_KEY_SIZE // 2:]
+        key_1 = bytearray_to_int(key[: _KEY_SIZE // 2])
+        key_2 = bytearray_to_int(key[_KEY_SIZE // 2:])
 
         # Generate iterative keys
-        internal = bytearray(_KEY_SIZE // 2)
-        self._cipher_iter_key.append(key_1)
-        self._cipher_iter_key.append(key_2)
+        internal = 0
+        iter_key.append(key_1)
+        iter_key.append(key_2)
 
         for i in range(4):
             for j in range(8):
-                internal = add_xor(key_1, self._cipher_c[i * 8 + j])
-                internal = GOST_34_12_2015_Kuznechik._cipher_s(internal)
-                internal = GOST_34_12_2015_Kuznechik._cipher_l(internal)
-                key_1, key_2 = [add_xor(internal, key_2), key_1]
+                internal = _transform(key_1 ^ _CIPHER_C[i * 8 + j], _LS_TABLE)
+                key_1, key_2 = internal ^ key_2, key_1
 
-            self._cipher_iter_key.append(key_1)
-            self._cipher_iter_key.append(key_2)
+            iter_key.append(key_1)
+            iter_key.append(key_2)
 
-        logger.warning(
-            f"{self.__class__.__name__}\n{json.dumps(dict(key_size=_KEY_SIZE, key=key, key_1=key_1, key_2=key_2, internal=internal), indent=2, default=str)}"
-        )
+        iter_key_reverse = [iter_key[0]] + [
+            _transform(value, _L_REVERSE_TABLE) for value in iter_key[1:]
+        ]
 
         # Clear keys for security reasons
-        key_1 = bytearray(self.key_size // 2)
-        key_2 = bytearray(self.key_size // 2)
-        key = bytearray(self.key_size)
-
-        logger.debug(
-            f"{self.__class__.__name__}\n{json.dumps(self.__dict__, indent=2, default=str)}"
+        key_1 = 0
+        key_2 = 0
+        internal = 0
+        return (
+            _pack_keys(iter_key, cls._key_words),
+            _pack_keys(iter_key_reverse, cls._key_words),
         )
 
-    def __del__(self) -> None:
-        """
-        Delete the ciphering object.
-
-        When deleting an instance of a class, it clears the values of
-        iterative keys.
-        """
-        self.clear()
-
     @staticmethod
     def _cipher_s(data: bytearray) -> bytearray:
         result = bytearray(_BLOCK_SIZE_KUZNECHIK)
@@ -118,12 +311,6 @@ class GOST_34_12_2015_Kuznechik:
             result = GOST_34_12_2015_Kuznechik._cipher_r_reverse(result)
         return result
 
-    def _cipher_get_c(self) -> None:
-        for i in range(1, 33):
-            internal = bytearray(_BLOCK_SIZE_KUZNECHIK)
-            internal[15] = i
-            self._cipher_c.append(GOST_34_12_2015_Kuznechik._cipher_l(internal))
-
     @property
     def block_size(self) -> int:
         """
@@ -134,61 +321,593 @@ class GOST_34_12_2015_Kuznechik:
         """
         return _BLOCK_SIZE_KUZNECHIK
 
-    @property
-    def key_size(self) -> int:
+    def _decrypt_reference(self, block: bytearray) -> bytearray:
+        """Decrypt a block with the byte-oriented X, S^-1 and L^-1 stages."""
+        iter_key = [
+            int_to_bytearray(key, _BLOCK_SIZE_KUZNECHIK)
+            for key in self._round_keys(self._cipher_iter_key)
+        ]
+        block = add_xor(iter_key[9], block)
+        for i in range(8, -1, -1):
+            block = GOST_34_12_2015_Kuznechik._cipher_l_reverse(block)
+            block = GOST_34_12_2015_Kuznechik._cipher_s_reverse(block)
+            block = add_xor(iter_key[i], block)
+        return block
+
+    def _encrypt_reference(self, block: bytearray) -> bytearray:
+        """Encrypt a block with the byte-oriented X, S and L stages."""
+        iter_key = [
+            int_to_bytearray(key, _BLOCK_SIZE_KUZNECHIK)
+            for key in self._round_keys(self._cipher_iter_key)
+        ]
+        for i in range(9):
+            block = add_xor(iter_key[i], block)
+            block = GOST_34_12_2015_Kuznechik._cipher_s(block)
+            block = GOST_34_12_2015_Kuznechik._cipher_l(block)
+            block = add_xor(iter_key[9], block)
+        return block
+
+    def decrypt_int(self, block: int) -> int:
         """
-        Return the value of the cipher key size.
+        Decrypting a block of ciphertext represented as an integer.
 
-        For the 'magma' and 'kuznechik' algorithms, the key size is 32 bytes
-        (256 bits).
+        Args:
+            block: The block of ciphertext as a big-endian 128-bit integer.
+
+        Returns:
+            The block of plaintext as a big-endian 128-bit integer.
         """
-        return _KEY_SIZE
+        if profiling.profiler is not None:
+            return self._decrypt_int_staged(block, profiling.profiler)
+        tracer = tracing.tracer
+        if tracer is not None:
+            tracer.record(tracing.BLOCK_IN, block)
+        # The words of the keys k_9, ..., k_0 are read from the end, the
+        # less significant word of every key first
+        words = reversed(self._cipher_iter_key_reverse)
+        low, high = next(words), next(words)
+        block = _transform(block, _L_REVERSE_TABLE) ^ (high << 64 | low)
+        for step, low, high in zip(_DECRYPT_STEPS, words, words):
+            block = _transform(block, _LS_REVERSE_TABLE) ^ (high << 64 | low)
+            if tracer is not None:
+                tracer.record(tracing.ROUND, block, step=step)
+        low, high = next(words), next(words)
+        block = _transform(block, _S_REVERSE_TABLE) ^ (high << 64 | low)
+        if tracer is not None:
+            tracer.record(tracing.BLOCK_OUT, block)
+        return block
 
-    def decrypt(self, block: bytearray) -> bytearray:
+    def encrypt_int(self, block: int) -> int:
         """
-        Decrypting a block of ciphertext.
+        Encrypting a block of plaintext represented as an integer.
+
+        Callers that chain blocks (e.g. the feedback modes) should use this
+        method to avoid converting every intermediate block to bytes.
 
         Args:
-            block: The block of ciphertext to be decrypted (the block size is
-              16 bytes).
+            block: The block of plaintext as a big-endian 128-bit integer.
 
         Returns:
-            The block of plaintext.
+            The block of ciphertext as a big-endian 128-bit integer.
         """
-        block = bytearray(block)
-        block = add_xor(self._cipher_iter_key[9], block)
+        if profiling.profiler is not None:
+            return self._encrypt_int_staged(block, profiling.profiler)
+        tracer = tracing.tracer
+        if tracer is not None:
+            tracer.record(tracing.BLOCK_IN, block)
+        key = self._cipher_iter_key
+        key_9 = key[18] << 64 | key[19]
+        # The words of the keys k_0, ..., k_8 in pairs, without copying them
+        words = iter(key)
+        for step, high, low in zip(_ENCRYPT_STEPS, words, words):
+            block = _transform(block ^ (high << 64 | low), _LS_TABLE) ^ key_9
+            if tracer is not None:
+                tracer.record(tracing.ROUND, block, step=step)
+        if tracer is not None:
+            tracer.record(tracing.BLOCK_OUT, block)
+        return block
+
+    def _decrypt_int_staged(self, block: int, profiler: profiling.Profiler) -> int:
+        """Decrypt a block with the X, S^-1 and L^-1 stages computed apart."""
+        key = self._round_keys(self._cipher_iter_key)
+        profiler.enter("kuznechik.decrypt")
+        profiler.enter("X")
+        block ^= key[9]
+        profiler.leave()
         for i in range(8, -1, -1):
-            block = GOST_34_12_2015_Kuznechik._cipher_l_reverse(block)
-            block = GOST_34_12_2015_Kuznechik._cipher_s_reverse(block)
-            block = add_xor(self._cipher_iter_key[i], block)
+            profiler.enter("L")
+            block = _transform(block, _L_REVERSE_TABLE)
+            profiler.leave()
+            profiler.enter("S")
+            block = _substitute(block, _S_BOX_REVERSE_KUZNECHIK)
+            profiler.leave()
+            profiler.enter("X")
+            block ^= key[i]
+            profiler.leave()
+        profiler.leave()
         return block
 
-    def encrypt(self, block: bytearray) -> bytearray:
+    def _encrypt_int_staged(self, block: int, profiler: profiling.Profiler) -> int:
+        """Encrypt a block with the X, S and L stages computed apart."""
+        key = self._round_keys(self._cipher_iter_key)
+        profiler.enter("kuznechik.encrypt")
+        for i in range(9):
+            profiler.enter("X")
+            block ^= key[i]
+            profiler.leave()
+            profiler.enter("S")
+            block = _substitute(block, _S_BOX_KUZNECHIK)
+            profiler.leave()
+            profiler.enter("L")
+            block = _transform(block, _L_TABLE)
+            profiler.leave()
+            profiler.enter("X")
+            block ^= key[9]
+            profiler.leave()
+        profiler.leave()
+        return block
+
+    def _decrypt_array(self, data: "np.ndarray") -> "np.ndarray":
+        import numpy as np
+
+        tables = _load_array_tables()
+        key = _key_array(self._cipher_iter_key_reverse)
+        block = _transform_array(data.view(np.uint64), tables["L_REVERSE"]) ^ key[9]
+        for i in range(8, 0, -1):
+            block = _transform_array(block, tables["LS_REVERSE"]) ^ key[i]
+        return _transform_array(block, tables["S_REVERSE"]) ^ key[0]
+
+    def _encrypt_array(self, data: "np.ndarray") -> "np.ndarray":
+        import numpy as np
+
+        tables = _load_array_tables()
+        key = _key_array(self._cipher_iter_key)
+        block = data.view(np.uint64)
+        for i in range(9):
+            block = _transform_array(block ^ key[i], tables["LS"]) ^ key[9]
+        return block
+
+
+class GOST_34_12_2015_Magma(GOST_34_12_2015):
+    """
+    ГОСТ Р 34.12-2015 КРИПТОГРАФИЧЕСКАЯ ЗАЩИТА ИНФОРМАЦИИ. Блочные шифры
+
+    Алгоритм блочного шифрования с длиной блока n = 64 бит «Магма»
+
+    The round function g[k](a) = (t(a + k)) <<< 11 is computed with four
+    tables, one per byte of 'a + k', each merging the two S-boxes of the
+    byte with the rotation; the round keys of the decryption are the round
+    keys of the encryption in the reverse order.
+    """
+
+    __slots__ = ()
+
+    algorithm = "magma"
+
+    @staticmethod
+    def _prepare_tables() -> None:
+        _load_magma_tables()
+
+    @classmethod
+    def _expand_key(cls, key: bytearray) -> Tuple[array, array]:
+        # K_1, ..., K_8 are the 32-bit words of the key, K_1 the leftmost
+        key_words = [
+            bytearray_to_int(key[begin: begin + 4]) for begin in range(0, _KEY_SIZE, 4)
+        ]
+        iter_key = key_words * 3 + key_words[::-1]
+
+        # Clear keys for security reasons
+        key_words = [0] * len(key_words)
+        return (
+            _pack_keys(iter_key, cls._key_words),
+            _pack_keys(iter_key[::-1], cls._key_words),
+        )
+
+    @property
+    def block_size(self) -> int:
         """
-        Encrypting a block of plaintext.
+        Return the value of the internal block size of the cipher algorithm.
+
+        For the 'kuznechik' algorithm this value is 16 and the 'magma'
+        algorithm, this value is 8.
+        """
+        return _BLOCK_SIZE_MAGMA
+
+    def _feistel(self, block: int, iter_key: array, stage: str) -> int:
+        """
+        Pass a block through the 32 rounds with the given round keys.
+
+        Encryption and decryption differ only in the order of the round
+        keys: G[K_1], ..., G[K_31] followed by G*[K_32] (the last round does
+        not swap the halves).
+        """
+        if profiling.profiler is not None:
+            return self._feistel_staged(block, iter_key, stage, profiling.profiler)
+        tracer = tracing.tracer
+        if tracer is not None:
+            tracer.record(tracing.BLOCK_IN, block, width=_BLOCK_SIZE_MAGMA)
+        t_0, t_1, t_2, t_3 = _MAGMA_TABLE
+        a_1 = block >> 32
+        a_0 = block & 0xFFFFFFFF
+        for step, key in enumerate(iter_key, 1):
+            value = (a_0 + key) & 0xFFFFFFFF
+            a_1, a_0 = a_0, (
+                a_1
+                ^ t_0[value & 0xFF]
+                ^ t_1[(value >> 8) & 0xFF]
+                ^ t_2[(value >> 16) & 0xFF]
+                ^ t_3[value >> 24]
+            )
+            if tracer is not None:
+                tracer.record(
+                    tracing.ROUND, a_1 << 32 | a_0, step=step, width=_BLOCK_SIZE_MAGMA
+                )
+        block = a_0 << 32 | a_1
+        if tracer is not None:
+            tracer.record(tracing.BLOCK_OUT, block, width=_BLOCK_SIZE_MAGMA)
+        return block
+
+    def _feistel_staged(
+        self, block: int, iter_key: array, stage: str, profiler: profiling.Profiler
+    ) -> int:
+        """Pass a block through the rounds with the stages of g computed apart."""
+        profiler.enter(stage)
+        a_1 = block >> 32
+        a_0 = block & 0xFFFFFFFF
+        for key in iter_key:
+            profiler.enter("add")
+            value = (a_0 + key) & 0xFFFFFFFF
+            profiler.leave()
+            profiler.enter("S")
+            value = _substitute_nibbles(value)
+            profiler.leave()
+            profiler.enter("R")
+            value = ((value << 11) | (value >> 21)) & 0xFFFFFFFF
+            profiler.leave()
+            profiler.enter("X")
+            a_1, a_0 = a_0, a_1 ^ value
+            profiler.leave()
+        profiler.leave()
+        return a_0 << 32 | a_1
+
+    @staticmethod
+    def _reference(block: bytearray, iter_key: array) -> bytearray:
+        """Pass a block through G[K_1], ..., G[K_31] and G*[K_32] computed directly."""
+        a_1 = bytearray_to_int(block[:4])
+        a_0 = bytearray_to_int(block[4:])
+        for index in range(len(iter_key) - 1):
+            a_1, a_0 = a_0, a_1 ^ _round_function(a_0, iter_key[index])
+        a_1 ^= _round_function(a_0, iter_key[-1])
+        return int_to_bytearray(a_1, 4) + int_to_bytearray(a_0, 4)
+
+    def _decrypt_reference(self, block: bytearray) -> bytearray:
+        return self._reference(block, self._cipher_iter_key_reverse)
+
+    def _encrypt_reference(self, block: bytearray) -> bytearray:
+        return self._reference(block, self._cipher_iter_key)
+
+    def decrypt_int(self, block: int) -> int:
+        """
+        Decrypting a block of ciphertext represented as an integer.
 
         Args:
-            block: The block of plaintext to be encrypted (the block size is
-              16 bytes).
+            block: The block of ciphertext as a big-endian 64-bit integer.
 
         Returns:
-            The block of ciphertext.
+            The block of plaintext as a big-endian 64-bit integer.
         """
-        block = bytearray(block)
-        logger.debug(
-            f"{self.__class__.__name__}\n{json.dumps(dict(block_before=block), indent=2, default=str)}"
-        )
-        for i in range(9):
-            block = add_xor(self._cipher_iter_key[i], block)
-            block = GOST_34_12_2015_Kuznechik._cipher_s(block)
-            block = GOST_34_12_2015_Kuznechik._cipher_l(block)
-            block = add_xor(self._cipher_iter_key[9], block)
-        logger.debug(
-            f"{self.__class__.__name__}\n{json.dumps(dict(block_after=block), indent=2, default=str)}"
+        return self._feistel(block, self._cipher_iter_key_reverse, "magma.decrypt")
+
+    def encrypt_int(self, block: int) -> int:
+        """
+        Encrypting a block of plaintext represented as an integer.
+
+        Args:
+            block: The block of plaintext as a big-endian 64-bit integer.
+
+        Returns:
+            The block of ciphertext as a big-endian 64-bit integer.
+        """
+        return self._feistel(block, self._cipher_iter_key, "magma.encrypt")
+
+    def _decrypt_array(self, data: "np.ndarray") -> "np.ndarray":
+        return _feistel_array(data, self._cipher_iter_key_reverse)
+
+    def _encrypt_array(self, data: "np.ndarray") -> "np.ndarray":
+        return _feistel_array(data, self._cipher_iter_key)
+
+
+def _pack_keys(iter_key: List[int], key_words: int) -> array:
+    """Pack round keys into 64-bit words, the most significant word first."""
+    words = array("Q")
+    for key in iter_key:
+        for shift in range(64 * (key_words - 1), -1, -64):
+            words.append((key >> shift) & 0xFFFFFFFFFFFFFFFF)
+    return words
+
+
+def _unpack_keys(words: array, key_words: int) -> List[int]:
+    """Return the round keys packed by '_pack_keys' as ints."""
+    iter_key = []
+    for begin in range(0, len(words), key_words):
+        key = 0
+        for index in range(begin, begin + key_words):
+            key = key << 64 | words[index]
+        iter_key.append(key)
+    return iter_key
+
+
+def _transform(value: int, table: tuple) -> int:
+    """
+    Apply a byte-wise tabulated transformation to a 128-bit block.
+
+    Args:
+        value: The block as a big-endian integer.
+        table: Sixteen 256-entry tables, one per byte position of the block.
+
+    Returns:
+        The 'xor' of the table entries selected by the bytes of the block.
+    """
+    (
+        b_0, b_1, b_2, b_3, b_4, b_5, b_6, b_7,
+        b_8, b_9, b_10, b_11, b_12, b_13, b_14, b_15,
+    ) = value.to_bytes(_BLOCK_SIZE_KUZNECHIK, "big")
+    (
+        t_0, t_1, t_2, t_3, t_4, t_5, t_6, t_7,
+        t_8, t_9, t_10, t_11, t_12, t_13, t_14, t_15,
+    ) = table
+    return (
+        t_0[b_0] ^ t_1[b_1] ^ t_2[b_2] ^ t_3[b_3]
+        ^ t_4[b_4] ^ t_5[b_5] ^ t_6[b_6] ^ t_7[b_7]
+        ^ t_8[b_8] ^ t_9[b_9] ^ t_10[b_10] ^ t_11[b_11]
+        ^ t_12[b_12] ^ t_13[b_13] ^ t_14[b_14] ^ t_15[b_15]
+    )
+
+
+def _substitute(value: int, s_box: bytes) -> int:
+    """Apply an S-box to every byte of a 128-bit block."""
+    data = value.to_bytes(_BLOCK_SIZE_KUZNECHIK, "big").translate(s_box)
+    return int.from_bytes(data, "big")
+
+
+def _substitute_nibbles(value: int) -> int:
+    """Apply the substitution t of the Magma round to a 32-bit word."""
+    result = 0
+    for pos, s_box in enumerate(_S_BOX_MAGMA):
+        result |= s_box[(value >> 4 * pos) & 0xF] << 4 * pos
+    return result
+
+
+def _round_function(value: int, key: int) -> int:
+    """Compute g[k](a) = t(a + k) <<< 11 of the Magma round stage by stage."""
+    value = _substitute_nibbles((value + key) & 0xFFFFFFFF)
+    return ((value << 11) | (value >> 21)) & 0xFFFFFFFF
+
+
+def _transform_array(block: "np.ndarray", table: "np.ndarray") -> "np.ndarray":
+    """
+    Apply a byte-wise tabulated transformation to a batch of blocks.
+
+    Args:
+        block: The blocks as an N x 2 'uint64' array holding the big-endian
+          bytes of every block.
+        table: The transformation as a 16 x 256 x 2 'uint64' array in the
+          same byte layout.
+
+    Returns:
+        The transformed blocks as an N x 2 'uint64' array.
+    """
+    import numpy as np
+
+    data = block.view(np.uint8)
+    if len(data) <= _GATHER_MAX_BLOCKS:
+        # For few blocks a single gather from the flattened tables is
+        # cheaper than sixteen 'take' calls
+        offsets = _load_array_tables()["OFFSETS"]
+        return np.bitwise_xor.reduce(table.reshape(-1, 2)[data + offsets], axis=1)
+    result = np.take(table[0], data[:, 0], axis=0)
+    for pos in range(1, _BLOCK_SIZE_KUZNECHIK):
+        result ^= np.take(table[pos], data[:, pos], axis=0)
+    return result
+
+
+def _key_array(iter_key: array) -> "np.ndarray":
+    """Return the Kuznechik round keys as an N x 2 'uint64' array of their bytes."""
+    import numpy as np
+
+    # The words are stored in the big-endian byte order, as the blocks
+    words = np.frombuffer(iter_key, dtype=np.uint64).astype(">u8")
+    return words.view(np.uint64).reshape(-1, 2)
+
+
+def _feistel_array(data: "np.ndarray", iter_key: array) -> "np.ndarray":
+    """
+    Pass a batch of Magma blocks through the rounds with the given keys.
+
+    Args:
+        data: The blocks as an N x 8 'uint8' array.
+        iter_key: The 32 round keys in the order of their use.
+
+    Returns:
+        The processed blocks as an N x 2 big-endian 'uint32' array.
+    """
+    import numpy as np
+
+    table = _load_magma_array_table()
+    halves = data.view(">u4").astype(np.uint32)
+    a_1, a_0 = halves[:, 0], halves[:, 1]
+    if len(data) <= _GATHER_MAX_BLOCKS:
+        # As in '_transform_array': one gather per round for few blocks
+        flat_table = table.reshape(-1)
+        offsets = _array_tables["MAGMA_OFFSETS"]
+        for key in iter_key:
+            value = (a_0 + np.uint32(key)).view(np.uint8).reshape(-1, 4)
+            value = np.bitwise_xor.reduce(flat_table[value + offsets], axis=1)
+            a_1, a_0 = a_0, a_1 ^ value
+    else:
+        value = np.empty_like(a_0)
+        for key in iter_key:
+            np.add(a_0, np.uint32(key), out=value)
+            a_1, a_0 = a_0, (
+                a_1
+                ^ table[0][value & 0xFF]
+                ^ table[1][(value >> 8) & 0xFF]
+                ^ table[2][(value >> 16) & 0xFF]
+                ^ table[3][value >> 24]
+            )
+    result = np.empty(halves.shape, dtype=">u4")
+    result[:, 0] = a_0
+    result[:, 1] = a_1
+    return result
+
+
+def _table_array(table: tuple) -> "np.ndarray":
+    import numpy as np
+
+    data = b"".join(
+        value.to_bytes(_BLOCK_SIZE_KUZNECHIK, "big") for row in table for value in row
+    )
+    return np.frombuffer(data, dtype=np.uint64).reshape(_BLOCK_SIZE_KUZNECHIK, 256, 2)
+
+
+def _linear_table(basis: bytes) -> List[List[int]]:
+    """
+    Tabulate a linear transformation of the block byte position by position.
+
+    The transformations 'L' and 'L^-1' are linear over GF(2), so the image
+    of any byte value is the 'xor' of the images of its set bits.
+
+    Args:
+        basis: The images of the 128 unit vectors of the block, 16 bytes
+          each, ordered by byte position and then by bit.
+
+    Returns:
+        Sixteen 256-entry tables of 128-bit integers.
+    """
+    table = []
+    for pos in range(_BLOCK_SIZE_KUZNECHIK):
+        row = [0] * 256
+        for bit in range(8):
+            begin = (pos * 8 + bit) * _BLOCK_SIZE_KUZNECHIK
+            row[1 << bit] = bytearray_to_int(basis[begin:begin + _BLOCK_SIZE_KUZNECHIK])
+        for value in range(1, 256):
+            low_bit = value & -value
+            if value != low_bit:
+                row[value] = row[low_bit] ^ row[value ^ low_bit]
+        table.append(row)
+    return table
+
+
+def _compose_s_box(table: List[List[int]], s_box: bytes) -> tuple:
+    return tuple(tuple(row[s_box[value]] for value in range(256)) for row in table)
+
+
+# Names of the lookup tables built by '_load_tables' on first use
+_LAZY_TABLES = (
+    "_L_TABLE",
+    "_L_REVERSE_TABLE",
+    "_LS_TABLE",
+    "_LS_REVERSE_TABLE",
+    "_CIPHER_C",
+    "_S_REVERSE_TABLE",
+)
+# Names of the lookup tables built by '_load_magma_tables' on first use
+_LAZY_MAGMA_TABLES = ("_MAGMA_TABLE",)
+_array_tables: dict = {}
+# Largest batch for which '_transform_array' and '_feistel_array' gather all
+# positions at once
+_GATHER_MAX_BLOCKS = 64
+# Step numbers of the rounds traced by 'encrypt_int' and 'decrypt_int'
+_ENCRYPT_STEPS = range(1, 10)
+_DECRYPT_STEPS = range(1, 9)
+
+
+def _load_tables() -> None:
+    """
+    Build the lookup tables of the round transformations.
+
+    Nothing is computed at import time: the tables are assembled from the
+    compact basis constants the first time a cipher object is created.
+    """
+    global _L_TABLE, _L_REVERSE_TABLE, _LS_TABLE, _LS_REVERSE_TABLE
+    global _CIPHER_C, _S_REVERSE_TABLE
+    if "_S_REVERSE_TABLE" in globals():
+        return
+
+    _L_TABLE = _linear_table(_L_BASIS_KUZNECHIK)
+    _L_REVERSE_TABLE = tuple(
+        tuple(row) for row in _linear_table(_L_REVERSE_BASIS_KUZNECHIK)
+    )
+    # Combined 'L(S(x))' for encryption and 'L^-1(S^-1(x))' for decryption
+    _LS_TABLE = _compose_s_box(_L_TABLE, _S_BOX_KUZNECHIK)
+    _LS_REVERSE_TABLE = _compose_s_box(_L_REVERSE_TABLE, _S_BOX_REVERSE_KUZNECHIK)
+    # Iterative constants C_i = L(Vec_128(i)), i = 1, ..., 32, of the key schedule
+    _CIPHER_C = tuple(_L_TABLE[_BLOCK_SIZE_KUZNECHIK - 1][i] for i in range(1, 33))
+    # Plain 'S^-1(x)' for the last round of decryption. Assigned last: its
+    # presence marks the tables as loaded
+    _S_REVERSE_TABLE = tuple(
+        tuple(_S_BOX_REVERSE_KUZNECHIK[value] << (8 * (15 - pos)) for value in range(256))
+        for pos in range(_BLOCK_SIZE_KUZNECHIK)
+    )
+
+
+def _load_array_tables() -> dict:
+    """Return the lookup tables for the batched NumPy engine, building them once."""
+    if "LS" not in _array_tables:
+        _load_tables()
+        import numpy as np
+
+        _array_tables.update(
+            OFFSETS=np.arange(0, 256 * _BLOCK_SIZE_KUZNECHIK, 256, dtype=np.intp),
+            L_REVERSE=_table_array(_L_REVERSE_TABLE),
+            LS=_table_array(_LS_TABLE),
+            LS_REVERSE=_table_array(_LS_REVERSE_TABLE),
+            S_REVERSE=_table_array(_S_REVERSE_TABLE),
         )
-        return block
+    return _array_tables
 
-    def clear(self) -> None:
-        """Сlearing the values of iterative encryption keys."""
-        for i in range(10):
-            self._cipher_iter_key[i] = zero_fill(self._cipher_iter_key[i])
+
+def _load_magma_tables() -> None:
+    """
+    Build the lookup tables of the Magma round function.
+
+    Table 'j' maps byte 'j' (counting from the least significant one) of
+    the sum 'a + k' to its part of g[k](a): the two S-boxes of the byte
+    applied to its nibbles, shifted into place and rotated left by 11.
+    """
+    global _MAGMA_TABLE
+    if "_MAGMA_TABLE" in globals():
+        return
+
+    table = []
+    for pos in range(4):
+        s_box_low, s_box_high = _S_BOX_MAGMA[2 * pos], _S_BOX_MAGMA[2 * pos + 1]
+        row = []
+        for value in range(256):
+            word = (s_box_high[value >> 4] << 4 | s_box_low[value & 0xF]) << 8 * pos
+            row.append(((word << 11) | (word >> 21)) & 0xFFFFFFFF)
+        table.append(tuple(row))
+    _MAGMA_TABLE = tuple(table)
+
+
+def _load_magma_array_table() -> "np.ndarray":
+    """Return the Magma tables as a 4 x 256 'uint32' array, building them once."""
+    if "MAGMA" not in _array_tables:
+        _load_magma_tables()
+        import numpy as np
+
+        # Offsets of the tables of the bytes of a 'uint32' in its native order
+        byte_order = np.array([0x03020100], dtype=np.uint32).view(np.uint8)
+        _array_tables["MAGMA_OFFSETS"] = byte_order.astype(np.intp) * 256
+        _array_tables["MAGMA"] = np.array(_MAGMA_TABLE, dtype=np.uint32)
+    return _array_tables["MAGMA"]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_TABLES:
+        _load_tables()
+        return globals()[name]
+    if name in _LAZY_MAGMA_TABLES:
+        _load_magma_tables()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
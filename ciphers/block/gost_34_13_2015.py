@@ -1,23 +1,34 @@
-import json
 import os
-import pathlib
-import sys
-
-from loguru import logger
+from typing import TYPE_CHECKING
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Tuple
 
+from ciphers import profiling
+from ciphers import tracing
 from ciphers.block.const import _KEY_SIZE
+from ciphers.block.gost_34_12_2015 import GOST_34_12_2015
 from ciphers.block.gost_34_12_2015 import GOST_34_12_2015_Kuznechik
-from ciphers.block.utils import add_xor
+from ciphers.block.key_cache import KeyScheduleCache
+from ciphers.block.prefetch import GammaPrefetcher
+from ciphers.block.utils import GOSTCipherError
+from ciphers.block.utils import bytearray_to_int
 from ciphers.block.utils import check_value
+from ciphers.block.utils import compare
+from ciphers.block.utils import int_to_bytearray
+from ciphers.block.utils import xor_into
 from ciphers.block.utils import zero_fill
+from ciphers.pool import map_bounded
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    import numpy as np
 
-logger.remove()
-if sys.stdout is None:
-    sys.stdout = open(os.devnull, 'w')
-logger.add(sys.stdout)
-log_path = pathlib.Path(__file__).parent.joinpath("log.log")
-log_path.unlink(missing_ok=True)
-logger.add(log_path)
+# Constants B_n of the MAC subkey derivation: B_64 = 0^59 || 11011 and
+# B_128 = 0^120 || 10000111
+_MAC_B = {8: 0x1B, 16: 0x87}
 
 
 class GOST_34_13_2015:
@@ -25,14 +36,32 @@ class GOST_34_13_2015:
     ГОСТ Р 34.13-2015 КРИПТОГРАФИЧЕСКАЯ ЗАЩИТА. Режимы работы блочных шифров
     """
 
-    def __init__(self, key: bytearray) -> None:
+    __slots__ = ("_cipher_obj",)
+
+    def __init__(
+        self,
+        key: "bytearray | GOST_34_12_2015",
+        key_cache: KeyScheduleCache | None = None,
+    ) -> None:
+        """
+        Args:
+            key: The encryption key (32 bytes) of the 'kuznechik' algorithm,
+              or a block cipher object with an already expanded key schedule
+              (e.g. 'GOST_34_12_2015_Magma' for the 'magma' algorithm). A
+              cipher object is owned by the mode object from then on and is
+              cleared with it.
+            key_cache: Optional cache of expanded key schedules.
+        """
+        if isinstance(key, GOST_34_12_2015):
+            self._cipher_obj = key
+            return
         if not check_value(key, _KEY_SIZE):
             key_size = len(key)
-            key = zero_fill(key)
+            zero_fill(key)
             raise GOSTCipherError(
                 f"GOSTCipherError: invalid key value. Your key size {key_size} != {_KEY_SIZE}"
             )
-        self._cipher_obj = GOST_34_12_2015_Kuznechik(key)
+        self._cipher_obj = GOST_34_12_2015_Kuznechik(key, key_cache)
 
     def __del__(self) -> None:
         self.clear()
@@ -72,9 +101,48 @@ class GOST_34_13_2015:
 
 
 class GOST_34_13_2015_GammaOutputFeedback(GOST_34_13_2015):
+    """Режим гаммирования с обратной связью по выходу (OFB)."""
 
-    def __init__(self, key: bytearray, init_vect: bytearray) -> None:
-        super().__init__(key)
+    __slots__ = (
+        "_prefetcher",
+        "_stream_gamma",
+        "_stream_offset",
+        "_keystream",
+        "_init_vect",
+        "_iv_pos",
+        "window_blocks",
+        "lane_threshold",
+    )
+
+    def __init__(
+        self,
+        key: "bytearray | GOST_34_12_2015",
+        init_vect: bytearray,
+        key_cache: KeyScheduleCache | None = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        Args:
+            key: The encryption key (32 bytes) or a block cipher object.
+            init_vect: The initialization vector (a multiple of the block
+              size).
+            key_cache: Optional cache of expanded key schedules.
+            prefetch: If positive, the number of gamma blocks computed ahead
+              by a background thread (see 'GammaPrefetcher').
+        """
+        self._prefetcher = None
+        # Number of gamma blocks generated per window by 'encrypt_into'
+        self.window_blocks = 4096
+        # Smallest number of blocks of the initialization vector for which
+        # its independent chains are computed in lockstep with batched calls
+        self.lane_threshold = 32
+        # Gamma block of an incomplete block in the stream and the number of
+        # its bytes already used by 'update' (0 if there is none)
+        self._stream_gamma = 0
+        self._stream_offset = 0
+        # Reusable buffer for the gamma of 'encrypt_into'
+        self._keystream: bytearray | None = None
+        super().__init__(key, key_cache)
         check_init_vect = isinstance(init_vect, (bytes, bytearray))
         if (not check_init_vect) or (len(init_vect) % self.block_size) != 0:
             self.clear()
@@ -83,66 +151,768 @@ class GOST_34_13_2015_GammaOutputFeedback(GOST_34_13_2015):
                 f"Condition: len(init_vect) % self.block_size != 0.\n"
                 f"Result: {len(init_vect)} % {self.block_size} = {len(init_vect) % self.block_size}"
             )
-        self._init_vect = init_vect
-        self._init_vect = bytearray(self._init_vect)
-        logger.debug(f"{self.__class__.__name__}\n{dict(_init_vect=self._init_vect)}")
+        # The shift register holds the initialization vector as one
+        # integer per block in a ring buffer; '_iv_pos' is the position of
+        # the oldest block
+        self._init_vect: List[int] = [
+            bytearray_to_int(self._get_block(init_vect, i))
+            for i in range(self._get_num_block(init_vect))
+        ]
+        self._iv_pos = 0
+        if prefetch > 0:
+            self._prefetcher = GammaPrefetcher(
+                self._cipher_obj, self._init_vect, prefetch
+            )
 
-    def _get_gamma(self) -> bytearray:
-        return self._cipher_obj.encrypt(self._init_vect[0: self.block_size])
+    def _get_gamma(self) -> int:
+        if self._prefetcher is not None:
+            return self._prefetcher.peek()
+        return self._cipher_obj.encrypt_int(self._init_vect[self._iv_pos])
 
-    def _set_init_vect(self, data: bytearray):
-        iter_iv_hi = self._init_vect[self.block_size: len(self._init_vect)]
-        self._init_vect[0: len(self._init_vect) - self.block_size] = iter_iv_hi
-        begin_iv_low = len(self._init_vect) - self.block_size
-        end_iv_low = len(self._init_vect)
-        self._init_vect[begin_iv_low:end_iv_low] = data
+    def _set_init_vect(self, data: int):
+        self._init_vect[self._iv_pos] = data
+        self._iv_pos += 1
+        if self._iv_pos == len(self._init_vect):
+            self._iv_pos = 0
+        if self._prefetcher is not None:
+            self._prefetcher.advance()
 
-    def _get_final_block(self, data):
-        return data[self.block_size * self._get_num_block(data)::]
+    def clear(self) -> None:
+        """Stopping the gamma prefetch and clearing the iterative keys."""
+        if getattr(self, "_prefetcher", None) is not None:
+            self._prefetcher.stop()
+        self._stream_gamma = 0
+        if getattr(self, "_keystream", None) is not None:
+            zero_fill(self._keystream)
+        super().clear()
 
-    def _final_cipher(self, data):
-        gamma = self._get_gamma()
-        cipher_block = self._get_final_block(data)
-        return add_xor(gamma, cipher_block)
+    @property
+    def prefetcher(self) -> GammaPrefetcher | None:
+        """Return the gamma prefetcher (with its stall metrics) if enabled."""
+        return self._prefetcher
+
+    def _continue_block(self, data: memoryview) -> bytearray:
+        size = min(self.block_size - self._stream_offset, len(data))
+        shift = (self.block_size - self._stream_offset - size) * 8
+        gamma = (self._stream_gamma >> shift) & ((1 << size * 8) - 1)
+        result = int_to_bytearray(gamma ^ bytearray_to_int(data[:size]), size)
+        self._stream_offset += size
+        if self._stream_offset == self.block_size:
+            self._set_init_vect(self._stream_gamma)
+            self._stream_offset = 0
+        return result
+
+    def _gamma_lanes_into(self, keystream: memoryview, num_block: int) -> None:
+        """
+        Generate whole steps of the gamma with all lanes of the register.
+
+        Gamma block 'i' depends only on block 'i - m' of an m-block
+        register, so every block of the register is an independent chain
+        (lane) and every step of m blocks is computed with one batched call
+        of the block cipher.
+        """
+        register = self._init_vect[self._iv_pos:] + self._init_vect[: self._iv_pos]
+        gamma = _lockstep_gamma(self._cipher_obj, [register], [num_block])[0]
+        keystream[: len(gamma)] = gamma
+        self._init_vect = register
+        self._iv_pos = 0
+
+    def _gamma_into(self, keystream: memoryview, num_block: int, index: int) -> None:
+        block_size = self.block_size
+        tracer = tracing.tracer
+        profiler = profiling.profiler
+        num_lanes = len(self._init_vect)
+        begin = 0
+        if (
+            self._prefetcher is None
+            and num_lanes >= self.lane_threshold
+            and num_block >= num_lanes
+        ):
+            if profiler is not None:
+                profiler.enter("ofb.gamma")
+            begin = num_block - num_block % num_lanes
+            self._gamma_lanes_into(keystream, begin)
+            if profiler is not None:
+                profiler.leave()
+            if tracer is not None:
+                gammas = _iter_blocks(keystream[: begin * block_size], block_size)
+                for i, gamma in enumerate(gammas):
+                    tracer.record(
+                        tracing.GAMMA, gamma, index=index + i, width=block_size
+                    )
+            begin *= block_size
+        for begin in range(begin, num_block * block_size, block_size):
+            if profiler is not None:
+                profiler.enter("ofb.gamma")
+            gamma = self._get_gamma()
+            keystream[begin: begin + block_size] = gamma.to_bytes(block_size, "big")
+            if profiler is not None:
+                profiler.leave()
+                profiler.enter("ofb.shift_iv")
+            self._set_init_vect(gamma)
+            if profiler is not None:
+                profiler.leave()
+            if tracer is not None:
+                tracer.record(
+                    tracing.GAMMA,
+                    gamma,
+                    index=index + begin // block_size,
+                    width=block_size,
+                )
+
+    def _apply_gamma_into(
+        self,
+        src: memoryview,
+        dst: memoryview,
+        mac_obj: "GOST_34_13_2015_MAC | None" = None,
+        mac_input: bool = False,
+    ) -> None:
+        """
+        Apply the gamma to the data starting at a block boundary.
+
+        The gamma of a whole window of blocks is generated first and then
+        applied with a single 'xor'; the MAC, if any, absorbs every window
+        right after it is processed. The gamma of an incomplete last block
+        is kept in '_stream_gamma' and the register is not shifted for it.
+        """
+        block_size = self.block_size
+        num_block = len(src) // block_size
+        window_size = min(num_block, self.window_blocks) * block_size
+        if self._keystream is None or len(self._keystream) < window_size:
+            self._keystream = bytearray(window_size)
+        keystream = memoryview(self._keystream)
+        profiler = profiling.profiler
+        for index in range(0, num_block, self.window_blocks):
+            begin = index * block_size
+            end = min(num_block, index + self.window_blocks) * block_size
+            self._gamma_into(keystream, (end - begin) // block_size, index)
+            if profiler is not None:
+                profiler.enter("ofb.xor")
+            xor_into(src[begin:end], keystream, dst[begin:end])
+            if profiler is not None:
+                profiler.leave()
+            if mac_obj is not None:
+                mac_obj.update(src[begin:end] if mac_input else dst[begin:end])
+
+        begin = num_block * block_size
+        if begin < len(src):
+            if profiler is not None:
+                profiler.enter("ofb.gamma")
+            self._stream_gamma = self._get_gamma()
+            if profiler is not None:
+                profiler.leave()
+            gamma = self._stream_gamma.to_bytes(block_size, "big")
+            xor_into(src[begin:], gamma, dst[begin: len(src)])
+            if mac_obj is not None:
+                mac_obj.update(src[begin:] if mac_input else dst[begin: len(src)])
+            if tracing.tracer is not None:
+                tracing.tracer.record(
+                    tracing.GAMMA, self._stream_gamma, index=num_block, width=block_size
+                )
+
+    def _apply_gamma(
+        self,
+        data: bytearray,
+        mac_obj: "GOST_34_13_2015_MAC | None" = None,
+        mac_input: bool = False,
+    ) -> bytearray:
+        result = bytearray(len(data))
+        self._apply_gamma_into(
+            memoryview(data).cast("B"), memoryview(result), mac_obj, mac_input
+        )
+        return result
+
+    def _check_stream_finished(self) -> None:
+        # The gamma block of an incomplete block of the stream is partly
+        # used: starting over from the register would reuse it
+        if self._stream_offset:
+            raise GOSTCipherError(
+                "GOSTCipherError: the stream started with 'update' ends inside "
+                "a block. Call 'finalize' first."
+            )
 
     def encrypt(self, data: bytearray) -> bytearray:
         if not isinstance(data, (bytes, bytearray)):
             self.clear()
             raise GOSTCipherError("GOSTCipherError: invalid plaintext data")
-        result = bytearray()
-        gamma = bytearray()
-        logger.debug(
-            f"{self.__class__.__name__}\n number of blocks {self._get_num_block(data)}"
-        )
-        for i in range(self._get_num_block(data)):
-            gamma = self._get_gamma()
-            cipher_block = self._get_block(data, i)
-            result += add_xor(gamma, cipher_block)
-            self._set_init_vect(gamma[0: self.block_size])
-            log_message = dict(gamma=gamma, cipher_block=cipher_block, result=result)
-            logger.debug(
-                f"{self.__class__.__name__}\n[block][{i}]\n{json.dumps(log_message, indent=2, default=str)}"
+        self._check_stream_finished()
+        return self._apply_gamma(data)
+
+    def decrypt(self, data: bytearray) -> bytearray:
+        if not isinstance(data, (bytes, bytearray)):
+            self.clear()
+            raise GOSTCipherError("GOSTCipherError: invalid ciphertext data")
+        return self.encrypt(data)
+
+    def update(self, data: bytearray) -> bytearray:
+        """
+        Encrypt (or decrypt) the next chunk of a stream.
+
+        Chunks do not have to be multiples of the block size: the unused
+        part of the gamma block of an incomplete block is carried over to
+        the next call. The concatenated output of any sequence of calls
+        is equal to the output of 'encrypt' for the concatenated input.
+        While the stream ends inside a block, 'encrypt', 'decrypt' and the
+        MAC variants raise 'GOSTCipherError' until 'finalize' is called.
+
+        Args:
+            data: Any bytes-like object.
+
+        Returns:
+            The processed chunk (of the same length as 'data').
+        """
+        data = memoryview(data).cast("B")
+        result = bytearray(len(data))
+        self.encrypt_into(data, result)
+        return result
+
+    def encrypt_into(self, src, dst) -> int:
+        """
+        Encrypt the next chunk of a stream into a caller-provided buffer.
+
+        This is the allocation-free counterpart of 'update': the gamma is
+        generated into a buffer owned by the object, window by window, and
+        applied to the data with a single 'xor' per window. Both arguments
+        may be any objects supporting the buffer protocol (bytes, bytearray,
+        memoryview, mmap, C-contiguous NumPy arrays), and 'dst' may be
+        'src' itself for in-place encryption.
+
+        Args:
+            src: The input data.
+            dst: The writable output buffer (at least as long as 'src').
+
+        Returns:
+            The number of bytes written.
+        """
+        src = memoryview(src).cast("B")
+        dst = memoryview(dst).cast("B")
+        if len(dst) < len(src):
+            raise GOSTCipherError(
+                f"GOSTCipherError: output buffer is too small. "
+                f"Condition: len(dst) >= len(src). Result: {len(dst)} < {len(src)}"
             )
+        begin = 0
+        if self._stream_offset and len(src):
+            head = self._continue_block(src)
+            begin = len(head)
+            dst[:begin] = head
+        if begin < len(src):
+            self._apply_gamma_into(src[begin:], dst[begin:])
+            self._stream_offset = (len(src) - begin) % self.block_size
+        return len(src)
+
+    def decrypt_into(self, src, dst) -> int:
+        """Decrypt the next chunk of a stream into a caller-provided buffer."""
+        return self.encrypt_into(src, dst)
+
+    def finalize(self) -> bytearray:
+        """
+        Finish the stream started with 'update'.
+
+        The output mode keeps no buffered data, so the result is always
+        empty. The gamma of an incomplete last block is discarded, which
+        leaves the object in the same state as after a call of 'encrypt'.
+        """
+        self._stream_gamma = 0
+        self._stream_offset = 0
+        return bytearray()
+
+    def encrypt_and_mac(
+        self, data: bytearray, mac_obj: "GOST_34_13_2015_MAC"
+    ) -> bytearray:
+        """
+        Encrypt the data and feed the ciphertext to a MAC in the same pass.
+
+        The ciphertext of every window of blocks is passed to 'mac_obj'
+        right after it is produced (encrypt-then-MAC), while it is still
+        in the cache.
+
+        Args:
+            data: The plaintext.
+            mac_obj: The MAC object to update with the ciphertext.
+
+        Returns:
+            The ciphertext.
+        """
+        if not isinstance(data, (bytes, bytearray)):
+            self.clear()
+            raise GOSTCipherError("GOSTCipherError: invalid plaintext data")
+        self._check_stream_finished()
+        return self._apply_gamma(data, mac_obj, mac_input=False)
+
+    def decrypt_and_mac(
+        self, data: bytearray, mac_obj: "GOST_34_13_2015_MAC"
+    ) -> bytearray:
+        """
+        Feed the ciphertext to a MAC and decrypt it in the same pass.
+
+        Call 'mac_obj.verify' once the whole message has been processed
+        and discard the plaintext if it fails.
+
+        Args:
+            data: The ciphertext.
+            mac_obj: The MAC object to update with the ciphertext.
+
+        Returns:
+            The plaintext.
+        """
+        if not isinstance(data, (bytes, bytearray)):
+            self.clear()
+            raise GOSTCipherError("GOSTCipherError: invalid ciphertext data")
+        self._check_stream_finished()
+        return self._apply_gamma(data, mac_obj, mac_input=True)
+
+    @classmethod
+    def encrypt_many(
+        cls,
+        key: "bytearray | GOST_34_12_2015",
+        jobs: Iterable[Tuple[bytearray, bytearray]],
+        key_cache: KeyScheduleCache | None = None,
+    ) -> List[bytearray]:
+        """
+        Encrypt many independent messages under one key in lockstep.
+
+        The chains of all messages (every block of every initialization
+        vector) advance together: each step computes the next gamma block
+        of all of them with one batched call of the block cipher. The
+        result of every message is equal to 'encrypt' with a new object.
+
+        Args:
+            key: The encryption key (32 bytes) or a block cipher object. A
+              cipher object stays owned by the caller and is not cleared.
+            jobs: Pairs '(init_vect, data)'.
+            key_cache: Optional cache of expanded key schedules.
+
+        Returns:
+            The encrypted messages in the order of the jobs.
+        """
+        if isinstance(key, GOST_34_12_2015):
+            mode_obj, cipher_obj = None, key
+        else:
+            mode_obj = GOST_34_13_2015(key, key_cache)
+            cipher_obj = mode_obj._cipher_obj
+        try:
+            block_size = cipher_obj.block_size
+            registers, messages = [], []
+            for init_vect, data in jobs:
+                check_init_vect = isinstance(init_vect, (bytes, bytearray))
+                if (not check_init_vect) or (len(init_vect) % block_size) != 0:
+                    raise GOSTCipherError(
+                        "GOSTCipherError: invalid initialization vector value"
+                    )
+                if not isinstance(data, (bytes, bytearray)):
+                    raise GOSTCipherError("GOSTCipherError: invalid plaintext data")
+                registers.append(list(_iter_blocks(init_vect, block_size)))
+                messages.append(data)
+            num_blocks = [-(-len(data) // block_size) for data in messages]
+            result = _lockstep_gamma(cipher_obj, registers, num_blocks)
+            for data, gamma in zip(messages, result):
+                xor_into(data, gamma, gamma)
+                del gamma[len(data):]
+            return result
+        finally:
+            if mode_obj is not None:
+                mode_obj.clear()
+
+    @classmethod
+    def decrypt_many(
+        cls,
+        key: "bytearray | GOST_34_12_2015",
+        jobs: Iterable[Tuple[bytearray, bytearray]],
+        key_cache: KeyScheduleCache | None = None,
+    ) -> List[bytearray]:
+        """Decrypt many independent messages under one key in lockstep."""
+        return cls.encrypt_many(key, jobs, key_cache)
+
+    @property
+    def iv(self) -> bytearray:
+        """Return the value of the initializing vector."""
+        return int_to_bytearray(self._init_vect[self._iv_pos - 1], self.block_size)
+
+
+class GOST_34_13_2015_MAC(GOST_34_13_2015):
+    """
+    Режим выработки имитовставки (MAC).
 
-        if len(data) % self.block_size != 0:
-            result += self._final_cipher(data)
-            logger.debug(
-                f"{self.__class__.__name__}\n final cipher result\n{json.dumps(dict(result=result), indent=2, default=str)}"
+    The message is absorbed incrementally with 'update', so only the last
+    (possibly incomplete) block is kept in memory until 'digest' decides
+    whether it is padded.
+    """
+
+    __slots__ = ("mac_size", "_key_1", "_key_2", "_prev", "_last", "_last_len")
+
+    def __init__(
+        self,
+        key: "bytearray | GOST_34_12_2015",
+        data: bytearray = b"",
+        mac_size: int | None = None,
+        key_cache: KeyScheduleCache | None = None,
+    ) -> None:
+        """
+        Args:
+            key: The MAC key (32 bytes) or a block cipher object.
+            data: Optional initial part of the message.
+            mac_size: Length of the MAC in bytes (the block size by default).
+            key_cache: Optional cache of expanded key schedules.
+        """
+        super().__init__(key, key_cache)
+        if mac_size is None:
+            mac_size = self.block_size
+        if not 0 < mac_size <= self.block_size:
+            self.clear()
+            raise GOSTCipherError(
+                f"GOSTCipherError: invalid MAC size. "
+                f"Condition: 0 < mac_size <= {self.block_size}. Result: {mac_size}"
             )
+        self.mac_size = mac_size
+        self._key_1, self._key_2 = self._get_subkeys()
+        # C_{i-1} of the chain and the pending last block with its length
+        self._prev = 0
+        self._last = 0
+        self._last_len = 0
+        self.update(data)
+
+    def _shift_subkey(self, value: int) -> int:
+        bits = self.block_size * 8
+        result = (value << 1) & ((1 << bits) - 1)
+        if value >> (bits - 1):
+            result ^= _MAC_B[self.block_size]
+        return result
+
+    def _get_subkeys(self) -> Tuple[int, int]:
+        key_1 = self._shift_subkey(self._cipher_obj.encrypt_int(0))
+        return key_1, self._shift_subkey(key_1)
+
+    def update(self, data: bytearray) -> None:
+        """
+        Absorb the next part of the message.
+
+        Args:
+            data: Any bytes-like object.
+        """
+        data = memoryview(data).cast("B")
+        begin = min(self.block_size - self._last_len, len(data))
+        if begin:
+            self._last = (self._last << begin * 8) | bytearray_to_int(data[:begin])
+            self._last_len += begin
+        tracer = tracing.tracer
+        for i in range(begin, len(data), self.block_size):
+            self._prev = self._cipher_obj.encrypt_int(self._prev ^ self._last)
+            if tracer is not None:
+                tracer.record(tracing.MAC_CHAIN, self._prev, width=self.block_size)
+            block = data[i: i + self.block_size]
+            self._last = bytearray_to_int(block)
+            self._last_len = len(block)
+
+    def digest(self) -> bytearray:
+        """
+        Return the MAC of the data absorbed so far.
+
+        The state is not modified, so more data can be added afterwards.
+        """
+        if self._last_len == self.block_size:
+            last = self._last ^ self._key_1
+        else:
+            pad_len = (self.block_size - self._last_len) * 8
+            last = (self._last << pad_len | 1 << (pad_len - 1)) ^ self._key_2
+        mac = self._cipher_obj.encrypt_int(self._prev ^ last)
+        return int_to_bytearray(mac, self.block_size)[: self.mac_size]
+
+    def hexdigest(self) -> str:
+        """Return the MAC as a string of hexadecimal digits."""
+        return self.digest().hex()
+
+    def verify(self, mac: bytearray) -> bool:
+        """
+        Check the MAC of the data absorbed so far in constant time.
+
+        Args:
+            mac: The expected MAC.
+        """
+        return compare(self.digest(), mac)
+
+    def clear(self) -> None:
+        """Сlearing the values of iterative encryption keys and subkeys."""
+        super().clear()
+        self._key_1 = 0
+        self._key_2 = 0
+        self._prev = 0
+        self._last = 0
+
+
+class GOST_34_13_2015_Counter(GOST_34_13_2015):
+    """
+    Режим гаммирования (CTR).
+
+    Gamma blocks are the encrypted values of consecutive counters, so they
+    do not depend on each other and are generated in batches with the
+    NumPy engine of the block cipher. When an executor is given, batches
+    are spread over its workers by counter ranges.
+
+    Consecutive calls continue one stream: the unused part of the gamma
+    block of an incomplete block is carried over to the next call, so
+    the data may be split anywhere.
+    """
+
+    __slots__ = (
+        "_executor",
+        "_counter",
+        "_stream_gamma",
+        "_stream_offset",
+        "batch_blocks",
+    )
+
+    def __init__(
+        self,
+        key: "bytearray | GOST_34_12_2015",
+        init_vect: bytearray,
+        key_cache: KeyScheduleCache | None = None,
+        executor: "Executor | None" = None,
+    ) -> None:
+        """
+        Args:
+            key: The encryption key (32 bytes) or a block cipher object.
+            init_vect: The initialization vector (half of the block size).
+            key_cache: Optional cache of expanded key schedules.
+            executor: Optional executor (e.g. 'ProcessPoolExecutor') used to
+              generate the gamma of large messages in parallel.
+        """
+        super().__init__(key, key_cache)
+        check_init_vect = isinstance(init_vect, (bytes, bytearray))
+        if (not check_init_vect) or len(init_vect) != self.block_size // 2:
+            self.clear()
+            raise GOSTCipherError(
+                f"GOSTCipherError: invalid initialization vector value.\n"
+                f"Condition: len(init_vect) != self.block_size // 2.\n"
+                f"Result: {len(init_vect)} != {self.block_size // 2}"
+            )
+        self._executor = executor
+        # Number of gamma blocks generated per batch (and per executor task)
+        self.batch_blocks = 4096
+        # Gamma block of an incomplete block in the stream and the number of
+        # its bytes already used (0 if there is none)
+        self._stream_gamma = bytearray(self.block_size)
+        self._stream_offset = 0
+        # CTR_1 = IV || 0...0
+        self._counter = bytearray_to_int(init_vect) << (self.block_size * 4)
+
+    def clear(self) -> None:
+        """Clearing the gamma of an incomplete block and the iterative keys."""
+        if getattr(self, "_stream_gamma", None) is not None:
+            zero_fill(self._stream_gamma)
+        super().clear()
+
+    def _continue_block(self, src: memoryview, dst: memoryview) -> int:
+        offset = self._stream_offset
+        size = min(self.block_size - offset, len(src))
+        xor_into(src[:size], self._stream_gamma[offset: offset + size], dst[:size])
+        self._stream_offset = (offset + size) % self.block_size
+        return size
+
+    def _iter_gamma(self, num_block: int) -> Iterator[Tuple[int, bytes]]:
+        counter = self._counter
+        if self._executor is None:
+            for begin in range(0, num_block, self.batch_blocks):
+                count = min(self.batch_blocks, num_block - begin)
+                blocks = _counter_blocks(counter + begin, count, self.block_size)
+                yield begin, self._cipher_obj.encrypt_blocks(blocks)
+            return
+
+        cipher_class = type(self._cipher_obj)
+        iter_key = self._cipher_obj._cipher_iter_key
+        begins = range(0, num_block, self.batch_blocks)
+        tasks = (
+            (
+                cipher_class,
+                iter_key,
+                counter + begin,
+                min(self.batch_blocks, num_block - begin),
+            )
+            for begin in begins
+        )
+        gammas = map_bounded(
+            self._executor, _counter_gamma, tasks, 2 * (os.cpu_count() or 1)
+        )
+        yield from zip(begins, gammas)
+
+    def encrypt_into(self, src, dst) -> int:
+        """
+        Encrypt the next chunk of the stream into a caller-provided buffer.
+
+        Chunks do not have to be multiples of the block size. The
+        concatenated output of any sequence of calls is equal to the output
+        of one call for the concatenated input.
+
+        Args:
+            src: The input data (any object supporting the buffer protocol).
+            dst: The writable output buffer (at least as long as 'src'); it
+              may be 'src' itself for in-place encryption.
+
+        Returns:
+            The number of bytes written.
+        """
+        src = memoryview(src).cast("B")
+        dst = memoryview(dst).cast("B")
+        if len(dst) < len(src):
+            raise GOSTCipherError(
+                f"GOSTCipherError: output buffer is too small. "
+                f"Condition: len(dst) >= len(src). Result: {len(dst)} < {len(src)}"
+            )
+        head = 0
+        if self._stream_offset and len(src):
+            head = self._continue_block(src, dst)
+        size = len(src) - head
+        num_block = -(-size // self.block_size)
+        tracer = tracing.tracer
+        for begin, gamma in self._iter_gamma(num_block):
+            if tracer is not None:
+                for i, block in enumerate(_iter_blocks(gamma, self.block_size)):
+                    tracer.record(
+                        tracing.GAMMA, block, index=begin + i, width=self.block_size
+                    )
+            begin *= self.block_size
+            gamma = memoryview(gamma).cast("B")
+            end = head + min(begin + len(gamma), size)
+            begin += head
+            xor_into(src[begin:end], gamma, dst[begin:end])
+        if size % self.block_size:
+            # The rest of the last gamma block is used by the next call
+            self._stream_gamma[:] = gamma[-self.block_size:]
+            self._stream_offset = size % self.block_size
+        self._counter = (self._counter + num_block) % (1 << self.block_size * 8)
+        return len(src)
+
+    def decrypt_into(self, src, dst) -> int:
+        """Decrypt the data into a caller-provided buffer."""
+        return self.encrypt_into(src, dst)
+
+    def finalize(self) -> bytearray:
+        """
+        Finish the stream.
+
+        The counter mode keeps no buffered data, so the result is always
+        empty. The gamma of an incomplete last block is discarded and the
+        next call starts at the next counter block.
+        """
+        zero_fill(self._stream_gamma)
+        self._stream_offset = 0
+        return bytearray()
+
+    def encrypt(self, data: bytearray) -> bytearray:
+        if not isinstance(data, (bytes, bytearray)):
+            self.clear()
+            raise GOSTCipherError("GOSTCipherError: invalid plaintext data")
+        result = bytearray(len(data))
+        self.encrypt_into(data, result)
         return result
 
     def decrypt(self, data: bytearray) -> bytearray:
         if not isinstance(data, (bytes, bytearray)):
             self.clear()
             raise GOSTCipherError("GOSTCipherError: invalid ciphertext data")
-        logger.debug(f"{self.__class__.__name__}\n[decrypt] >>>")
         return self.encrypt(data)
 
-    @property
-    def iv(self) -> bytearray:
-        """Return the value of the initializing vector."""
-        return self._init_vect[len(self._init_vect) - self.block_size::]
 
+def _counter_blocks(counter: int, num_block: int, block_size: int) -> "np.ndarray":
+    """
+    Return 'num_block' consecutive counter values as an N x block size array.
+
+    A 128-bit counter is split into two 64-bit words; the low word wraps
+    around with a carry into the high word, so values are taken modulo
+    2^128 (and modulo 2^64 for 64-bit blocks).
+    """
+    import numpy as np
+
+    counter_hi, counter_lo = divmod(counter, 1 << 64)
+    low = np.arange(num_block, dtype=np.uint64) + np.uint64(counter_lo)
+    blocks = np.empty((num_block, block_size // 8), dtype=">u8")
+    blocks[:, -1] = low
+    if block_size > 8:
+        high = np.full(num_block, counter_hi, dtype=np.uint64)
+        high[low < np.uint64(counter_lo)] += np.uint64(1)
+        blocks[:, 0] = high
+    return blocks.view(np.uint8).reshape(num_block, block_size)
+
+
+def _lockstep_gamma(
+    cipher_obj: GOST_34_12_2015,
+    registers: List[List[int]],
+    num_blocks: List[int],
+) -> List[bytearray]:
+    """
+    Generate the OFB gamma of several shift registers in lockstep.
+
+    Every block of every register is an independent chain (lane). At each
+    step the next gamma block of all lanes still in use is computed with one
+    batched call of the block cipher. The lanes are sorted by the number of
+    steps they need, so the lanes in use always form a prefix.
+
+    Args:
+        cipher_obj: The block cipher object.
+        registers: The shift registers, oldest block first; they are
+          advanced in place.
+        num_blocks: Number of gamma blocks needed from every register.
 
-class GOSTCipherError(Exception):
-    pass
+    Returns:
+        The gamma of every register.
+    """
+    import numpy as np
+
+    block_size = cipher_obj.block_size
+    # Register, position in the register and number of steps of every lane
+    lanes = sorted(
+        (
+            (num_block // len(register) + (pos < num_block % len(register)), i, pos)
+            for i, (register, num_block) in enumerate(zip(registers, num_blocks))
+            for pos in range(len(register))
+        ),
+        reverse=True,
+    )
+    state = np.frombuffer(
+        b"".join(
+            registers[i][pos].to_bytes(block_size, "big") for _, i, pos in lanes
+        ),
+        dtype=np.uint8,
+    ).reshape(-1, block_size)
+    # Index of the gamma block of every lane at the first step in the common
+    # gamma buffer, and the distance between its blocks
+    offsets = np.cumsum([0] + num_blocks[:-1])
+    first = np.array([offsets[i] + pos for _, i, pos in lanes], dtype=np.intp)
+    stride = np.array([len(registers[i]) for _, i, _ in lanes], dtype=np.intp)
+    gamma = np.empty((sum(num_blocks), block_size), dtype=np.uint8)
+
+    num_steps = lanes[0][0] if lanes else 0
+    active = len(lanes)
+    for step in range(num_steps):
+        while lanes[active - 1][0] <= step:
+            active -= 1
+        state = cipher_obj.encrypt_blocks(state[:active])
+        gamma[first[:active] + step * stride[:active]] = state
+
+    result = []
+    for register, num_block, offset in zip(registers, num_blocks, offsets):
+        data = bytearray(gamma[offset: offset + num_block])
+        tail = range(max(num_block - len(register), 0), num_block)
+        register[:] = register[min(num_block, len(register)):] + [
+            bytearray_to_int(data[k * block_size: (k + 1) * block_size]) for k in tail
+        ]
+        result.append(data)
+    return result
+
+
+def _iter_blocks(data, block_size: int) -> Iterator[int]:
+    data = memoryview(data).cast("B")
+    for begin in range(0, len(data), block_size):
+        yield bytearray_to_int(data[begin: begin + block_size])
+
+
+def _counter_gamma(task: Tuple[type, List[int], int, int]) -> bytes:
+    """
+    Generate a range of CTR gamma in a worker process.
+
+    The task is '(cipher_class, iter_key, counter, num_block)'.
+    """
+    cipher_class, iter_key, counter, num_block = task
+    cipher_obj = cipher_class._from_key_schedule(iter_key, [0] * len(iter_key))
+    blocks = _counter_blocks(counter, num_block, cipher_obj.block_size)
+    return cipher_obj.encrypt_blocks(blocks).tobytes()
@@ -0,0 +1,109 @@
+import hashlib
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Callable
+from typing import Tuple
+
+from ciphers.block.utils import zero_fill
+
+KeySchedule = Tuple[array, ...]
+
+
+class KeyScheduleCache:
+    """
+    Bounded LRU cache of expanded key schedules.
+
+    Entries are looked up by a keyed BLAKE2b digest of the key, with a
+    secret generated per process, so the raw key is never stored. The
+    cipher objects get copies of a cached schedule; the round keys of an
+    evicted entry are zeroed in place before it is dropped.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        Args:
+            maxsize: Maximum number of key schedules kept in the cache.
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be ge 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._secret = os.urandom(hashlib.blake2b.MAX_KEY_SIZE)
+        self._entries: OrderedDict[bytes, KeySchedule] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self):
+        return (
+            f"KeyScheduleCache"
+            f"(maxsize={self.maxsize}, "
+            f"size={len(self)}, "
+            f"hits={self.hits}, "
+            f"misses={self.misses})"
+        )
+
+    def _digest(
+        self, key: bytearray, expand_key: Callable[[bytearray], KeySchedule]
+    ) -> bytes:
+        digest = hashlib.blake2b(key, key=self._secret)
+        # Schedules of different algorithms for the same key are kept apart
+        digest.update(expand_key.__qualname__.encode())
+        return digest.digest()
+
+    @staticmethod
+    def _wipe(schedule: KeySchedule) -> None:
+        """
+        Zero the buffers of the round keys of a cached schedule in place.
+
+        Only the copy kept by the cache is wiped: the cipher objects hold
+        their own copies and clear them themselves.
+        """
+        for iter_key in schedule:
+            zero_fill(iter_key)
+
+    def get(
+        self, key: bytearray, expand_key: Callable[[bytearray], KeySchedule]
+    ) -> KeySchedule:
+        """
+        Return the key schedule for 'key', expanding it on a miss.
+
+        Args:
+            key: The encryption key.
+            expand_key: Key expansion called with 'key' on a miss.
+
+        Returns:
+            A copy of the cached key schedule, so that wiping it on the
+            caller's side never affects the cache and vice versa.
+        """
+        digest = self._digest(key, expand_key)
+        with self._lock:
+            schedule = self._entries.get(digest)
+            if schedule is not None:
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return tuple(iter_key[:] for iter_key in schedule)
+            self.misses += 1
+
+        schedule = expand_key(key)
+        with self._lock:
+            cached = self._entries.setdefault(digest, schedule)
+            if cached is not schedule:
+                # Another thread expanded the same key first
+                self._wipe(schedule)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.maxsize:
+                self._wipe(self._entries.popitem(last=False)[1])
+            return tuple(iter_key[:] for iter_key in cached)
+
+    def clear(self) -> None:
+        """Wipe and drop all cached key schedules and reset the counters."""
+        with self._lock:
+            while self._entries:
+                self._wipe(self._entries.popitem()[1])
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,108 @@
+import collections
+import threading
+import time
+from typing import List
+
+from ciphers.block.gost_34_12_2015 import GOST_34_12_2015
+
+
+class GammaPrefetcher:
+    """
+    Background generator of the OFB gamma sequence.
+
+    The gamma of the output feedback mode depends only on the key and the
+    initialization vector, so a worker thread computes it ahead of the data
+    into a bounded buffer of 'depth' blocks. The thread competes for the
+    interpreter lock with the caller and pays off when the caller spends
+    time waiting for I/O between blocks.
+    """
+
+    def __init__(
+        self,
+        cipher_obj: GOST_34_12_2015,
+        init_vect: List[int],
+        depth: int = 64,
+    ) -> None:
+        """
+        Args:
+            cipher_obj: The block cipher object.
+            init_vect: The shift register (one integer per block); the
+              prefetcher works on its own copy.
+            depth: Maximum number of gamma blocks computed ahead.
+        """
+        if depth < 1:
+            raise ValueError(f"depth must be ge 1, got {depth}")
+        self.depth = depth
+        # Number of times the consumer found the buffer empty and the total
+        # time it spent waiting
+        self.stalls = 0
+        self.stall_time_ns = 0
+        self._buffer = collections.deque()
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(cipher_obj, list(init_vect)),
+            name=self.__class__.__name__,
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __repr__(self):
+        return (
+            f"GammaPrefetcher"
+            f"(depth={self.depth}, "
+            f"buffered={len(self._buffer)}, "
+            f"stalls={self.stalls}, "
+            f"stall_time_ns={self.stall_time_ns})"
+        )
+
+    def _run(self, cipher_obj: GOST_34_12_2015, init_vect: List[int]):
+        # Position of the oldest block of the register used as a ring buffer
+        pos = 0
+        while True:
+            with self._condition:
+                while len(self._buffer) >= self.depth and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    break
+            gamma = cipher_obj.encrypt_int(init_vect[pos])
+            init_vect[pos] = gamma
+            pos = (pos + 1) % len(init_vect)
+            with self._condition:
+                self._buffer.append(gamma)
+                self._condition.notify_all()
+        for i in range(len(init_vect)):
+            init_vect[i] = 0
+
+    def peek(self) -> int:
+        """Return the next gamma block, waiting for it if necessary."""
+        buffer = self._buffer
+        if not buffer:
+            start = time.perf_counter_ns()
+            with self._condition:
+                while not buffer:
+                    if self._stopped:
+                        raise RuntimeError("GammaPrefetcher is stopped")
+                    self._condition.wait()
+            self.stalls += 1
+            self.stall_time_ns += time.perf_counter_ns() - start
+        return buffer[0]
+
+    def advance(self) -> None:
+        """Drop the current gamma block and let the worker fill its slot."""
+        with self._condition:
+            self._buffer.popleft()
+            self._condition.notify_all()
+
+    def stop(self) -> None:
+        """Stop the worker thread and wipe the buffered gamma."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        with self._condition:
+            while self._buffer:
+                self._buffer[-1] = 0
+                self._buffer.pop()
@@ -0,0 +1,114 @@
+"""
+Encryption of asyncio streams in the OFB mode.
+
+The stream is processed by three concurrent stages connected by bounded
+queues: reading chunks from the 'StreamReader', encrypting them in an
+executor (so the event loop is not blocked) and writing them to the
+'StreamWriter'. While a chunk is encrypted, the next ones are read and the
+previous ones are written. When the peer reads slowly, 'drain' blocks the
+writing stage, the queues fill up and reading stops, so memory use stays
+bounded by about '2 * max_pending' chunks.
+
+The gamma of the output feedback mode depends on all previous blocks, so
+the chunks are encrypted one at a time and in order with 'update': the
+output is identical to 'encrypt' of the whole stream. The gamma can still
+be computed in parallel with the 'xor' by creating the cipher object with
+'prefetch'.
+
+Usage:
+    cipher_obj = GOST_34_13_2015_GammaOutputFeedback(key, init_vect)
+    await encrypt_stream(reader, writer, cipher_obj)
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from ciphers.block.gost_34_13_2015 import GOST_34_13_2015_GammaOutputFeedback
+from ciphers.block.utils import GOSTCipherError
+
+# Size of the chunks read from the stream in bytes
+DEFAULT_CHUNK_SIZE: int = 64 * 1024
+
+
+async def encrypt_stream(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    cipher_obj: GOST_34_13_2015_GammaOutputFeedback,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: ThreadPoolExecutor | None = None,
+    max_pending: int = 4,
+) -> int:
+    """
+    Encrypt everything read from 'reader' until EOF and write it to 'writer'.
+
+    The writer is drained but not closed. The cipher object is finalized at
+    the end of the stream, as after a call of 'encrypt'.
+
+    Args:
+        reader: The source stream.
+        writer: The destination stream (an object with 'write' and a
+          coroutine 'drain').
+        cipher_obj: The cipher object in the output feedback mode.
+        chunk_size: Maximum number of bytes read and encrypted at once.
+        executor: The thread pool running the encryption (the default
+          executor of the event loop if None). A process pool is rejected:
+          every chunk would be encrypted by a copy of the cipher object in
+          its initial state, reusing the same gamma.
+        max_pending: Number of chunks buffered between two stages.
+
+    Returns:
+        The number of bytes written.
+    """
+    if chunk_size < 1 or max_pending < 1:
+        raise GOSTCipherError(
+            f"GOSTCipherError: chunk_size and max_pending must be ge 1, "
+            f"got {chunk_size} and {max_pending}"
+        )
+    if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+        raise GOSTCipherError(
+            f"GOSTCipherError: the executor must be a ThreadPoolExecutor, "
+            f"got {type(executor).__name__}"
+        )
+    loop = asyncio.get_running_loop()
+    read_queue = asyncio.Queue(max_pending)
+    write_queue = asyncio.Queue(max_pending)
+    written = 0
+
+    async def read_chunks() -> None:
+        while chunk := await reader.read(chunk_size):
+            await read_queue.put(chunk)
+        await read_queue.put(None)
+
+    async def encrypt_chunks() -> None:
+        while (chunk := await read_queue.get()) is not None:
+            await write_queue.put(
+                await loop.run_in_executor(executor, cipher_obj.update, chunk)
+            )
+        cipher_obj.finalize()
+        await write_queue.put(None)
+
+    async def write_chunks() -> None:
+        nonlocal written
+        while (chunk := await write_queue.get()) is not None:
+            writer.write(chunk)
+            written += len(chunk)
+            await writer.drain()
+
+    async with asyncio.TaskGroup() as task_group:
+        task_group.create_task(read_chunks())
+        task_group.create_task(encrypt_chunks())
+        task_group.create_task(write_chunks())
+    return written
+
+
+async def decrypt_stream(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    cipher_obj: GOST_34_13_2015_GammaOutputFeedback,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: ThreadPoolExecutor | None = None,
+    max_pending: int = 4,
+) -> int:
+    """Decrypt everything read from 'reader' (see 'encrypt_stream')."""
+    return await encrypt_stream(
+        reader, writer, cipher_obj, chunk_size, executor, max_pending
+    )
@@ -1,3 +1,9 @@
+import ctypes
+
+# Largest buffer size in bytes for which 'xor_into' uses big integers
+# instead of NumPy, whose fixed call overhead dominates for small buffers
+_XOR_INT_SIZE = 2048
+
 
 def check_value(value: bytearray, size_value: int) -> bool:
     """
@@ -41,30 +47,70 @@ def add_xor(op_a: bytearray, op_b: bytearray) -> bytearray:
     Returns:
         Result of the byte-by-byte 'xor' operation.
     """
-    op_a = bytearray(op_a)
-    op_b = bytearray(op_b)
-    result_len = min(len(op_a), len(op_b))
-    result = bytearray(result_len)
-    for i in range(result_len):
-        result[i] = op_a[i] ^ op_b[i]
+    result = bytearray(min(len(op_a), len(op_b)))
+    xor_into(memoryview(op_a)[: len(result)], op_b, result)
     return result
 
 
+def xor_into(op_a, op_b, out) -> None:
+    """
+    Byte-by-byte 'xor' operation of two buffers into a third one.
+
+    The operands are accessed through the buffer protocol without copying,
+    so any bytes-like object (bytes, bytearray, memoryview, mmap, NumPy
+    array) can be used, and 'out' may be the same buffer as an operand.
+    Buffers up to '_XOR_INT_SIZE' bytes are processed as two big integers,
+    larger ones with NumPy on zero-copy views.
+
+    Args:
+        op_a: The first operand.
+        op_b: The second operand (at least as long as 'op_a').
+        out: The writable buffer for the result (at least as long as 'op_a').
+    """
+    op_a = memoryview(op_a).cast("B")
+    size = len(op_a)
+    if size <= _XOR_INT_SIZE:
+        op_b = memoryview(op_b).cast("B")[:size]
+        value = int.from_bytes(op_a, "big") ^ int.from_bytes(op_b, "big")
+        memoryview(out).cast("B")[:size] = value.to_bytes(size, "big")
+        return
+
+    import numpy as np
+
+    np.bitwise_xor(
+        np.frombuffer(op_a, dtype=np.uint8, count=size),
+        np.frombuffer(op_b, dtype=np.uint8, count=size),
+        out=np.frombuffer(out, dtype=np.uint8, count=size),
+    )
+
+
 def zero_fill(value: bytearray) -> bytearray:
     """
     Zeroing byte objects.
 
+    A writable buffer ('bytearray', 'array.array', a NumPy array or a
+    writable 'memoryview') is overwritten in place with 'memset', without
+    allocating a zero buffer of the same size, so no copy of its former
+    contents is left; an immutable 'bytes' object cannot be, and a zeroed
+    'bytearray' of the same length is returned instead.
+
     Args:
         value: The byte object that you want to reset.
 
     Returns:
         Reset value.
     """
-    result = b""
-    if isinstance(value, (bytes, bytearray)):
-        result = b"/x00" * len(value)
-        result = bytearray(result)
-    return result
+    if isinstance(value, bytes):
+        return bytearray(len(value))
+    try:
+        with memoryview(value) as view:
+            size = view.nbytes
+        buffer = (ctypes.c_char * size).from_buffer(value)
+    except TypeError:
+        return b""
+    ctypes.memset(ctypes.addressof(buffer), 0, size)
+    del buffer
+    return value
 
 
 def bytearray_to_int(value: bytearray) -> int:
@@ -91,9 +137,8 @@ def int_to_bytearray(value: int, num_byte: int) -> bytearray:
     Returns:
         The 'bytearray' object from long integer value.
     """
-    return bytearray(
-        [(value & (0xFF << pos * 8)) >> pos * 8 for pos in range(num_byte - 1, -1, -1)]
-    )
+    value &= (1 << num_byte * 8) - 1
+    return bytearray(value.to_bytes(num_byte, byteorder="big"))
 
 
 def compare(op_a: bytearray, op_b: bytearray) -> bool:
@@ -139,3 +184,7 @@ def compare_to_zero(value: bytearray) -> bool:
         check = value[i[0]] ^ 0x00
         res_check = res_check + check
     return not res_check
+
+
+class GOSTCipherError(Exception):
+    pass
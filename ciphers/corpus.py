@@ -0,0 +1,303 @@
+"""
+Encryption of document corpora with the classical ciphers in a process pool.
+
+The cipher configurations are sent to every worker once, in its
+initializer, and each worker builds every cipher object once; the tasks
+carry only the configuration identifiers and the texts. Documents are
+sent in chunks of at most 'chunk_size' documents or about 'shard_size'
+characters, and a document longer than 'shard_size' is split into shards
+processed by different workers and joined back:
+
+- 'TrisemusSubstitutionCipher' replaces every symbol independently, so its
+  texts are split anywhere;
+- 'TranspositionCipher' reverses the order of the blocks of the prepared
+  text, so it is split on 'block_size' boundaries and the encrypted shards
+  are joined in the reverse order. Only the last shard is padded.
+
+The results are the same as those of the cipher objects in one process and
+are returned in the order of the documents.
+
+Usage:
+    configs = {"t": CipherConfig(TrisemusSubstitutionCipher, {"keyword": "ключ"})}
+    with CorpusPool(configs) as pool:
+        for ciphertext in pool.encrypt(documents):  # (config_id, text)
+            ...
+        pool.report()
+"""
+import collections
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Literal
+from typing import Mapping
+from typing import NamedTuple
+from typing import Tuple
+
+from loguru import logger
+
+from ciphers.abc import AbstractCipher
+from ciphers.pool import map_bounded
+from ciphers.substitution.algorithm import TrisemusSubstitutionCipher
+from ciphers.transposition.algorithm import TranspositionCipher
+
+Action = Literal["encrypt", "decrypt"]
+
+# Cipher objects of the worker process by configuration identifier
+_worker_ciphers: Dict[Hashable, AbstractCipher] = {}
+
+
+class CipherConfig(NamedTuple):
+    """A cipher class and the keyword arguments of its constructor."""
+
+    cipher_class: type
+    kwargs: Mapping[str, Any] = {}
+
+    def build(self) -> AbstractCipher:
+        return self.cipher_class(**self.kwargs)
+
+
+class WorkerStats(NamedTuple):
+    """Work done by one worker process."""
+
+    tasks: int
+    characters: int
+    seconds: float
+
+    @property
+    def throughput(self) -> float:
+        """Return the throughput in millions of characters per second."""
+        if not self.seconds:
+            return 0.0
+        return self.characters / self.seconds / 1e6
+
+
+class _Sharding(NamedTuple):
+    # Split a text: (cipher_obj, text, action, shard_size) -> [(method, part)]
+    split: Callable[..., List[Tuple[str, str]]]
+    # Join the processed parts: (cipher_obj, parts, action) -> text
+    join: Callable[..., str]
+
+
+def _split_trisemus(
+    cipher_obj: TrisemusSubstitutionCipher, text: str, action: Action, shard_size: int
+) -> List[Tuple[str, str]]:
+    return [
+        (action, text[begin: begin + shard_size])
+        for begin in range(0, len(text), shard_size)
+    ]
+
+
+def _join_trisemus(
+    cipher_obj: TrisemusSubstitutionCipher, parts: List[str], action: Action
+) -> str:
+    return "".join(parts)
+
+
+def _split_transposition(
+    cipher_obj: TranspositionCipher, text: str, action: Action, shard_size: int
+) -> List[Tuple[str, str]]:
+    text = cipher_obj.prepare_text(text)
+    block_size = cipher_obj.block_size
+    shard_size = max(shard_size - shard_size % block_size, block_size)
+    if len(text) <= shard_size:
+        return [(action, text)]
+    # Decryption is the same transposition followed by the removal of the
+    # padding, which is done once on the joined text
+    return [
+        ("encrypt", text[begin: begin + shard_size])
+        for begin in range(0, len(text), shard_size)
+    ]
+
+
+def _join_transposition(
+    cipher_obj: TranspositionCipher, parts: List[str], action: Action
+) -> str:
+    if len(parts) == 1:
+        return parts[0]
+    text = " ".join(parts[::-1])
+    if action == "decrypt":
+        text = text.rstrip(cipher_obj.padding_str)
+    return text
+
+
+_SHARDING: Dict[type, _Sharding] = {
+    TrisemusSubstitutionCipher: _Sharding(_split_trisemus, _join_trisemus),
+    TranspositionCipher: _Sharding(_split_transposition, _join_transposition),
+}
+
+
+def _get_sharding(cipher_obj: AbstractCipher) -> _Sharding | None:
+    for cipher_class, sharding in _SHARDING.items():
+        if isinstance(cipher_obj, cipher_class):
+            return sharding
+    return None
+
+
+class CorpusPool:
+    """
+    Process pool encrypting the documents of a corpus.
+
+    Every document is a job '(config_id, text)'. At most two chunks per
+    worker are in flight, so arbitrarily long iterables of documents are
+    streamed with bounded memory.
+    """
+
+    def __init__(
+        self,
+        configs: Mapping[Hashable, CipherConfig],
+        max_workers: int | None = None,
+        chunk_size: int = 256,
+        shard_size: int = 1024 * 1024,
+    ) -> None:
+        """
+        Args:
+            configs: The cipher configurations by identifier.
+            max_workers: Number of worker processes (the number of CPUs by
+              default).
+            chunk_size: Maximum number of documents sent to a worker at once.
+            shard_size: Number of characters above which a document is split
+              and a chunk is sent.
+        """
+        if chunk_size < 1 or shard_size < 1:
+            raise ValueError(
+                f"chunk_size and shard_size must be ge 1, got {chunk_size} and {shard_size}"
+            )
+        self.chunk_size = chunk_size
+        self.shard_size = shard_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # The configurations are checked and used for splitting in the
+        # parent process
+        self._ciphers = {
+            config_id: config.build() for config_id, config in configs.items()
+        }
+        # Tasks, characters and seconds by worker process identifier
+        self._stats: Dict[int, List[float]] = {}
+        self._executor = ProcessPoolExecutor(
+            self.max_workers, initializer=_init_worker, initargs=(dict(configs),)
+        )
+
+    def __enter__(self) -> "CorpusPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the workers."""
+        if getattr(self, "_executor", None) is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    @property
+    def stats(self) -> Dict[int, WorkerStats]:
+        """Return the work done so far by every worker process."""
+        return {
+            pid: WorkerStats(int(tasks), int(characters), seconds)
+            for pid, (tasks, characters, seconds) in self._stats.items()
+        }
+
+    def report(self) -> None:
+        """Log the throughput of every worker process."""
+        for pid, stats in sorted(self.stats.items()):
+            logger.info(
+                f"worker {pid}: {stats.tasks} tasks, {stats.characters} characters, "
+                f"{stats.seconds:.3f} s, {stats.throughput:.2f} Mchar/s"
+            )
+
+    def _iter_chunks(
+        self, documents: Iterable[Tuple[Hashable, str]], action: Action
+    ) -> Iterator[Tuple[list, list]]:
+        # A chunk is a list of tasks '(config_id, method, text)' and the
+        # layout of its documents '(config_id, number of parts)'; a document
+        # may continue in the next chunks
+        tasks, layout, size = [], [], 0
+        for config_id, text in documents:
+            cipher_obj = self._ciphers.get(config_id)
+            if cipher_obj is None:
+                raise KeyError(f"unknown config id {config_id!r}")
+            sharding = _get_sharding(cipher_obj)
+            if sharding is None or len(text) <= self.shard_size:
+                parts = [(action, text)]
+            else:
+                parts = sharding.split(cipher_obj, text, action, self.shard_size)
+            layout.append((config_id, len(parts)))
+            for method, part in parts:
+                tasks.append((config_id, method, part))
+                size += len(part)
+                if size >= self.shard_size or len(tasks) >= self.chunk_size:
+                    yield tasks, layout
+                    tasks, layout, size = [], [], 0
+        if tasks or layout:
+            yield tasks, layout
+
+    def _process(
+        self, documents: Iterable[Tuple[Hashable, str]], action: Action
+    ) -> Iterator[str]:
+        if self._executor is None:
+            raise RuntimeError("the pool is closed")
+        layout = collections.deque()
+        results = collections.deque()
+
+        def iter_tasks() -> Iterator[list]:
+            # The layout of a chunk is known before its results are returned
+            for tasks, chunk_layout in self._iter_chunks(documents, action):
+                layout.extend(chunk_layout)
+                yield tasks
+
+        chunk_results = map_bounded(
+            self._executor, _run_tasks, iter_tasks(), 2 * self.max_workers
+        )
+        for parts, pid, characters, seconds in chunk_results:
+            stats = self._stats.setdefault(pid, [0, 0, 0.0])
+            stats[0] += 1
+            stats[1] += characters
+            stats[2] += seconds
+            results.extend(parts)
+            while layout and len(results) >= layout[0][1]:
+                config_id, num_parts = layout.popleft()
+                document = [results.popleft() for _ in range(num_parts)]
+                if num_parts == 1:
+                    yield document[0]
+                else:
+                    cipher_obj = self._ciphers[config_id]
+                    yield _get_sharding(cipher_obj).join(cipher_obj, document, action)
+
+    def encrypt(self, documents: Iterable[Tuple[Hashable, str]]) -> Iterator[str]:
+        """
+        Encrypt the documents.
+
+        Args:
+            documents: Pairs '(config_id, text)'.
+
+        Returns:
+            An iterator over the encrypted texts in the order of the documents.
+        """
+        return self._process(documents, "encrypt")
+
+    def decrypt(self, documents: Iterable[Tuple[Hashable, str]]) -> Iterator[str]:
+        """Decrypt the documents (see 'encrypt')."""
+        return self._process(documents, "decrypt")
+
+
+def _init_worker(configs: Dict[Hashable, CipherConfig]) -> None:
+    for config_id, config in configs.items():
+        _worker_ciphers[config_id] = config.build()
+
+
+def _run_tasks(
+    tasks: List[Tuple[Hashable, str, str]]
+) -> Tuple[List[str], int, int, float]:
+    start = time.perf_counter()
+    result = [
+        getattr(_worker_ciphers[config_id], method)(text)
+        for config_id, method, text in tasks
+    ]
+    characters = sum(len(text) for _, _, text in tasks)
+    return result, os.getpid(), characters, time.perf_counter() - start
@@ -0,0 +1,63 @@
+"""
+Bounded submission of tasks to an executor.
+
+'Executor.map' submits every task before it returns, so the whole input
+and all the results may be held in memory at once. 'map_bounded' consumes
+the input lazily and keeps at most 'max_pending' tasks in flight, which
+lets the pools stream arbitrarily long iterables with bounded memory.
+
+Usage:
+    for result in map_bounded(executor, func, chunks, 2 * max_workers):
+        ...
+"""
+import collections
+from typing import TYPE_CHECKING
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import TypeVar
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_bounded(
+    executor: "Executor",
+    func: Callable[[T], R],
+    iterable: Iterable[T],
+    max_pending: int,
+) -> Iterator[R]:
+    """
+    Apply a function to every item in an executor with bounded lookahead.
+
+    The next item is taken from 'iterable' only when fewer than
+    'max_pending' tasks are in flight.
+
+    Args:
+        executor: The executor running the tasks.
+        func: The function applied to every item (picklable for process
+          executors).
+        iterable: The items, consumed lazily.
+        max_pending: Maximum number of submitted tasks whose results have
+          not been returned yet.
+
+    Returns:
+        An iterator over the results in the order of the items.
+    """
+    if max_pending < 1:
+        raise ValueError(f"max_pending must be ge 1, got {max_pending}")
+    pending = collections.deque()
+    try:
+        for item in iterable:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # The tasks of an abandoned iteration are not run
+        for future in pending:
+            future.cancel()
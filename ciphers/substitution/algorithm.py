@@ -1,11 +1,174 @@
+import functools
 import pprint
 import string
+from typing import IO
+from typing import Iterable
+from typing import Iterator
 from typing import Literal
+from typing import NamedTuple
 
 from loguru import logger
 
 from ciphers.abc import AbstractCipher
 
+# Количество символов в строке таблицы Тритемия
+_ROW_LENGTH = 6
+# Символы, удаляемые из текста перед обработкой
+_STRIPPED = "\n\t"
+# Однобайтовые кодировки, в которых замена выполняется 'bytes.translate'
+_CODECS = ("latin-1", "cp1251", "cp1252")
+
+# Количество символов, читаемых из файла за один раз потоковыми методами
+DEFAULT_CHUNK_SIZE: int = 1024 * 1024
+
+
+class _TranslationMap(dict):
+    """
+    Таблица для 'str.translate', отвергающая символы вне алфавита.
+
+    Отсутствующий символ вызывает исключение прямо во время 'translate',
+    поэтому проверка текста и его обработка выполняются за один проход.
+    """
+
+    __slots__ = ("lang",)
+
+    def __init__(self, mapping: dict[int, str | None], lang: str):
+        super().__init__(mapping)
+        self.lang = lang
+
+    def __missing__(self, key: int):
+        # Не 'LookupError': такие исключения 'translate' считает отсутствием
+        # замены и оставляет символ как есть
+        raise Exception(f"symbol '{chr(key)}' not exist in {self.lang} alphabet")
+
+
+class _Translation:
+    """
+    Замена символов текста, собранная для одного направления.
+
+    Если все символы алфавита есть в одной из однобайтовых кодировок
+    '_CODECS', текст кодируется в нее и заменяется 'bytes.translate', а
+    символы вне алфавита переходят в байт 'invalid', наличие которого
+    проверяется одним поиском; иначе, как и при ошибке, применяется
+    'str.translate' с '_TranslationMap'.
+    """
+
+    __slots__ = ("mapping", "codec", "table", "delete", "invalid")
+
+    def __init__(self, mapping: dict[str, str | None], lang: str):
+        """
+        :param mapping: dict[str, str | None]: Замены символов (None удаляет символ).
+        :param lang: str: Язык алфавита (для сообщений об ошибках).
+        """
+        self.mapping = _TranslationMap(
+            {ord(char): value for char, value in mapping.items()}, lang
+        )
+        self.codec = None
+        for codec in _CODECS:
+            try:
+                encoded = {
+                    char.encode(codec): (value or "").encode(codec)
+                    for char, value in mapping.items()
+                }
+            except UnicodeEncodeError:
+                continue
+            outputs = set(encoded.values())
+            self.invalid = next(
+                bytes([byte]) for byte in range(256) if bytes([byte]) not in outputs
+            )
+            table = bytearray(self.invalid * 256)
+            for char, value in encoded.items():
+                if value:
+                    table[char[0]] = value[0]
+            self.table = bytes(table)
+            self.delete = b"".join(char for char, value in encoded.items() if not value)
+            self.codec = codec
+            break
+
+    def __call__(self, text: str) -> str:
+        if self.codec is not None:
+            try:
+                data = text.encode(self.codec)
+            except UnicodeEncodeError:
+                pass
+            else:
+                data = data.translate(self.table, self.delete)
+                if self.invalid not in data:
+                    return data.decode(self.codec)
+        # Исключение для первого символа вне алфавита выбрасывает
+        # '_TranslationMap'
+        return text.translate(self.mapping)
+
+
+class _CompiledTrisemus(NamedTuple):
+    table: tuple[tuple[str, ...], ...]
+    encrypt: _Translation
+    decrypt: _Translation
+
+
+@functools.lru_cache(maxsize=128)
+def _compile(
+    lang: str, default_alphabet: str, keyword: str, shift: int, extra_symbols: str
+) -> _CompiledTrisemus:
+    """
+    Строит таблицу Тритемия и таблицы замены для шифрования и дешифрования.
+
+    Результат кэшируется, поэтому объекты с одинаковыми параметрами
+    создаются без повторных вычислений.
+
+    :param lang: str: Язык алфавита (для сообщений об ошибках).
+    :param default_alphabet: str: Алфавит языка.
+    :param keyword: str: Ключевое слово в нижнем регистре.
+    :param shift: int: Сдвиг для шифрования.
+    :param extra_symbols: str: Знаки препинания и цифры, добавляемые в алфавит.
+
+    :return: _CompiledTrisemus
+    """
+    assert (
+        TrisemusSubstitutionCipher.is_symbols_in_alphabet(
+            text=keyword, alphabet=default_alphabet
+        )[0]
+        is True
+    ), f"symbol not exist in {lang} alphabet"
+
+    unique_keyword = "".join(sorted(set(keyword), key=keyword.index))
+    remaining_chars = "".join(sorted(set(default_alphabet) - set(unique_keyword)))
+    alphabet = unique_keyword + remaining_chars + extra_symbols
+
+    table = [
+        list(alphabet[i : i + _ROW_LENGTH])
+        for i in range(0, len(alphabet), _ROW_LENGTH)
+    ]
+    if len(table) > 0 and len(table[-1]) < _ROW_LENGTH:
+        table[-1].extend(["" for _ in range(_ROW_LENGTH - len(table[-1]))])
+    trisemus_alphabet_table_string = pprint.pformat(table, indent=2)
+    logger.debug(f"trisemus_alphabet_table:\n{trisemus_alphabet_table_string}")
+    assert 0 <= shift < len(table), f"shift must be ge 0 and lt {len(table)}"
+
+    # Символ заменяется символом того же столбца, сдвинутым на 'shift' строк;
+    # пустые ячейки последней строки дают пустую замену
+    encrypt_map = {}
+    decrypt_map = {}
+    for row, row_chars in enumerate(table):
+        for col, char in enumerate(row_chars):
+            if char:
+                encrypt_map[char] = table[(row + shift) % len(table)][col]
+                decrypt_map[char] = table[(row - shift) % len(table)][col]
+    # Пробел не шифруется, но при шифровании допустим, только если входит
+    # в алфавит
+    if " " in alphabet:
+        encrypt_map[" "] = " "
+    decrypt_map[" "] = " "
+    for char in _STRIPPED:
+        encrypt_map[char] = None
+        decrypt_map[char] = None
+
+    return _CompiledTrisemus(
+        table=tuple(tuple(row) for row in table),
+        encrypt=_Translation(encrypt_map, lang),
+        decrypt=_Translation(decrypt_map, lang),
+    )
+
 
 class TrisemusSubstitutionCipher(AbstractCipher):
     ALPHABETS = {
@@ -38,50 +201,22 @@ class TrisemusSubstitutionCipher(AbstractCipher):
         self.__use_punctiation = use_punctiation
         self.__use_numbers = use_numbers
 
-        self.__default_alphabet = self.ALPHABETS[self.lang]
-        assert (
-            self.is_symbols_in_alphabet(
-                text=self.__keyword, alphabet=self.__default_alphabet
-            )[0]
-            is True
-        ), f"symbol not exist in {self.lang} alphabet"
-
-        self.__row_length = 6
-        self.__unique_keyword = "".join(
-            sorted(set(self.__keyword), key=self.__keyword.index)
-        )
-
-        self.__remaining_chars = "".join(
-            sorted(set(self.__default_alphabet) - set(self.__unique_keyword))
-        )
-
-        self.__alphabet = self.__unique_keyword + self.__remaining_chars
-
+        extra_symbols = ""
         if use_punctiation:
-            self.__alphabet += self.PUNCTUATION
+            extra_symbols += self.PUNCTUATION
         if use_numbers:
-            self.__alphabet += self.NUMBERS
-
-        self.trisemus_alphabet_table = self.__generate_trisemus_table()
-        if (
-            len(self.trisemus_alphabet_table) > 0
-            and len(self.trisemus_alphabet_table[-1]) < self.__row_length
-        ):
-            self.trisemus_alphabet_table[-1].extend(
-                [
-                    ""
-                    for _ in range(
-                        self.__row_length - len(self.trisemus_alphabet_table[-1])
-                    )
-                ]
-            )
-        trisemus_alphabet_table_string = pprint.pformat(
-            self.trisemus_alphabet_table, indent=2
+            extra_symbols += self.NUMBERS
+
+        compiled = _compile(
+            self.lang,
+            self.ALPHABETS[self.lang],
+            self.__keyword,
+            self.__shift,
+            extra_symbols,
         )
-        logger.debug(f"trisemus_alphabet_table:\n{trisemus_alphabet_table_string}")
-        assert (
-            0 <= self.__shift < len(self.trisemus_alphabet_table)
-        ), f"shift must be ge 0 and lt {len(self.trisemus_alphabet_table)}"
+        self.trisemus_alphabet_table = [list(row) for row in compiled.table]
+        self.__encrypt = compiled.encrypt
+        self.__decrypt = compiled.decrypt
 
     def __repr__(self):
         return (
@@ -112,93 +247,88 @@ class TrisemusSubstitutionCipher(AbstractCipher):
                 return False, symbol
         return (True,)
 
-    def __generate_trisemus_table(self):
-        """
-        Генерирует таблицу Тритемия на основе алфавита.
-
-        :return: list[list[str]]
-        """
-        return [
-            list(self.__alphabet[i : i + self.__row_length])
-            for i in range(0, len(self.__alphabet), self.__row_length)
-        ]
-
-    def __find_position(self, char):
+    def encrypt(self, plaintext):
         """
-        Находит позицию символа в таблице Тритемия.
+        Шифрует переданный текст методом Тритемия.
 
-        :param char: str: Символ для поиска.
+        Текст приводится к нижнему регистру, символы '\\n' и '\\t'
+        удаляются; символ вне алфавита вызывает исключение.
 
-        :return: tuple[int, int] | None: Кортеж (row, col) - координаты символа в таблице.
+        :param plaintext: str: Текст для шифрования.
 
-        Если символ не найден, возвращается None.
+        :return: str: Зашифрованный текст.
         """
-        for row, row_chars in enumerate(self.trisemus_alphabet_table):
-            if char in row_chars:
-                col = row_chars.index(char)
-                return row, col
-        return None
+        return self.__encrypt(plaintext.lower())
 
-    def __update_position(self, row, col, shift):
+    def decrypt(self, cipher_text):
         """
-        Обновляет позицию символа в таблице Тритемия с учетом сдвига.
+        Дешифрует переданный зашифрованный текст методом Тритемия.
 
-        :param row: int: Начальная строка символа.
-        :param col: int: Начальный столбец символа.
-        :param shift: int: Сдвиг.
+        :param cipher_text: str: Зашифрованный текст.
 
-        :return: tuple[int, int]: Кортеж (new_row, new_col) - новые координаты символа.
+        :return: str: Расшифрованный текст.
         """
-        return (row + shift) % len(self.trisemus_alphabet_table), col
+        return self.__decrypt(cipher_text.lower())
 
-    def __process_message(
-        self, message: str, shift: int, action: Literal["encrypt", "decrypt"]
-    ):
+    @staticmethod
+    def __process_stream(
+        source: Iterable[str] | IO[str], translation: _Translation, chunk_size: int
+    ) -> Iterator[str]:
         """
-        Обрабатывает сообщение для шифрования или дешифрования.
+        Обрабатывает текст по частям.
 
-        :param message: str: Сообщение для обработки.
-        :param shift: int: Сдвиг для шифрования или дешифрования.
+        Символы заменяются независимо друг от друга, поэтому обработка по
+        частям дает тот же результат, что и обработка всего текста сразу.
 
-        :return: str: Обработанное сообщение.
-        """
-        message = message.lower().replace("\n", "").replace("\t", "")
-        processed_text = ""
-        for char in message:
-            if char == " ":
-                processed_text += char
-                continue
-            row, col = self.__find_position(char)
-            new_row, new_col = self.__update_position(row, col, shift)
-            processed_text += self.trisemus_alphabet_table[new_row][new_col]
-            logger.debug(
-                f"{action} '{char}'[{row}, {col}] -> '{self.trisemus_alphabet_table[new_row][new_col]}' [{new_row}, {new_col}]"
-            )
-        return processed_text
+        :param source: Iterable[str] | IO[str]: Части текста или текстовый файл.
+        :param translation: _Translation: Замена символов.
+        :param chunk_size: int: Количество символов, читаемых из файла за раз.
 
-    def encrypt(self, plaintext):
+        :return: Iterator[str]: Обработанные непустые части текста.
         """
-        Шифрует переданный текст методом Тритемия.
+        if isinstance(source, str):
+            chunks = iter((source,))
+        elif hasattr(source, "read"):
+            chunks = iter(lambda: source.read(chunk_size), "")
+        else:
+            chunks = iter(source)
+        for chunk in chunks:
+            processed = translation(chunk.lower())
+            if processed:
+                yield processed
+
+    def encrypt_stream(
+        self,
+        source: Iterable[str] | IO[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        """
+        Шифрует текст по частям, не загружая его в память целиком.
 
-        :param plaintext: str: Текст для шифрования.
+        Результат совпадает с 'encrypt' всего текста. При символе вне
+        алфавита исключение возникает на содержащей его части, когда
+        предыдущие части уже выданы.
 
-        :return: str: Зашифрованный текст.
+        :param source: Iterable[str] | IO[str]: Части текста или текстовый файл,
+            открытый для чтения.
+        :param chunk_size: int: Количество символов, читаемых из файла за раз.
+
+        :return: Iterator[str]: Зашифрованные части текста.
         """
-        check_result = self.is_symbols_in_alphabet(
-            text=plaintext, alphabet=self.__alphabet
-        )
-        if not check_result[0]:
-            raise Exception(
-                f"symbol '{check_result[1]}' not exist in {self.lang} alphabet"
-            )
-        return self.__process_message(plaintext, self.__shift, "encrypt")
+        return self.__process_stream(source, self.__encrypt, chunk_size)
 
-    def decrypt(self, cipher_text):
+    def decrypt_stream(
+        self,
+        source: Iterable[str] | IO[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[str]:
         """
-        Дешифрует переданный зашифрованный текст методом Тритемия.
+        Дешифрует текст по частям, не загружая его в память целиком.
 
-        :param cipher_text: str: Зашифрованный текст.
+        :param source: Iterable[str] | IO[str]: Части зашифрованного текста или
+            текстовый файл, открытый для чтения.
+        :param chunk_size: int: Количество символов, читаемых из файла за раз.
 
-        :return: str: Расшифрованный текст.
+        :return: Iterator[str]: Расшифрованные части текста.
         """
-        return self.__process_message(cipher_text, -self.__shift, "decrypt")
+        return self.__process_stream(source, self.__decrypt, chunk_size)
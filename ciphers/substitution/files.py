@@ -0,0 +1,89 @@
+import os
+import time
+from typing import Literal
+
+from loguru import logger
+
+from ciphers.substitution.algorithm import DEFAULT_CHUNK_SIZE
+from ciphers.substitution.algorithm import TrisemusSubstitutionCipher
+
+# Размер буферов чтения и записи файлов в байтах
+DEFAULT_BUFFER_SIZE: int = 8 * 1024 * 1024
+
+
+def _process_file(
+    src: str | os.PathLike,
+    dst: str | os.PathLike,
+    cipher: TrisemusSubstitutionCipher,
+    chunk_size: int,
+    encoding: str,
+    action: Literal["encrypt", "decrypt"],
+) -> int:
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise Exception("src and dst are the same file")
+    start = time.perf_counter()
+    size = 0
+    with open(
+        src, encoding=encoding, buffering=DEFAULT_BUFFER_SIZE
+    ) as src_file, open(
+        dst, "w", encoding=encoding, newline="", buffering=DEFAULT_BUFFER_SIZE
+    ) as dst_file:
+        if action == "encrypt":
+            chunks = cipher.encrypt_stream(src_file, chunk_size)
+        else:
+            chunks = cipher.decrypt_stream(src_file, chunk_size)
+        for chunk in chunks:
+            dst_file.write(chunk)
+            size += len(chunk)
+    seconds = time.perf_counter() - start
+    logger.info(
+        f"{action} {src} -> {dst}: {size} characters, {seconds:.3f} s, "
+        f"{os.path.getsize(src) / seconds / 1e6 if seconds else 0:.2f} MB/s"
+    )
+    return size
+
+
+def encrypt_file(
+    src: str | os.PathLike,
+    dst: str | os.PathLike,
+    cipher: TrisemusSubstitutionCipher,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+) -> int:
+    """
+    Шифрует текстовый файл методом Тритемия.
+
+    Файл читается и записывается частями через большие буферы, поэтому
+    его размер не ограничен объемом памяти. Результат совпадает с
+    'encrypt' всего текста файла (переводы строк удаляются).
+
+    :param src: str | os.PathLike: Путь к файлу с открытым текстом.
+    :param dst: str | os.PathLike: Путь к файлу шифртекста (создается или перезаписывается).
+    :param cipher: TrisemusSubstitutionCipher: Объект шифра.
+    :param chunk_size: int: Количество символов, обрабатываемых за раз.
+    :param encoding: str: Кодировка обоих файлов.
+
+    :return: int: Количество записанных символов.
+    """
+    return _process_file(src, dst, cipher, chunk_size, encoding, "encrypt")
+
+
+def decrypt_file(
+    src: str | os.PathLike,
+    dst: str | os.PathLike,
+    cipher: TrisemusSubstitutionCipher,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+) -> int:
+    """
+    Дешифрует текстовый файл, зашифрованный 'encrypt_file'.
+
+    :param src: str | os.PathLike: Путь к файлу шифртекста.
+    :param dst: str | os.PathLike: Путь к файлу открытого текста (создается или перезаписывается).
+    :param cipher: TrisemusSubstitutionCipher: Объект шифра.
+    :param chunk_size: int: Количество символов, обрабатываемых за раз.
+    :param encoding: str: Кодировка обоих файлов.
+
+    :return: int: Количество записанных символов.
+    """
+    return _process_file(src, dst, cipher, chunk_size, encoding, "decrypt")
@@ -0,0 +1,147 @@
+"""
+Tracing of intermediate cipher states.
+
+Tracing is off by default: the instrumented code paths only check that the
+module-level 'tracer' is None, so nothing is formatted or allocated. When
+enabled, every record is packed into a preallocated ring buffer of fixed
+size records; the oldest records are overwritten once it is full. The
+buffer is decoded and pretty-printed separately, on demand, with
+'read_records' and 'format_records'.
+
+Usage:
+    from ciphers import tracing
+
+    tracer = tracing.enable(capacity=1024)
+    cipher_obj.encrypt(data)
+    print(tracing.format_records(tracer.dump()))
+    tracing.disable()
+"""
+import struct
+import threading
+from typing import Iterator
+from typing import NamedTuple
+
+# Event codes
+BLOCK_IN = 0
+ROUND = 1
+BLOCK_OUT = 2
+GAMMA = 3
+MAC_CHAIN = 4
+
+EVENT_NAMES = ("block_in", "round", "block_out", "gamma", "mac_chain")
+
+# event, round (or step), width of the value in bytes, block index and the
+# value as two 64-bit words
+_RECORD = struct.Struct("<BBBxIQQ")
+_MASK_64 = (1 << 64) - 1
+
+# The active tracer, None when tracing is disabled
+tracer: "Tracer | None" = None
+
+
+class TraceRecord(NamedTuple):
+    event: str
+    step: int
+    index: int
+    value: bytes
+
+
+class Tracer:
+    """Bounded binary ring buffer of trace records."""
+
+    def __init__(self, capacity: int = 4096) -> None:
+        """
+        Args:
+            capacity: Maximum number of records kept.
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be ge 1, got {capacity}")
+        self.capacity = capacity
+        self._buffer = bytearray(capacity * _RECORD.size)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def __repr__(self):
+        return f"Tracer(capacity={self.capacity}, records={len(self)})"
+
+    def record(
+        self, event: int, value: int, index: int = 0, step: int = 0, width: int = 16
+    ) -> None:
+        """
+        Append a record, overwriting the oldest one if the buffer is full.
+
+        Args:
+            event: The event code (e.g. 'GAMMA').
+            value: The traced block as a big-endian integer.
+            index: Number of the block in the processed message.
+            step: Number of the round or of another step inside the block.
+            width: Size of the traced block in bytes (at most 16).
+        """
+        with self._lock:
+            offset = self._count % self.capacity * _RECORD.size
+            _RECORD.pack_into(
+                self._buffer,
+                offset,
+                event,
+                step & 0xFF,
+                width,
+                index & 0xFFFFFFFF,
+                (value >> 64) & _MASK_64,
+                value & _MASK_64,
+            )
+            self._count += 1
+
+    def dump(self) -> bytes:
+        """Return the records, oldest first, in the binary record format."""
+        with self._lock:
+            if self._count <= self.capacity:
+                return bytes(self._buffer[: self._count * _RECORD.size])
+            split = self._count % self.capacity * _RECORD.size
+            return bytes(self._buffer[split:] + self._buffer[:split])
+
+    def clear(self) -> None:
+        """Drop all records and zero the buffer."""
+        with self._lock:
+            self._buffer[:] = bytes(len(self._buffer))
+            self._count = 0
+
+
+def enable(capacity: int = 4096) -> Tracer:
+    """Start tracing into a new ring buffer and return it."""
+    global tracer
+    tracer = Tracer(capacity)
+    return tracer
+
+
+def disable() -> None:
+    """Stop tracing. The previously returned tracer keeps its records."""
+    global tracer
+    tracer = None
+
+
+def read_records(data: bytes) -> Iterator[TraceRecord]:
+    """
+    Decode records produced by 'Tracer.dump'.
+
+    Args:
+        data: The binary dump.
+    """
+    for event, step, width, index, value_hi, value_lo in _RECORD.iter_unpack(data):
+        value = (value_hi << 64 | value_lo).to_bytes(16, "big")[16 - width:]
+        yield TraceRecord(EVENT_NAMES[event], step, index, value)
+
+
+def format_records(data: bytes) -> str:
+    """
+    Pretty-print records produced by 'Tracer.dump', one per line.
+
+    Args:
+        data: The binary dump.
+    """
+    return "\n".join(
+        f"[block][{record.index}] {record.event:<9} {record.step:>2} {record.value.hex()}"
+        for record in read_records(data)
+    )
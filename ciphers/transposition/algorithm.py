@@ -19,6 +19,10 @@ class TranspositionCipher(AbstractCipher):
     def block_size(self):
         return self.__block_size
 
+    @property
+    def padding_str(self):
+        return self.__padding_str
+
     @staticmethod
     def prepare_text(text: str):
         result = (
@@ -1,11 +1,13 @@
 import json
+import os
+import sys
 import time
 import typing
 
 import flet as ft
 from loguru import logger
 
-from ciphers.block import gost_34_13_2015
+from ciphers import tracing
 from ciphers.block.gost_34_13_2015 import GOST_34_13_2015_GammaOutputFeedback
 from ciphers.substitution.algorithm import TrisemusSubstitutionCipher
 from ciphers.transposition.algorithm import TranspositionCipher
@@ -162,6 +164,7 @@ def block_cipher_controls(
     def bytearry_to_str(data: bytearray):
         return data.decode(errors="ignore")
 
+    tracer = tracing.enable()
     init_vect_str = "начальный вектор1"
     init_vect_bytearray = str_to_bytearray(init_vect_str)
     keyword_str = "секретный ключ 1234"
@@ -176,13 +179,13 @@ def block_cipher_controls(
     error_dlg = ft.AlertDialog(title=error_t, bgcolor=ft.colors.ON_ERROR)
 
     DEFAULT_MESSAGE = "секретный текст"
-    gost_34_13_2015_log_file_io = gost_34_13_2015.log_path.open("r")
 
     def fill_log_lv(e: ft.ControlEvent | None = None):
         log_lv.controls.clear()
-        data = gost_34_13_2015_log_file_io.readlines()
+        data = tracing.format_records(tracer.dump()).splitlines()
+        tracer.clear()
         for v in range(0, len(data), 100):
-            log_lv.controls.append(ft.Text("".join(data[v:v + 100])))
+            log_lv.controls.append(ft.Text("\n".join(data[v:v + 100])))
 
     def on_change(e):
         time.sleep(0.1)
@@ -408,4 +411,9 @@ def main(page: ft.Page):
 
 
 if __name__ == "__main__":
+    # Windowed builds (e.g. PyInstaller) run without a console
+    if sys.stdout is None:
+        sys.stdout = open(os.devnull, "w")
+    logger.remove()
+    logger.add(sys.stdout)
     ft.app(target=main, view=ft.AppView.FLET_APP)
@@ -0,0 +1,27 @@
+from benchmarks.suite import Case
+from benchmarks.suite import compare
+from benchmarks.suite import format_size
+from benchmarks.suite import parse_size
+from benchmarks.suite import run_case
+
+
+def test_run_case():
+    result = run_case(Case("bytes", 1 << 10, lambda: lambda: bytes(1 << 10)), 0.01, 1)
+    assert result["latency_us"] > 0
+    assert result["throughput_mb_s"] > 0
+    assert result["peak_kib"] >= 1
+
+
+def test_compare():
+    baseline = {"a": {"latency_us": 100.0}, "b": {"latency_us": 100.0}}
+    results = {
+        "a": {"latency_us": 109.0},
+        "b": {"latency_us": 111.0},
+        "c": {"latency_us": 1000.0},
+    }
+    assert compare(baseline, results, 0.1) == ["b"]
+
+
+def test_sizes():
+    for size in (16, 1 << 10, 64 << 10, 100 << 20):
+        assert parse_size(format_size(size)) == size
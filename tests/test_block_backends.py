@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+from ciphers.block import backends
+from ciphers.block.gost_34_12_2015 import GOST_34_12_2015_Kuznechik
+from ciphers.block.gost_34_12_2015 import GOST_34_12_2015_Magma
+from ciphers.block.gost_34_13_2015 import GOST_34_13_2015_Counter
+from ciphers.block.gost_34_13_2015 import GOST_34_13_2015_GammaOutputFeedback
+from ciphers.block.utils import GOSTCipherError
+
+KEY = bytearray(range(32))
+# Decryption vector of GOST R 34.12-2015
+KUZNECHIK_KEY = bytearray.fromhex(
+    "8899aabbccddeeff0011223344556677fedcba98765432100123456789abcdef"
+)
+PLAIN_BLOCK = bytearray.fromhex("1122334455667700ffeeddccbbaa9988")
+CIPHER_BLOCK = bytearray.fromhex("7f679d90bebc24305a468d42b9d4edcd")
+
+
+class BrokenKuznechik(GOST_34_12_2015_Kuznechik):
+    algorithm = "broken"
+
+
+def test_backends_calibration():
+    cipher_obj = GOST_34_12_2015_Magma(KEY)
+    selection = backends.calibrate(cipher_obj, "decrypt", repeat=1)
+    assert len(selection) == len(backends.BUCKETS)
+    assert "reference" not in selection
+    assert backends.select(cipher_obj, "decrypt", 10**6) == selection[-1]
+    assert backends.select(cipher_obj, "decrypt", 1) == selection[0]
+
+
+def test_backends_differential():
+    data = bytes(range(256)) * 20
+    expected = GOST_34_13_2015_Counter(KEY, bytearray(8)).encrypt(data)
+    check = backends.enable_differential(sample_rate=1.0, max_blocks=4, seed=1)
+    try:
+        for cipher_class in (GOST_34_12_2015_Kuznechik, GOST_34_12_2015_Magma):
+            cipher_obj = cipher_class(KEY)
+            blocks = np.frombuffer(data, dtype=np.uint8).reshape(-1, cipher_obj.block_size)
+            results = set()
+            for backend in ("table", "numpy", None):
+                cipher_obj.backend = backend
+                encrypted = cipher_obj.encrypt_blocks(blocks[:40])
+                decrypted = cipher_obj.decrypt_blocks(blocks[:40])
+                results.add((encrypted.tobytes(), decrypted.tobytes()))
+            assert len(results) == 1
+        assert GOST_34_13_2015_Counter(KEY, bytearray(8)).encrypt(data) == expected
+        init_vect = bytearray(range(16)) * 40
+        GOST_34_13_2015_GammaOutputFeedback(KEY, init_vect).encrypt(data)
+        assert check.checked >= 12
+    finally:
+        backends.disable_differential()
+
+
+def test_backends_differential_divergence():
+    backends.register("broken", backends.get_backend("kuznechik", "reference"))
+    backends.register("broken", backends.Backend("table", lambda _, data, __: data.copy()))
+    cipher_obj = BrokenKuznechik(KEY)
+    cipher_obj.backend = "table"
+    assert cipher_obj.encrypt_blocks(bytes(32)) == bytes(32)
+
+    backends.enable_differential(seed=1)
+    try:
+        with pytest.raises(GOSTCipherError, match="diverged"):
+            cipher_obj.encrypt_blocks(bytes(32))
+    finally:
+        backends.disable_differential()
+    cipher_obj.backend = "gostcrypto"
+    with pytest.raises(GOSTCipherError, match="unknown backend"):
+        cipher_obj.encrypt_blocks(bytes(32))
+
+
+def test_backends_gostcrypto():
+    pytest.importorskip("gostcrypto")
+    cipher_obj = GOST_34_12_2015_Kuznechik(KUZNECHIK_KEY)
+    cipher_obj.backend = "gostcrypto"
+    assert cipher_obj.decrypt_blocks(CIPHER_BLOCK * 3) == PLAIN_BLOCK * 3
+    with pytest.raises(GOSTCipherError, match="does not support encrypt"):
+        cipher_obj.encrypt_blocks(PLAIN_BLOCK)
+
+    # The encryption of this repository is not the inverse of the standard
+    # decryption, so the decryption is compared with the other backends
+    data = bytes(range(256)) * 4
+    expected = cipher_obj.decrypt_blocks(data)
+    for backend in ("reference", "table", "numpy"):
+        cipher_obj.backend = backend
+        assert cipher_obj.decrypt_blocks(data) == expected
+
+    cipher_obj.backend = None
+    check = backends.enable_differential(reference="gostcrypto")
+    try:
+        assert cipher_obj.decrypt_blocks(data) == expected
+        assert check.checked == 1
+    finally:
+        backends.disable_differential()
+
+
+def test_backends_optional_lazy(monkeypatch):
+    # The optional packages are looked up on the first use of the registry
+    monkeypatch.setattr(backends, "_optional_registered", False)
+    monkeypatch.setitem(
+        backends._registry, "kuznechik", dict(backends._registry["kuznechik"])
+    )
+    backends._registry["kuznechik"].pop("gostcrypto", None)
+    found = []
+    monkeypatch.setattr(
+        backends.importlib.util, "find_spec", lambda name: found.append(name)
+    )
+    backends.get_backends("magma")
+    backends.get_backend("kuznechik", "table")
+    assert found == ["gostcrypto"]
+    assert "gostcrypto" not in backends.get_backends("kuznechik")
@@ -0,0 +1,56 @@
+import pytest
+
+from ciphers.block import batch
+from ciphers.block.batch import OutputFeedbackPool
+from ciphers.block.gost_34_13_2015 import GOST_34_13_2015_GammaOutputFeedback
+from ciphers.block.utils import GOSTCipherError
+
+KEYS = {"first": bytearray(range(32)), 2: bytearray(range(32, 64))}
+
+
+def test_output_feedback_pool():
+    jobs = [
+        ("first" if i % 3 else 2, bytes([i]) * 16 * (1 + i % 2), bytes(range(i % 70)))
+        for i in range(50)
+    ]
+    with OutputFeedbackPool(KEYS, max_workers=2, chunk_size=4) as pool:
+        encrypted = list(pool.encrypt(iter(jobs)))
+        decrypted = list(
+            pool.decrypt(
+                (key_id, init_vect, data)
+                for (key_id, init_vect, _), data in zip(jobs, encrypted)
+            )
+        )
+        with pytest.raises(GOSTCipherError):
+            list(pool.encrypt([("unknown", bytes(16), b"data")]))
+
+    for (key_id, init_vect, data), result in zip(jobs, encrypted):
+        cipher_obj = GOST_34_13_2015_GammaOutputFeedback(KEYS[key_id], init_vect)
+        assert result == cipher_obj.encrypt(data)
+    assert decrypted == [data for _, _, data in jobs]
+    with pytest.raises(GOSTCipherError):
+        list(pool.encrypt(jobs))
+
+
+def test_output_feedback_pool_wipe():
+    pool = OutputFeedbackPool(KEYS, max_workers=1)
+    try:
+        # The initializer of a worker, run in this process
+        batch._init_worker(pool._shared.name, len(KEYS))
+        schedules = list(batch._worker_schedules.values())
+        assert len(schedules) == len(KEYS)
+        assert any(any(iter_key) for iter_key, _ in schedules)
+        batch._clear_worker()
+        assert not batch._worker_schedules
+        for iter_key, iter_key_reverse in schedules:
+            assert not any(iter_key) and not any(iter_key_reverse)
+        # The shared schedules are zeroed before the block is released
+        shared = pool._shared
+        contents = []
+        close = shared.close
+        shared.close = lambda: (contents.append(bytes(shared.buf)), close())
+    finally:
+        pool.close()
+    del shared.close
+    assert pool._shared is None
+    assert contents == [bytes(shared.size)]
@@ -1,6 +1,238 @@
+import os
+import pathlib
+from array import array
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
 from loguru import logger
 
+from ciphers.block.const import _L_BASIS_KUZNECHIK
+from ciphers.block.const import _L_REVERSE_BASIS_KUZNECHIK
+from ciphers.block.gost_34_12_2015 import GOST_34_12_2015_Kuznechik
+from ciphers.block.gost_34_12_2015 import GOST_34_12_2015_Magma
+from ciphers.block.gost_34_12_2015 import _CIPHER_C
+from ciphers.block.gost_34_12_2015 import _LS_TABLE
+from ciphers.block.gost_34_12_2015 import _substitute_nibbles
+from ciphers.block.gost_34_12_2015 import _transform
+from ciphers.block.gost_34_13_2015 import GOST_34_13_2015_Counter
 from ciphers.block.gost_34_13_2015 import GOST_34_13_2015_GammaOutputFeedback
+from ciphers.block.gost_34_13_2015 import GOST_34_13_2015_MAC
+from ciphers.block.key_cache import KeyScheduleCache
+from ciphers.block.utils import GOSTCipherError
+from ciphers.block.utils import add_xor
+from ciphers.block.utils import _XOR_INT_SIZE
+from ciphers.block.utils import int_to_bytearray
+from ciphers.block.utils import xor_into
+from ciphers.block.utils import zero_fill
+
+# fmt: off
+KEY = bytearray([
+    0x88, 0x99, 0xaa, 0xbb, 0xcc, 0xdd, 0xee, 0xff, 0x00, 0x11, 0x22, 0x33, 0x44, 0x55, 0x66, 0x77,
+    0xfe, 0xdc, 0xba, 0x98, 0x76, 0x54, 0x32, 0x10, 0x01, 0x23, 0x45, 0x67, 0x89, 0xab, 0xcd, 0xef,
+])
+PLAIN_BLOCK = bytearray.fromhex("1122334455667700ffeeddccbbaa9988")
+CIPHER_BLOCK = bytearray.fromhex("7f679d90bebc24305a468d42b9d4edcd")
+# Test vectors of the 'magma' algorithm from GOST R 34.12-2015 and 34.13-2015
+MAGMA_KEY = bytearray.fromhex(
+    "ffeeddccbbaa99887766554433221100f0f1f2f3f4f5f6f7f8f9fafbfcfdfeff"
+)
+MAGMA_PLAIN_TEXT = bytearray.fromhex(
+    "92def06b3c130a59db54c704f8189d204a98fb2e67a8024c8912409b17b57e41"
+)
+# fmt: on
+
+
+def reference_encrypt(cipher_obj: GOST_34_12_2015_Kuznechik, block: bytearray):
+    iter_key = [
+        int_to_bytearray(key, 16)
+        for key in cipher_obj._round_keys(cipher_obj._cipher_iter_key)
+    ]
+    for i in range(9):
+        block = add_xor(iter_key[i], block)
+        block = GOST_34_12_2015_Kuznechik._cipher_s(block)
+        block = GOST_34_12_2015_Kuznechik._cipher_l(block)
+        block = add_xor(iter_key[9], block)
+    return block
+
+
+def test_gost34122015_table_engine():
+    cipher_obj = GOST_34_12_2015_Kuznechik(KEY)
+    for i in range(32):
+        block = bytearray((PLAIN_BLOCK[j] * (i + 1) + j) % 256 for j in range(16))
+        assert cipher_obj.encrypt(block) == reference_encrypt(cipher_obj, block)
+    assert cipher_obj.decrypt(CIPHER_BLOCK) == PLAIN_BLOCK
+
+
+def test_gost34122015_iter_constants():
+    for i in range(1, 33):
+        internal = bytearray(16)
+        internal[15] = i
+        reference = GOST_34_12_2015_Kuznechik._cipher_l(internal)
+        assert int_to_bytearray(_CIPHER_C[i - 1], 16) == reference
+
+
+def test_gost34122015_linear_basis():
+    for pos in range(16):
+        for bit in range(8):
+            internal = bytearray(16)
+            internal[pos] = 1 << bit
+            begin = (pos * 8 + bit) * 16
+            assert _L_BASIS_KUZNECHIK[begin: begin + 16] == (
+                GOST_34_12_2015_Kuznechik._cipher_l(internal)
+            )
+            assert _L_REVERSE_BASIS_KUZNECHIK[begin: begin + 16] == (
+                GOST_34_12_2015_Kuznechik._cipher_l_reverse(internal)
+            )
+
+
+def test_gost34132015_import_is_lazy():
+    code = (
+        "import sys\n"
+        "import ciphers.block.gost_34_13_2015 as mode\n"
+        "import ciphers.block.gost_34_12_2015 as cipher\n"
+        "assert 'numpy' not in sys.modules\n"
+        "assert '_LS_TABLE' not in vars(cipher)\n"
+        "cipher.GOST_34_12_2015_Kuznechik(bytearray(32))\n"
+        "assert '_LS_TABLE' in vars(cipher)\n"
+        "assert '_MAGMA_TABLE' not in vars(cipher)\n"
+    )
+    root = pathlib.Path(__file__).parents[1]
+    env = dict(os.environ, PYTHONPATH=str(root))
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=root, env=env)
+
+
+def test_gost34122015_int_api():
+    cipher_obj = GOST_34_12_2015_Kuznechik(KEY)
+    block = int.from_bytes(PLAIN_BLOCK, "big")
+    encrypted = cipher_obj.encrypt_int(block)
+    assert encrypted.to_bytes(16, "big") == cipher_obj.encrypt(PLAIN_BLOCK)
+    assert cipher_obj.decrypt_int(int.from_bytes(CIPHER_BLOCK, "big")) == block
+
+
+def test_gost34122015_clear():
+    for cipher_class in (GOST_34_12_2015_Kuznechik, GOST_34_12_2015_Magma):
+        cipher_obj = cipher_class(KEY)
+        assert not hasattr(cipher_obj, "__dict__")
+        iter_key = cipher_obj._cipher_iter_key
+        iter_key_reverse = cipher_obj._cipher_iter_key_reverse
+        words = memoryview(iter_key)
+        assert any(words)
+        cipher_obj.clear()
+        # The buffers of the round keys are zeroed in place, not replaced
+        assert cipher_obj._cipher_iter_key is iter_key
+        assert cipher_obj._cipher_iter_key_reverse is iter_key_reverse
+        assert not any(words) and not any(iter_key_reverse)
+        words.release()
+    mode_obj = GOST_34_13_2015_GammaOutputFeedback(KEY, bytearray(32))
+    assert not hasattr(mode_obj, "__dict__")
+    mode_obj.lane_threshold = 2
+    mode_obj.clear()
+    assert not any(mode_obj._cipher_obj._cipher_iter_key)
+
+
+def test_gost34122015_encrypt_blocks():
+    cipher_obj = GOST_34_12_2015_Kuznechik(KEY)
+    blocks = np.arange(200 * 16, dtype=np.uint32).astype(np.uint8).reshape(200, 16)
+    data = blocks.tobytes()
+    for backend in ("reference", "table", "numpy"):
+        cipher_obj.backend = backend
+        encrypted = cipher_obj.encrypt_blocks(blocks)
+        for i in range(len(blocks)):
+            assert encrypted[i].tobytes() == cipher_obj.encrypt(data[i * 16: i * 16 + 16])
+        assert cipher_obj.encrypt_blocks(data) == encrypted.tobytes()
+        assert cipher_obj.decrypt_blocks(CIPHER_BLOCK * 100) == PLAIN_BLOCK * 100
+
+
+def test_gost34122015_magma():
+    for value, expected in (
+        (0xFDB97531, 0x2A196F34),
+        (0x2A196F34, 0xEBD9F03A),
+        (0xEBD9F03A, 0xB039BB3D),
+        (0xB039BB3D, 0x68695433),
+    ):
+        assert _substitute_nibbles(value) == expected
+
+    cipher_obj = GOST_34_12_2015_Magma(MAGMA_KEY)
+    plain_block = bytearray.fromhex("fedcba9876543210")
+    cipher_block = bytearray.fromhex("4ee901e5c2d8ca3d")
+    assert cipher_obj.block_size == 8
+    assert cipher_obj.encrypt(plain_block) == cipher_block
+    assert cipher_obj.decrypt(cipher_block) == plain_block
+
+    data = bytes(range(256)) * 4
+    for backend in ("reference", "table", "numpy"):
+        cipher_obj.backend = backend
+        for num_blocks in (3, 128):
+            blocks = data[: num_blocks * 8]
+            encrypted = cipher_obj.encrypt_blocks(blocks)
+            assert encrypted == b"".join(
+                cipher_obj.encrypt(blocks[i: i + 8]) for i in range(0, len(blocks), 8)
+            )
+            assert cipher_obj.decrypt_blocks(encrypted) == blocks
+
+    key_cache = KeyScheduleCache()
+    GOST_34_12_2015_Kuznechik(MAGMA_KEY, key_cache)
+    cipher_obj = GOST_34_12_2015_Magma(MAGMA_KEY, key_cache)
+    assert len(key_cache) == 2
+    assert cipher_obj.encrypt(plain_block) == cipher_block
+
+
+def test_gost34132015_magma_modes():
+    cipher_obj = GOST_34_13_2015_GammaOutputFeedback(
+        GOST_34_12_2015_Magma(MAGMA_KEY),
+        bytearray.fromhex("1234567890abcdef234567890abcdef1"),
+    )
+    assert cipher_obj.encrypt(MAGMA_PLAIN_TEXT) == bytearray.fromhex(
+        "db37e0e266903c830d46644c1f9a089ca0f83062430e327ec824efb8bd4fdb05"
+    )
+    cipher_obj = GOST_34_13_2015_Counter(
+        GOST_34_12_2015_Magma(MAGMA_KEY), bytearray.fromhex("12345678")
+    )
+    assert cipher_obj.encrypt(MAGMA_PLAIN_TEXT) == bytearray.fromhex(
+        "4e98110c97b7b93c3e250d93d6e85d69136d868807b2dbef568eb680ab52a12d"
+    )
+    mac_obj = GOST_34_13_2015_MAC(
+        GOST_34_12_2015_Magma(MAGMA_KEY), MAGMA_PLAIN_TEXT, mac_size=4
+    )
+    assert mac_obj.hexdigest() == "154e7210"
+
+    init_vect = bytearray(range(8)) * 40
+    data = bytes(range(256)) * 3 + b"tail"
+    scalar_obj = GOST_34_13_2015_GammaOutputFeedback(
+        GOST_34_12_2015_Magma(MAGMA_KEY), init_vect
+    )
+    scalar_obj.lane_threshold = 10**6
+    lanes_obj = GOST_34_13_2015_GammaOutputFeedback(
+        GOST_34_12_2015_Magma(MAGMA_KEY), init_vect
+    )
+    assert lanes_obj.encrypt(data) == scalar_obj.encrypt(data)
+
+
+def test_xor_into():
+    for size in (0, 1, 16, _XOR_INT_SIZE, _XOR_INT_SIZE + 1, 100000):
+        op_a = bytes(i * 7 % 256 for i in range(size))
+        op_b = bytes(i * 13 % 256 for i in range(size + 3))
+        expected = bytes(a ^ b for a, b in zip(op_a, op_b))
+        out = bytearray(size + 5)
+        xor_into(op_a, op_b, out)
+        assert out == expected + bytes(5)
+        assert add_xor(op_a, op_b) == expected
+        in_place = bytearray(op_a)
+        xor_into(in_place, op_b, in_place)
+        assert in_place == expected
+
+
+def test_zero_fill():
+    value = bytearray(KEY)
+    assert zero_fill(value) is value
+    assert value == bytes(len(KEY))
+    assert zero_fill(bytes(KEY)) == bytearray(len(KEY))
+    for value in (array("Q", range(1, 21)), np.arange(1, 33, dtype=np.uint8)):
+        assert zero_fill(value) is value
+        assert not any(value)
 
 
 def test_gost34132015ofb():
@@ -63,3 +295,175 @@ def test_gost34132015ofb():
     logger.info(f"decrypted_data: {decrypted_data}")
     logger.info(f"decrypted_text: {decrypted_text}")
     assert plain_text == decrypted_text
+
+
+def test_gost34132015ctr():
+    init_vect = bytearray([0x12, 0x34, 0x56, 0x78, 0x90, 0xAB, 0xCE, 0xF0])
+    data = bytes(range(256)) * 10 + b"tail"
+    block_cipher = GOST_34_12_2015_Kuznechik(KEY)
+    counter = int.from_bytes(init_vect, "big") << 64
+    expected = bytearray()
+    for i in range(0, len(data), 16):
+        gamma = block_cipher.encrypt(int_to_bytearray(counter + i // 16, 16))
+        expected += add_xor(gamma, data[i: i + 16])
+
+    cipher_obj = GOST_34_13_2015_Counter(KEY, init_vect)
+    assert cipher_obj.encrypt(data) == expected
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        cipher_obj = GOST_34_13_2015_Counter(KEY, init_vect, executor=executor)
+        cipher_obj.batch_blocks = 16
+        assert cipher_obj.encrypt(data) == expected
+    cipher_obj = GOST_34_13_2015_Counter(KEY, init_vect)
+    assert cipher_obj.decrypt(expected) == data
+
+    # The gamma of an incomplete block is carried over to the next call
+    for chunk_size in (1, 10, 17, 100):
+        cipher_obj = GOST_34_13_2015_Counter(KEY, init_vect)
+        cipher_obj.batch_blocks = 3
+        result = bytearray()
+        for i in range(0, len(data), chunk_size):
+            result += cipher_obj.encrypt(data[i: i + chunk_size])
+        assert result == expected
+
+
+def test_gost34132015mac(monkeypatch):
+    # The example of GOST R 34.13-2015 (A.1.6) assumes the standard round
+    # structure, without the extra addition of k_9 in every round
+    def standard_encrypt_int(self, block):
+        iter_key = self._round_keys(self._cipher_iter_key)
+        for i in range(9):
+            block = _transform(block ^ iter_key[i], _LS_TABLE)
+        return block ^ iter_key[9]
+
+    data = bytes.fromhex(
+        "1122334455667700ffeeddccbbaa9988"
+        "00112233445566778899aabbcceeff0a"
+        "112233445566778899aabbcceeff0a00"
+        "2233445566778899aabbcceeff0a0011"
+    )
+    with monkeypatch.context() as patch:
+        patch.setattr(GOST_34_12_2015_Kuznechik, "encrypt_int", standard_encrypt_int)
+        for step in (1, 7, 16, 17, len(data)):
+            mac_obj = GOST_34_13_2015_MAC(KEY, mac_size=8)
+            for i in range(0, len(data), step):
+                mac_obj.update(data[i: i + step])
+            assert mac_obj.hexdigest() == "336f4d296059fbe3"
+            assert mac_obj.verify(bytes.fromhex("336f4d296059fbe3"))
+
+
+def test_gost34132015ofb_encrypt_and_mac():
+    init_vect = bytearray(range(32))
+    data = bytes(range(256)) * 3 + b"tail"
+    expected = GOST_34_13_2015_GammaOutputFeedback(KEY, init_vect).encrypt(data)
+    expected_mac = GOST_34_13_2015_MAC(KEY, expected).digest()
+
+    mac_obj = GOST_34_13_2015_MAC(KEY)
+    cipher_obj = GOST_34_13_2015_GammaOutputFeedback(KEY, init_vect)
+    assert cipher_obj.encrypt_and_mac(data, mac_obj) == expected
+    assert mac_obj.digest() == expected_mac
+
+    mac_obj = GOST_34_13_2015_MAC(KEY)
+    cipher_obj = GOST_34_13_2015_GammaOutputFeedback(KEY, init_vect)
+    assert cipher_obj.decrypt_and_mac(expected, mac_obj) == data
+    assert mac_obj.verify(expected_mac)
+    assert not mac_obj.verify(bytes(len(expected_mac)))
+
+
+def test_gost34132015ofb_prefetch():
+    init_vect = bytearray(range(48))
+    cipher_obj = GOST_34_13_2015_GammaOutputFeedback(KEY, init_vect)
+    prefetch_obj = GOST_34_13_2015_GammaOutputFeedback(KEY, init_vect, prefetch=4)
+    for size in (5, 100, 16, 0, 333):
+        data = bytes(range(256))[:size] * 2
+        assert prefetch_obj.encrypt(data) == cipher_obj.encrypt(data)
+        assert prefetch_obj.iv == cipher_obj.iv
+    prefetcher = prefetch_obj.prefetcher
+    assert prefetcher.stalls >= 0 and prefetcher.depth == 4
+    prefetch_obj.clear()
+    assert not prefetcher._thread.is_alive()
+
+
+def test_gost34132015ofb_update():
+    init_vect = bytearray(range(48))
+    data = bytes(range(256)) * 3 + b"tail"
+    expected = GOST_34_13_2015_GammaOutputFeedback(KEY, init_vect).encrypt(data)
+    for chunk_size in (1, 5, 16, 17, 100, len(data)):
+        cipher_obj = GOST_34_13_2015_GammaOutputFeedback(KEY, init_vect)
+        result = bytearray()
+        for i in range(0, len(data), chunk_size):
+            result += cipher_obj.update(data[i: i + chunk_size])
+        result += cipher_obj.finalize()
+        assert result == expected
+
+    # The one-shot methods would reuse the partly used gamma block of a
+    # stream that ends inside a block
+    cipher_obj = GOST_34_13_2015_GammaOutputFeedback(KEY, init_vect)
+    mac_obj = GOST_34_13_2015_MAC(KEY)
+    first = cipher_obj.update(data[:10])
+    for method, args in (
+        (cipher_obj.encrypt, (data[10:],)),
+        (cipher_obj.decrypt, (data[10:],)),
+        (cipher_obj.encrypt_and_mac, (data[10:], mac_obj)),
+        (cipher_obj.decrypt_and_mac, (data[10:], mac_obj)),
+    ):
+        with pytest.raises(GOSTCipherError, match="finalize"):
+            method(*args)
+    assert first + cipher_obj.update(data[10:]) == expected
+    cipher_obj = GOST_34_13_2015_GammaOutputFeedback(KEY, init_vect)
+    cipher_obj.update(data[:32])
+    cipher_obj.finalize()
+    assert cipher_obj.encrypt(data[32:]) == expected[32:]
+
+
+def test_gost34132015ofb_lanes():
+    data = bytes(range(256)) * 5 + b"tail"
+    for num_lanes in (2, 17, 40):
+        init_vect = bytearray(range(16)) * num_lanes
+        scalar_obj = GOST_34_13_2015_GammaOutputFeedback(KEY, init_vect)
+        scalar_obj.lane_threshold = 10**6
+        lanes_obj = GOST_34_13_2015_GammaOutputFeedback(KEY, init_vect)
+        lanes_obj.lane_threshold = 2
+        for chunk in (data[:100], data[100:], data):
+            assert lanes_obj.update(chunk) == scalar_obj.update(chunk)
+            assert lanes_obj.iv == scalar_obj.iv
+
+    jobs = [(bytearray(range(i, i + 16 * (i % 3 + 1))), data[: i * 37]) for i in range(9)]
+    expected = [
+        GOST_34_13_2015_GammaOutputFeedback(KEY, init_vect).encrypt(payload)
+        for init_vect, payload in jobs
+    ]
+    assert GOST_34_13_2015_GammaOutputFeedback.encrypt_many(KEY, jobs) == expected
+    assert GOST_34_13_2015_GammaOutputFeedback.decrypt_many(
+        KEY, [(init_vect, payload) for (init_vect, _), payload in zip(jobs, expected)]
+    ) == [payload for _, payload in jobs]
+
+    # A cipher object passed in stays usable: it is not cleared
+    cipher_obj = GOST_34_12_2015_Kuznechik(KEY)
+    block = cipher_obj.encrypt(bytearray(16))
+    assert GOST_34_13_2015_GammaOutputFeedback.encrypt_many(cipher_obj, jobs) == expected
+    assert cipher_obj.encrypt(bytearray(16)) == block
+
+
+def test_gost34132015_encrypt_into():
+    init_vect = bytearray(range(48))
+    data = bytes(range(256)) * 3 + b"tail"
+    expected = GOST_34_13_2015_GammaOutputFeedback(KEY, init_vect).encrypt(data)
+
+    cipher_obj = GOST_34_13_2015_GammaOutputFeedback(KEY, init_vect)
+    cipher_obj.window_blocks = 3
+    buffer = bytearray(data)
+    for i in range(0, len(buffer), 100):
+        chunk = memoryview(buffer)[i: i + 100]
+        assert cipher_obj.encrypt_into(chunk, chunk) == len(chunk)
+    assert buffer == expected
+
+    result = np.zeros(len(data), dtype=np.uint8)
+    cipher_obj = GOST_34_13_2015_GammaOutputFeedback(KEY, init_vect)
+    cipher_obj.decrypt_into(np.frombuffer(expected, dtype=np.uint8), result)
+    assert result.tobytes() == data
+
+    init_vect = bytearray(8)
+    expected = GOST_34_13_2015_Counter(KEY, init_vect).encrypt(data)
+    buffer = bytearray(data)
+    GOST_34_13_2015_Counter(KEY, init_vect).encrypt_into(buffer, buffer)
+    assert buffer == expected
@@ -0,0 +1,42 @@
+import pytest
+
+from ciphers.block import files
+from ciphers.block.files import decrypt_file
+from ciphers.block.files import encrypt_file
+from ciphers.block.gost_34_13_2015 import GOST_34_13_2015_GammaOutputFeedback
+
+KEY = bytearray(range(32))
+INIT_VECT = bytearray(range(100, 132))
+
+
+def test_encrypt_decrypt_file(tmp_path):
+    for size in (0, 15, 16 * 64, 16 * 64 + 7):
+        data = bytes(range(256)) * (size // 256 + 1)
+        data = data[:size]
+        src = tmp_path / "plain.bin"
+        src.write_bytes(data)
+        encrypted = tmp_path / "encrypted.bin"
+        decrypted = tmp_path / "decrypted.bin"
+
+        result = encrypt_file(src, encrypted, KEY, INIT_VECT, window_size=16 * 5)
+        assert result.size == size
+        expected = GOST_34_13_2015_GammaOutputFeedback(KEY, INIT_VECT).encrypt(data)
+        assert encrypted.read_bytes() == expected
+
+        decrypt_file(encrypted, decrypted, KEY, INIT_VECT, window_size=16 * 5)
+        assert decrypted.read_bytes() == data
+
+
+def test_encrypt_file_failure_clears_keys(tmp_path, monkeypatch):
+    created = []
+
+    class RecordingOFB(GOST_34_13_2015_GammaOutputFeedback):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self)
+
+    monkeypatch.setattr(files, "GOST_34_13_2015_GammaOutputFeedback", RecordingOFB)
+    with pytest.raises(FileNotFoundError):
+        encrypt_file(tmp_path / "missing.bin", tmp_path / "out.bin", KEY, INIT_VECT)
+    (cipher_obj,) = created
+    assert not any(memoryview(cipher_obj._cipher_obj._cipher_iter_key))
@@ -0,0 +1,59 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ciphers.block.gost_34_13_2015 import GOST_34_13_2015_GammaOutputFeedback
+from ciphers.block.streams import decrypt_stream
+from ciphers.block.streams import encrypt_stream
+from ciphers.block.utils import GOSTCipherError
+
+KEY = bytearray(range(32))
+INIT_VECT = bytearray(range(100, 132))
+
+
+async def pipe(data: bytes, process, **kwargs) -> bytes:
+    """Send 'data' through 'process' over a TCP connection."""
+    received = bytearray()
+    done = asyncio.Event()
+
+    async def handle(reader, writer):
+        received.extend(await reader.read())
+        writer.close()
+        done.set()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        _, writer = await asyncio.open_connection("127.0.0.1", port)
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        cipher_obj = GOST_34_13_2015_GammaOutputFeedback(KEY, INIT_VECT)
+        assert await process(reader, writer, cipher_obj, **kwargs) == len(data)
+        writer.close()
+        await writer.wait_closed()
+        await done.wait()
+    return bytes(received)
+
+
+def test_encrypt_decrypt_stream():
+    data = bytes(range(256)) * 40 + b"tail"
+    expected = GOST_34_13_2015_GammaOutputFeedback(KEY, INIT_VECT).encrypt(data)
+    with ThreadPoolExecutor(2) as executor:
+        encrypted = asyncio.run(
+            pipe(data, encrypt_stream, chunk_size=1000, executor=executor)
+        )
+    assert encrypted == expected
+    assert asyncio.run(pipe(encrypted, decrypt_stream, max_pending=1)) == data
+    assert asyncio.run(pipe(b"", encrypt_stream)) == b""
+
+
+def test_encrypt_stream_process_executor():
+    # The state of the cipher object cannot be shared with other processes
+    with ProcessPoolExecutor(2) as executor:
+        with pytest.raises(GOSTCipherError, match="ThreadPoolExecutor"):
+            asyncio.run(
+                pipe(bytes(4096), encrypt_stream, chunk_size=1024, executor=executor)
+            )
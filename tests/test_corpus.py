@@ -0,0 +1,45 @@
+import pytest
+
+from ciphers.corpus import CipherConfig
+from ciphers.corpus import CorpusPool
+from ciphers.substitution.algorithm import TrisemusSubstitutionCipher
+from ciphers.transposition.algorithm import TranspositionCipher
+
+CONFIGS = {
+    "trisemus": CipherConfig(TrisemusSubstitutionCipher, {"keyword": "ключ", "shift": 2}),
+    "transposition": CipherConfig(TranspositionCipher, {"block_size": 7}),
+    3: CipherConfig(TranspositionCipher),
+}
+TEXT = "Съешь же ещё этих мягких французских булок, да выпей чаю.\n"
+
+
+def test_corpus_pool():
+    documents = [
+        (config_id, TEXT * (i % 5) + TEXT[: i % len(TEXT)])
+        for i in range(60)
+        for config_id in CONFIGS
+    ]
+    ciphers = {config_id: config.build() for config_id, config in CONFIGS.items()}
+    # Documents longer than 'shard_size' are split between the workers
+    with CorpusPool(CONFIGS, max_workers=2, chunk_size=5, shard_size=50) as pool:
+        encrypted = list(pool.encrypt(iter(documents)))
+        decrypted = list(
+            pool.decrypt(
+                (config_id, text)
+                for (config_id, _), text in zip(documents, encrypted)
+            )
+        )
+        with pytest.raises(KeyError):
+            list(pool.encrypt([("unknown", TEXT)]))
+        stats = pool.stats
+        pool.report()
+
+    for (config_id, text), result in zip(documents, encrypted):
+        assert result == ciphers[config_id].encrypt(text)
+    for (config_id, _), text, result in zip(documents, encrypted, decrypted):
+        assert result == ciphers[config_id].decrypt(text)
+    assert 1 <= len(stats) <= 2
+    assert sum(worker.characters for worker in stats.values()) > 0
+    assert all(worker.throughput > 0 for worker in stats.values())
+    with pytest.raises(RuntimeError):
+        list(pool.encrypt(documents))
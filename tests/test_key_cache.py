@@ -0,0 +1,30 @@
+from ciphers.block.gost_34_12_2015 import GOST_34_12_2015_Kuznechik
+from ciphers.block.gost_34_13_2015 import GOST_34_13_2015_GammaOutputFeedback
+from ciphers.block.key_cache import KeyScheduleCache
+
+
+def test_key_schedule_cache():
+    key_cache = KeyScheduleCache(maxsize=2)
+    keys = [bytearray([i]) * 32 for i in range(3)]
+    init_vect = bytearray(range(16))
+    data = bytearray(range(100))
+
+    expected = GOST_34_13_2015_GammaOutputFeedback(keys[0], init_vect).encrypt(data)
+    for _ in range(3):
+        cipher_obj = GOST_34_13_2015_GammaOutputFeedback(
+            keys[0], init_vect, key_cache=key_cache
+        )
+        assert cipher_obj.encrypt(data) == expected
+        cipher_obj.clear()
+    assert (key_cache.hits, key_cache.misses) == (2, 1)
+    assert bytes(keys[0]) not in key_cache._entries
+
+    evicted = next(iter(key_cache._entries.values()))
+    kept_obj = GOST_34_12_2015_Kuznechik(keys[0], key_cache)
+    GOST_34_12_2015_Kuznechik(keys[1], key_cache)
+    GOST_34_12_2015_Kuznechik(keys[2], key_cache)
+    assert len(key_cache) == 2
+    assert not any(any(iter_key) for iter_key in evicted)
+    # The cipher objects hold copies, which the eviction leaves intact
+    block = bytearray(range(16))
+    assert kept_obj.encrypt(block) == GOST_34_12_2015_Kuznechik(keys[0]).encrypt(block)
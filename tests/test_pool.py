@@ -0,0 +1,25 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ciphers.pool import map_bounded
+
+
+def test_map_bounded():
+    taken = []
+
+    def items():
+        for i in range(20):
+            taken.append(i)
+            yield i
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = map_bounded(executor, lambda x: x * x, items(), 4)
+        for i, result in enumerate(results):
+            assert result == i * i
+            # The input is consumed at most 'max_pending' items ahead
+            assert len(taken) <= i + 4
+        assert len(taken) == 20
+
+        with pytest.raises(ValueError):
+            list(map_bounded(executor, abs, [1], 0))
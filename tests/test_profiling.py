@@ -0,0 +1,62 @@
+from ciphers import profiling
+from ciphers.block.gost_34_12_2015 import GOST_34_12_2015_Kuznechik
+from ciphers.block.gost_34_13_2015 import GOST_34_13_2015_GammaOutputFeedback
+
+KEY = bytearray(range(32))
+INIT_VECT = bytearray(range(16))
+BLOCK = bytearray(range(16, 32))
+
+
+def test_profiling_kuznechik():
+    assert profiling.profiler is None
+    cipher_obj = GOST_34_12_2015_Kuznechik(KEY)
+    encrypted = cipher_obj.encrypt(BLOCK)
+    decrypted = cipher_obj.decrypt(BLOCK)
+
+    profiler = profiling.enable()
+    try:
+        cipher_obj = GOST_34_12_2015_Kuznechik(KEY)
+        assert cipher_obj.encrypt(BLOCK) == encrypted
+        assert cipher_obj.decrypt(BLOCK) == decrypted
+    finally:
+        profiling.disable()
+
+    stats = profiler.as_dict()
+    assert stats["kuznechik.key_schedule"]["calls"] == 1
+    assert stats["kuznechik.encrypt;X"]["calls"] == 18
+    assert stats["kuznechik.encrypt;S"]["calls"] == 9
+    assert stats["kuznechik.decrypt;L"]["calls"] == 9
+    assert stats["kuznechik.encrypt"]["ns"] >= sum(
+        stats[f"kuznechik.encrypt;{stage}"]["ns"] for stage in "XSL"
+    )
+
+
+def test_profiling_ofb(tmp_path):
+    data = bytes(100)
+    expected = GOST_34_13_2015_GammaOutputFeedback(KEY, INIT_VECT).encrypt(data)
+
+    profiler = profiling.enable()
+    try:
+        cipher_obj = GOST_34_13_2015_GammaOutputFeedback(KEY, INIT_VECT)
+        assert cipher_obj.encrypt(data) == expected
+        result = bytearray(len(data))
+        cipher_obj = GOST_34_13_2015_GammaOutputFeedback(KEY, INIT_VECT)
+        cipher_obj.encrypt_into(data, result)
+        assert result == expected
+    finally:
+        profiling.disable()
+
+    stats = profiler.as_dict()
+    # Six whole blocks and the gamma of the incomplete last block per call
+    assert stats["ofb.gamma"]["calls"] == 14
+    assert stats["ofb.shift_iv"]["calls"] == 12
+    assert stats["ofb.xor"]["calls"] == 2
+    assert stats["ofb.gamma;kuznechik.encrypt;S"]["calls"] == 14 * 9
+    assert not any(stack.startswith("kuznechik.encrypt") for stack in stats)
+
+    profiler.write_collapsed(tmp_path / "ofb.folded")
+    lines = (tmp_path / "ofb.folded").read_text().splitlines()
+    assert "ofb.gamma;kuznechik.encrypt;L" in [line.rsplit(" ", 1)[0] for line in lines]
+    assert all(int(line.rsplit(" ", 1)[1]) >= 0 for line in lines)
+    profiler.clear()
+    assert profiler.as_dict() == {}
@@ -1,3 +1,4 @@
+import io
 import sys
 from typing import Literal
 
@@ -34,3 +35,58 @@ def test_encrypt_decrypt(lang: Literal["ru", "en"], keyword: str):
     logger.debug(f"Encrypted Text:\n{encrypted_text}\n")
     logger.debug(f"Decrypted Text:\n{decrypted_text}\n")
     assert plaintext.lower() == decrypted_text.lower()
+
+
+def test_invalid_symbol():
+    trisemus_cipher = TrisemusSubstitutionCipher(lang="en", keyword="key")
+    for text in ("hello мир", "hello\x00", "hello ω"):
+        with pytest.raises(Exception, match="not exist in en alphabet"):
+            trisemus_cipher.encrypt(text)
+    without_punctuation = TrisemusSubstitutionCipher(
+        lang="en", keyword="key", use_punctiation=False
+    )
+    with pytest.raises(Exception, match="symbol ' ' not exist"):
+        without_punctuation.encrypt("hello world")
+    assert without_punctuation.decrypt("hello world").count(" ") == 1
+
+
+def test_normalization_and_cache():
+    trisemus_cipher = TrisemusSubstitutionCipher(lang="ru", keyword="ключ", shift=2)
+    assert trisemus_cipher.encrypt("При\nвет, \tМИР!") == trisemus_cipher.encrypt(
+        "привет, мир!"
+    )
+    table = trisemus_cipher.trisemus_alphabet_table
+    expected = ""
+    for char in "привет, мир!":
+        if char == " ":
+            expected += char
+            continue
+        row = next(i for i, row_chars in enumerate(table) if char in row_chars)
+        expected += table[(row + 2) % len(table)][table[row].index(char)]
+    assert trisemus_cipher.encrypt("привет, мир!") == expected
+
+    # The same configuration reuses the compiled tables
+    same_cipher = TrisemusSubstitutionCipher(lang="ru", keyword="Ключ", shift=2)
+    assert same_cipher.trisemus_alphabet_table == table
+    assert same_cipher.trisemus_alphabet_table is not table
+    assert same_cipher.decrypt(expected) == trisemus_cipher.decrypt(expected)
+
+
+def test_encrypt_decrypt_stream():
+    trisemus_cipher = TrisemusSubstitutionCipher(lang="ru", keyword="ключ")
+    text = (TEXT["ru"] + "\n\t") * 10
+    expected = trisemus_cipher.encrypt(text)
+    for size in (1, 7, 100, len(text)):
+        chunks = [text[i : i + size] for i in range(0, len(text), size)]
+        assert "".join(trisemus_cipher.encrypt_stream(chunks)) == expected
+        assert "".join(trisemus_cipher.encrypt_stream(io.StringIO(text), size)) == expected
+        assert "".join(
+            trisemus_cipher.decrypt_stream(io.StringIO(expected), size)
+        ) == trisemus_cipher.decrypt(expected)
+    assert "".join(trisemus_cipher.encrypt_stream(text)) == expected
+    assert list(trisemus_cipher.encrypt_stream(["\n", "", "\t"])) == []
+
+    stream = trisemus_cipher.encrypt_stream(["привет", "hello"])
+    assert next(stream) == trisemus_cipher.encrypt("привет")
+    with pytest.raises(Exception, match="symbol 'h' not exist in ru alphabet"):
+        next(stream)
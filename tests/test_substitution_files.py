@@ -0,0 +1,30 @@
+import pytest
+
+from ciphers.substitution.algorithm import TrisemusSubstitutionCipher
+from ciphers.substitution.files import decrypt_file
+from ciphers.substitution.files import encrypt_file
+
+TEXT = "Съешь же ещё этих мягких французских булок,\r\nда выпей чаю 1234.\n"
+
+
+def test_encrypt_decrypt_file(tmp_path):
+    trisemus_cipher = TrisemusSubstitutionCipher(keyword="республика")
+    for count in (0, 1, 1000):
+        src = tmp_path / "plain.txt"
+        src.write_bytes((TEXT * count).encode())
+        encrypted = tmp_path / "encrypted.txt"
+        decrypted = tmp_path / "decrypted.txt"
+
+        expected = trisemus_cipher.encrypt((TEXT * count).replace("\r", ""))
+        assert encrypt_file(src, encrypted, trisemus_cipher, chunk_size=100) == len(
+            expected
+        )
+        assert encrypted.read_text(encoding="utf-8") == expected
+
+        decrypt_file(encrypted, decrypted, trisemus_cipher, chunk_size=100)
+        assert decrypted.read_text(encoding="utf-8") == trisemus_cipher.decrypt(
+            expected
+        )
+
+    with pytest.raises(Exception, match="same file"):
+        encrypt_file(src, src, trisemus_cipher)
@@ -0,0 +1,37 @@
+from ciphers import tracing
+from ciphers.block.gost_34_13_2015 import GOST_34_13_2015_GammaOutputFeedback
+
+KEY = bytearray(range(32))
+INIT_VECT = bytearray(range(16))
+
+
+def test_tracing():
+    assert tracing.tracer is None
+    data = bytes(40)
+    expected = GOST_34_13_2015_GammaOutputFeedback(KEY, INIT_VECT).encrypt(data)
+
+    tracer = tracing.enable(capacity=1000)
+    try:
+        encrypted = GOST_34_13_2015_GammaOutputFeedback(KEY, INIT_VECT).encrypt(data)
+    finally:
+        tracing.disable()
+    assert encrypted == expected
+
+    records = list(tracing.read_records(tracer.dump()))
+    gamma = [record for record in records if record.event == "gamma"]
+    rounds = [record for record in records if record.event == "round"]
+    assert [record.index for record in gamma] == [0, 1, 2]
+    assert gamma[0].value == bytes(a ^ b for a, b in zip(encrypted, data))[:16]
+    assert len(rounds) == 9 * 3
+    assert rounds[8].value == gamma[0].value
+    assert tracing.format_records(tracer.dump()).count("\n") == len(records) - 1
+
+    tracer = tracing.Tracer(capacity=4)
+    for i in range(10):
+        tracer.record(tracing.GAMMA, i, index=i)
+    assert [record.index for record in tracing.read_records(tracer.dump())] == [
+        6,
+        7,
+        8,
+        9,
+    ]